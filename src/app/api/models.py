@@ -15,6 +15,12 @@ PASSWORD_SPECIAL_CHARS = set(string.punctuation)
 # Unicode-aware, so accented and international names (e.g. "José García") are valid.
 NAME_EXTRA_CHARS = set(" .'-")
 
+# Password character-class checks, compiled once for both password validators.
+_LOWERCASE_RE = re.compile(r"[a-z]")
+_UPPERCASE_RE = re.compile(r"[A-Z]")
+_DIGIT_RE = re.compile(r"\d")
+_RESET_SPECIAL_RE = re.compile(r"[@$!%*?&]")
+
 
 class UserRegistrationRequest(BaseModel):
     email: EmailStr
@@ -29,11 +35,11 @@ class UserRegistrationRequest(BaseModel):
     def validate_password(cls, v):
         if len(v) < 8:
             raise ValueError("Password must be at least 8 characters long")
-        if not re.search(r"[a-z]", v):
+        if not _LOWERCASE_RE.search(v):
             raise ValueError("Password must contain at least one lowercase letter")
-        if not re.search(r"[A-Z]", v):
+        if not _UPPERCASE_RE.search(v):
             raise ValueError("Password must contain at least one uppercase letter")
-        if not re.search(r"\d", v):
+        if not _DIGIT_RE.search(v):
             raise ValueError("Password must contain at least one digit")
         if not any(c in PASSWORD_SPECIAL_CHARS for c in v):
             raise ValueError("Password must contain at least one special character")
@@ -73,13 +79,13 @@ class ResetPasswordRequest(BaseModel):
     def validate_new_password(cls, v):
         if len(v) < 8:
             raise ValueError("Password must be at least 8 characters long")
-        if not re.search(r"[a-z]", v):
+        if not _LOWERCASE_RE.search(v):
             raise ValueError("Password must contain at least one lowercase letter")
-        if not re.search(r"[A-Z]", v):
+        if not _UPPERCASE_RE.search(v):
             raise ValueError("Password must contain at least one uppercase letter")
-        if not re.search(r"\d", v):
+        if not _DIGIT_RE.search(v):
             raise ValueError("Password must contain at least one digit")
-        if not re.search(r"[@$!%*?&]", v):
+        if not _RESET_SPECIAL_RE.search(v):
             raise ValueError("Password must contain at least one special character")
         return v
 
@@ -33,6 +33,10 @@ setup_logging()
 logger = logging.getLogger("app.handler")
 
 
+# Set OPENAPI_URL to an empty string to skip the schema and docs routes
+# entirely (the test suite does, since nothing there reads them).
+_openapi_url = os.getenv("OPENAPI_URL", "/openapi.json") or None
+
 app = FastAPI(
     title="Mirror Collective Python API",
     version="1.0.0",
@@ -69,7 +73,7 @@ app = FastAPI(
     debug=os.getenv("DEBUG", "false").lower() == "true",
     docs_url="/docs",
     redoc_url="/redoc",
-    openapi_url="/openapi.json",
+    openapi_url=_openapi_url,
 )
 
 # Setup CORS
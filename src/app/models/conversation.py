@@ -2,14 +2,14 @@
 Conversation models for persistent chat history management
 """
 
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass, fields
 from datetime import datetime, timezone
 from decimal import Decimal
 from typing import Any, Dict, List, Literal, Optional
 from uuid import uuid4
 
 
-@dataclass
+@dataclass(slots=True)
 class ConversationMessage:
     """Individual message in a conversation"""
 
@@ -50,9 +50,14 @@ class ConversationMessage:
 
     def to_dynamodb_item(self) -> Dict[str, Any]:
         """Convert to DynamoDB item format"""
-        item = asdict(self)
+        # Shallow field walk instead of asdict(): the item goes straight to
+        # put_item, so deep-copying the nested signal dicts buys nothing.
         # Remove None values to keep DynamoDB items clean
-        return {k: v for k, v in item.items() if v is not None}
+        return {
+            f.name: value
+            for f in fields(self)
+            if (value := getattr(self, f.name)) is not None
+        }
 
     @classmethod
     def from_dynamodb_item(cls, item: Dict[str, Any]) -> "ConversationMessage":
@@ -213,7 +218,7 @@ def key_themes_to_items(themes: Optional[List[KeyTheme]]) -> List[Dict[str, str]
     return [t.to_dict() for t in (themes or [])]
 
 
-@dataclass
+@dataclass(slots=True)
 class Conversation:
     """Conversation metadata and management"""
 
@@ -256,7 +261,9 @@ class Conversation:
 
     def to_dynamodb_item(self) -> Dict[str, Any]:
         """Convert to DynamoDB item format"""
-        item = asdict(self)
+        item = {f.name: getattr(self, f.name) for f in fields(self)}
+        if self.key_themes is not None:
+            item["key_themes"] = key_themes_to_items(self.key_themes)
         # Remove None values and empty lists
         return {k: v for k, v in item.items() if v is not None and v != []}
 
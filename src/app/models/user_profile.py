@@ -2,7 +2,7 @@
 User profile models for DynamoDB persistence
 """
 
-from dataclasses import asdict, dataclass
+from dataclasses import asdict, dataclass, fields
 from datetime import datetime, timezone
 from decimal import Decimal
 from enum import Enum
@@ -23,7 +23,7 @@ class UserStatus(Enum):
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class UserProfile:
     """
     User profile model that syncs with Cognito and stores additional app data
@@ -121,24 +121,24 @@ class UserProfile:
 
     def to_dynamodb_item(self) -> Dict[str, Any]:
         """Convert to DynamoDB item format"""
-        item = asdict(self)
-        item["status"] = self.status.value  # Convert enum to string
-
+        # The item shares preferences and the notification list with this
+        # profile rather than copying them; treat it as read-only.
         # Filter out None values and empty strings for indexed fields
-        filtered_item = {}
-        for k, v in item.items():
+        item: Dict[str, Any] = {}
+        for f in fields(self):
+            v = getattr(self, f.name)
             if v is None:
                 continue  # Skip None values
-            if k == "email" and (not v or not v.strip()):
-                continue  # Skip empty email values to avoid index errors
             if isinstance(v, float):
-                filtered_item[k] = Decimal(
-                    str(v)
-                )  # DynamoDB requires Decimal not float
+                item[f.name] = Decimal(str(v))  # DynamoDB requires Decimal not float
             else:
-                filtered_item[k] = v
+                item[f.name] = v
+
+        item["status"] = self.status.value  # Convert enum to string
+        if not self.email or not self.email.strip():
+            item.pop("email", None)  # Skip empty email values to avoid index errors
 
-        return filtered_item
+        return item
 
     @classmethod
     def from_dynamodb_item(cls, item: Dict[str, Any]) -> "UserProfile":
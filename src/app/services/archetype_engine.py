@@ -3,15 +3,281 @@ Core archetype detection and symbolic analysis engine
 Implements the 5-signal analysis system for MirrorGPT
 """
 
+import copy
 import logging
 import re
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
-
+from functools import lru_cache
+from typing import (
+    Any,
+    Dict,
+    Final,
+    FrozenSet,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from ..core.exceptions import ConfigLoadError
 from ..utils.archetype_data import ArchetypeDefinitions
 
 logger = logging.getLogger(__name__)
 
+# Distinct messages whose history-independent signals (1-3) each engine keeps.
+# Short openers ("hi", "thank you") recur across users and the /analyze route
+# re-submits text the chat path has already seen.
+_MESSAGE_SIGNALS_CACHE_SIZE = 256
+
+
+def _compile_word_alternation(words: Iterable[str]) -> "re.Pattern[str]":
+    """Compile ``words`` into one whole-word alternation.
+
+    A single ``finditer``/``findall`` pass over the message then reports every
+    word present, instead of one ``re.search`` per word. Longer alternatives
+    come first so a word is never shadowed by one of its own prefixes.
+    """
+    alternation = "|".join(
+        re.escape(word) for word in sorted(set(words), key=len, reverse=True)
+    )
+    return re.compile(rf"\b(?:{alternation})\b")
+
+
+_WORD_TOKEN: Final["re.Pattern[str]"] = re.compile(r"\w+")
+
+
+# Keyword patterns compiled once at import; the analysis helpers below lower
+# the message once and run these against it. Several motif patterns share
+# words ("betray", "enough"), so each keeps its own pattern rather than being
+# folded into a single alternation that could only report one motif per word.
+_METAPHOR_PATTERNS: Final[Dict[str, "re.Pattern[str]"]] = {
+    "simile": re.compile(
+        r"\b(like|as if|reminds me of|feels like|seems like|appears to be)\b"
+    ),
+    "metaphor": re.compile(
+        r"\b(is|are|becomes?|transforms? into|turns? into)\b.*"
+        r"\b(symbol|represents?|embodies|means)\b"
+    ),
+    "symbolic": re.compile(
+        r"\b(symbolic|symbolizes|represents|stands for|signifies)\b"
+    ),
+    "archetypal": re.compile(r"\b(archetype|pattern|theme|motif|recurring)\b"),
+}
+
+_SYMBOLIC_PHRASE_PATTERNS: Final[Tuple["re.Pattern[str]", ...]] = tuple(
+    re.compile(pattern)
+    for pattern in (
+        r"\b(crossing|stepping through|walking into|entering) the \w+\b",
+        r"\b(burning|breaking|shattering|dissolving) the \w+\b",
+        r"\b(finding|discovering|uncovering|revealing) the \w+\b",
+        r"\b(building|creating|weaving|crafting) the \w+\b",
+        r"\b(mirror|reflection|shadow|echo) of \w+\b",
+    )
+)
+
+_MOTIF_PATTERNS: Final[Dict[str, "re.Pattern[str]"]] = {
+    motif: re.compile(pattern)
+    for motif, pattern in {
+        "abandonment": (r"\b(abandon|left|alone|desert|reject|isolat|forsak|betray)\b"),
+        "betrayal": (
+            r"\b(betray|trust|lie|deceiv|cheat|broken promise|"
+            r"dishonest|unfaithful)\b"
+        ),
+        "perfectionism": (
+            r"\b(perfect|flawless|never enough|not good enough|"
+            r"mistake|failure|inadequate)\b"
+        ),
+        "control": (
+            r"\b(control|manage|organize|plan|predict|certain|" r"manipulat|dominat)\b"
+        ),
+        "approval": (
+            r"\b(approval|accept|like me|love me|validate|"
+            r"recognition|praise|acknowledgment)\b"
+        ),
+        "scarcity": (
+            r"\b(not enough|lack|scarce|limited|running out|"
+            r"shortage|insufficient)\b"
+        ),
+        "worthiness": (
+            r"\b(worthy|deserve|enough|valuable|matter|important|"
+            r"significant|valued)\b"
+        ),
+        "safety": r"\b(safe|secure|protected|danger|threat|risk|vulnerable|harm)\b",
+        "freedom": (
+            r"\b(free|escape|trapped|cage|liberat|independ|autonomous|choice)\b"
+        ),
+        "belonging": (
+            r"\b(belong|fit in|outsider|different|home|family|" r"community|included)\b"
+        ),
+        "power": (
+            r"\b(power|strength|weak|helpless|capable|competent|" r"agency|influence)\b"
+        ),
+        "identity": (
+            r"\b(who am i|identity|self|authentic|real me|true self|persona)\b"
+        ),
+    }.items()
+}
+
+
+# Keyword tables for labelled ``\b(alt|alt|...)\b`` alternations (Signal 3
+# archetype language, Signal 4 journey phase and stage). Each pattern is split
+# once: single words go into a table looked up per ``\w+`` token of the
+# message, multi-word phrases keep a small regex, and a pattern the split could
+# not count exactly keeps its own compiled regex.
+_KEYWORD_ALTERNATION_SHAPE: Final["re.Pattern[str]"] = re.compile(
+    r"\\b\(([a-z]+(?: [a-z]+)*(?:\|[a-z]+(?: [a-z]+)*)*)\)\\b"
+)
+
+
+class _KeywordLabels(NamedTuple):
+    """Labels in pattern order with their word table and residual regexes"""
+
+    labels: Tuple[str, ...]
+    words: Dict[str, Tuple[str, ...]]
+    patterns: Tuple[Tuple[str, "re.Pattern[str]"], ...]
+
+
+def _compile_keyword_labels(patterns: Iterable[Tuple[str, str]]) -> _KeywordLabels:
+    """Build a keyword table from ``(label, pattern)`` pairs.
+
+    A label may carry several patterns. Counting a message's tokens in the
+    word table and adding the residual regexes' matches gives exactly
+    ``len(re.findall(pattern, text))`` summed over each label's patterns. A
+    pattern that fails to compile raises ``ConfigLoadError``.
+    """
+    labels: Dict[str, None] = {}
+    words: Dict[str, List[str]] = {}
+    residual: List[Tuple[str, "re.Pattern[str]"]] = []
+    for label, pattern in patterns:
+        labels[label] = None
+        try:
+            compiled = re.compile(pattern)
+        except re.error as exc:
+            raise ConfigLoadError(
+                f"Keyword pattern for '{label}' is invalid {pattern!r}: {exc}"
+            ) from exc
+        shape = _KEYWORD_ALTERNATION_SHAPE.fullmatch(pattern)
+        if shape is None:
+            residual.append((label, compiled))
+            continue
+        alternatives = set(shape.group(1).split("|"))
+        multi_word = {alt for alt in alternatives if " " in alt}
+        single_word = alternatives - multi_word
+        if any(word in single_word for alt in multi_word for word in alt.split()):
+            # A phrase would also be counted through its own single word
+            residual.append((label, compiled))
+            continue
+        for word in single_word:
+            words.setdefault(word, []).append(label)
+        if multi_word:
+            residual.append((label, _compile_word_alternation(multi_word)))
+    return _KeywordLabels(
+        tuple(labels),
+        {word: tuple(word_labels) for word, word_labels in words.items()},
+        tuple(residual),
+    )
+
+
+def _count_keyword_labels(
+    keywords: _KeywordLabels, tokens: List[str], lowered: str
+) -> Dict[str, int]:
+    """Matches per label, in label order"""
+    counts = dict.fromkeys(keywords.labels, 0)
+    for token in tokens:
+        for label in keywords.words.get(token, ()):
+            counts[label] += 1
+    for label, pattern in keywords.patterns:
+        counts[label] += len(pattern.findall(lowered))
+    return counts
+
+
+def _strongest_keyword_label(
+    keywords: _KeywordLabels, tokens: List[str], lowered: str
+) -> Tuple[str, float]:
+    """Label with the most matches and its count; the earlier label wins ties"""
+    strongest = "unknown"
+    highest: float = 0.0
+    for label, count in _count_keyword_labels(keywords, tokens, lowered).items():
+        if count > highest:
+            highest = count
+            strongest = label
+    return strongest, highest
+
+
+# Hero's journey phases with enhanced patterns
+_HERO_JOURNEY_KEYWORDS: Final[_KeywordLabels] = _compile_keyword_labels(
+    {
+        "ordinary_world": (
+            r"\b(normal|routine|everyday|usual|regular|stable|" r"comfortable)\b"
+        ),
+        "call_to_adventure": (
+            r"\b(call|calling|invitation|opportunity|chance|beginning|"
+            r"stirring|awakening)\b"
+        ),
+        "refusal_of_call": (
+            r"\b(hesitat|resist|afraid|doubt|uncertain|not ready|" r"avoiding|denial)\b"
+        ),
+        "meeting_mentor": (
+            r"\b(guide|teacher|mentor|wisdom|guidance|help|support|" r"advice)\b"
+        ),
+        "crossing_threshold": (
+            r"\b(step|cross|enter|begin|start|commit|decide|leap|" r"threshold)\b"
+        ),
+        "tests_allies_enemies": (
+            r"\b(challenge|test|friend|enemy|obstacle|support|help|" r"ally|opponent)\b"
+        ),
+        "approach_inmost_cave": (
+            r"\b(deep|core|heart|center|fear|confront|face|prepare|" r"gather)\b"
+        ),
+        "ordeal": (
+            r"\b(crisis|death|loss|breakdown|rock bottom|darkest|trial|" r"suffering)\b"
+        ),
+        "reward": (
+            r"\b(gift|treasure|wisdom|insight|breakthrough|victory|"
+            r"achievement|realization)\b"
+        ),
+        "road_back": (
+            r"\b(return|integrate|apply|share|teach|give back|" r"journey home)\b"
+        ),
+        "resurrection": (
+            r"\b(rebirth|transform|new|different|reborn|emerge|" r"phoenix|renewal)\b"
+        ),
+        "return_with_elixir": (
+            r"\b(wisdom|healing|help others|serve|mastery|gift|" r"medicine|teaching)\b"
+        ),
+    }.items()
+)
+
+# Narrative stages with enhanced detection
+_NARRATIVE_STAGE_KEYWORDS: Final[_KeywordLabels] = _compile_keyword_labels(
+    {
+        "beginning": (
+            r"\b(start|begin|new|first|initial|opening|origin|" r"inception|dawn)\b"
+        ),
+        "middle": (
+            r"\b(middle|during|process|journey|path|struggle|work|"
+            r"development|unfolding)\b"
+        ),
+        "climax": (
+            r"\b(climax|peak|crisis|turning point|breakthrough|moment|"
+            r"crescendo|culmination)\b"
+        ),
+        "resolution": (
+            r"\b(end|finish|complete|resolve|closure|peace|done|"
+            r"conclusion|fulfillment)\b"
+        ),
+    }.items()
+)
+
+# Any of these words marks a transformation
+_TRANSFORMATION_WORDS: Final[FrozenSet[str]] = frozenset(
+    "transform change shift evolve grow become emerge metamorphosis "
+    "different new rebirth phoenix butterfly chrysalis caterpillar "
+    "breakthrough awakening realization enlightenment epiphany".split()
+)
+
 
 class ArchetypeEngine:
     """Core archetype detection and symbolic analysis engine"""
@@ -19,9 +285,20 @@ class ArchetypeEngine:
     def __init__(self):
         self.archetypes = ArchetypeDefinitions.get_all_archetypes()
         self.symbol_library = ArchetypeDefinitions.get_symbol_library()
+        self._symbol_pattern = _compile_word_alternation(
+            symbol for symbols in self.symbol_library.values() for symbol in symbols
+        )
+        self._language_keywords = _compile_keyword_labels(
+            (name, pattern)
+            for name, data in self.archetypes.items()
+            for pattern in data["language_patterns"]
+        )
         self.archetype_relationships = (
             ArchetypeDefinitions.get_archetype_relationships()
         )
+        self._cached_message_signals = lru_cache(maxsize=_MESSAGE_SIGNALS_CACHE_SIZE)(
+            self._analyze_message_signals
+        )
 
     def analyze_message(
         self,
@@ -33,16 +310,40 @@ class ArchetypeEngine:
         Complete message analysis for archetype detection
         Returns all 5 signals + archetype classification
         """
+        return self._analyze(
+            message, user_history, context_signals, datetime.utcnow().isoformat()
+        )
 
-        # Signal 1: Emotional Resonance Analysis
-        emotional_resonance = self._analyze_emotional_resonance(message)
+    def analyze_batch(
+        self,
+        messages: Sequence[str],
+        user_history: Optional[List[Dict]] = None,
+        context_signals: Optional[Dict] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Analyze several messages against the same history and context
+        Returns one analyze_message result per message, in order; the batch
+        shares a single timestamp and repeated texts share signals 1-3
+        """
+        timestamp = datetime.utcnow().isoformat()
+        return [
+            self._analyze(message, user_history, context_signals, timestamp)
+            for message in messages
+        ]
 
-        # Signal 2: Symbolic Language Extraction
-        symbolic_language = self._extract_symbolic_language(message)
+    def _analyze(
+        self,
+        message: str,
+        user_history: Optional[List[Dict]],
+        context_signals: Optional[Dict],
+        timestamp: str,
+    ) -> Dict[str, Any]:
+        """All 5 signals for one message, stamped with ``timestamp``"""
 
-        # Signal 3: Archetype Pattern Detection
-        archetype_analysis = self._detect_archetype_patterns(
-            message, emotional_resonance, symbolic_language
+        # Signals 1-3 depend on the message text alone, so they are memoized;
+        # the copy keeps callers from mutating the cached result
+        emotional_resonance, symbolic_language, archetype_analysis = copy.deepcopy(
+            self._cached_message_signals(message)
         )
 
         # Signal 4: Narrative Position Analysis
@@ -59,9 +360,27 @@ class ArchetypeEngine:
             "signal_5_motif_loops": motif_loops,
             "primary_archetype": archetype_analysis["primary"],
             "confidence_score": archetype_analysis["confidence"],
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": timestamp,
         }
 
+    def _analyze_message_signals(
+        self, message: str
+    ) -> Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]:
+        """Signals 1-3, which depend only on the message text"""
+
+        # Signal 1: Emotional Resonance Analysis
+        emotional_resonance = self._analyze_emotional_resonance(message)
+
+        # Signal 2: Symbolic Language Extraction
+        symbolic_language = self._extract_symbolic_language(message)
+
+        # Signal 3: Archetype Pattern Detection
+        archetype_analysis = self._detect_archetype_patterns(
+            message, emotional_resonance, symbolic_language
+        )
+
+        return emotional_resonance, symbolic_language, archetype_analysis
+
     def _analyze_emotional_resonance(self, message: str) -> Dict[str, Any]:
         """Signal 1: Emotional resonance analysis"""
 
@@ -207,48 +526,20 @@ class ArchetypeEngine:
         metaphor_types = []
         symbol_categories = {}
 
-        # Check each symbol category
+        # Find every library symbol in one case-insensitive whole-word scan,
+        # then walk the library so the output keeps its category order
+        lowered = message.lower()
+        present = set(self._symbol_pattern.findall(lowered))
         for category, symbols in self.symbol_library.items():
-            category_matches = []
-            for symbol in symbols:
-                # Use word boundaries and case-insensitive matching
-                pattern = rf"\b{re.escape(symbol)}\b"
-                if re.search(pattern, message.lower()):
-                    extracted_symbols.append(symbol)
-                    category_matches.append(symbol)
-
+            category_matches = [symbol for symbol in symbols if symbol in present]
             if category_matches:
+                extracted_symbols.extend(category_matches)
                 symbol_categories[category] = category_matches
 
         # Detect metaphorical language patterns
-        metaphor_indicators = [
-            {
-                "type": "simile",
-                "pattern": (
-                    r"\b(like|as if|reminds me of|feels like|seems like|"
-                    r"appears to be)\b"
-                ),
-            },
-            {
-                "type": "metaphor",
-                "pattern": (
-                    r"\b(is|are|becomes?|transforms? into|turns? into)\b.*"
-                    r"\b(symbol|represents?|embodies|means)\b"
-                ),
-            },
-            {
-                "type": "symbolic",
-                "pattern": r"\b(symbolic|symbolizes|represents|stands for|signifies)\b",
-            },
-            {
-                "type": "archetypal",
-                "pattern": r"\b(archetype|pattern|theme|motif|recurring)\b",
-            },
-        ]
-
-        for indicator in metaphor_indicators:
-            if re.search(indicator["pattern"], message.lower()):
-                metaphor_types.append(indicator["type"])
+        for metaphor_type, pattern in _METAPHOR_PATTERNS.items():
+            if pattern.search(lowered):
+                metaphor_types.append(metaphor_type)
 
         # Advanced symbolic pattern detection
         symbolic_phrases = self._detect_symbolic_phrases(message)
@@ -269,18 +560,9 @@ class ArchetypeEngine:
         """Detect complex symbolic expressions"""
         symbolic_phrases = []
 
-        # Common symbolic constructions
-        patterns = [
-            r"\b(crossing|stepping through|walking into|entering) the \w+\b",
-            r"\b(burning|breaking|shattering|dissolving) the \w+\b",
-            r"\b(finding|discovering|uncovering|revealing) the \w+\b",
-            r"\b(building|creating|weaving|crafting) the \w+\b",
-            r"\b(mirror|reflection|shadow|echo) of \w+\b",
-        ]
-
-        for pattern in patterns:
-            matches = re.findall(pattern, message.lower())
-            symbolic_phrases.extend(matches)
+        lowered = message.lower()
+        for pattern in _SYMBOLIC_PHRASE_PATTERNS:
+            symbolic_phrases.extend(pattern.findall(lowered))
 
         return symbolic_phrases[:5]  # Limit to most relevant
 
@@ -290,12 +572,16 @@ class ArchetypeEngine:
         """Signal 3: Archetype pattern detection with enhanced scoring"""
 
         archetype_scores: Dict[str, Dict[str, Any]] = {}
+        lowered = message.lower()
+        language_matches = self._count_language_matches(lowered)
 
         for archetype_name, archetype_data in self.archetypes.items():
             # Scoring components
             symbol_results = self._score_symbols(archetype_data, symbolic_language)
             emotion_results = self._score_emotions(archetype_data, emotional_resonance)
-            language_results = self._score_language(archetype_data, message)
+            language_results = self._score_language(
+                archetype_data, language_matches[archetype_name]
+            )
 
             score_sum = symbol_results["score"] + emotion_results["score"]
             score_sum += language_results["score"]
@@ -387,12 +673,18 @@ class ArchetypeEngine:
             "details": {"score": matches, "matched": matched},
         }
 
-    def _score_language(self, archetype_data: Dict, message: str) -> Dict:
-        """Calculate language pattern match score (30% weight)"""
-        matches = 0
-        for pattern in archetype_data["language_patterns"]:
-            matches += len(re.findall(pattern, message.lower()))
+    def _count_language_matches(self, lowered: str) -> Dict[str, int]:
+        """Language pattern matches per archetype from one pass over the tokens"""
+        matches = dict.fromkeys(self.archetypes, 0)
+        matches.update(
+            _count_keyword_labels(
+                self._language_keywords, _WORD_TOKEN.findall(lowered), lowered
+            )
+        )
+        return matches
 
+    def _score_language(self, archetype_data: Dict, matches: int) -> Dict:
+        """Calculate language pattern match score (30% weight)"""
         score = 0.0
         if archetype_data["language_patterns"]:
             score = min(matches / len(archetype_data["language_patterns"]), 1) * 0.3
@@ -407,102 +699,21 @@ class ArchetypeEngine:
     ) -> Dict[str, Any]:
         """Signal 4: Narrative position analysis"""
 
-        # Hero's journey phases with enhanced patterns
-        hero_journey_patterns = {
-            "ordinary_world": (
-                r"\b(normal|routine|everyday|usual|regular|stable|" r"comfortable)\b"
-            ),
-            "call_to_adventure": (
-                r"\b(call|calling|invitation|opportunity|chance|beginning|"
-                r"stirring|awakening)\b"
-            ),
-            "refusal_of_call": (
-                r"\b(hesitat|resist|afraid|doubt|uncertain|not ready|"
-                r"avoiding|denial)\b"
-            ),
-            "meeting_mentor": (
-                r"\b(guide|teacher|mentor|wisdom|guidance|help|support|" r"advice)\b"
-            ),
-            "crossing_threshold": (
-                r"\b(step|cross|enter|begin|start|commit|decide|leap|" r"threshold)\b"
-            ),
-            "tests_allies_enemies": (
-                r"\b(challenge|test|friend|enemy|obstacle|support|help|"
-                r"ally|opponent)\b"
-            ),
-            "approach_inmost_cave": (
-                r"\b(deep|core|heart|center|fear|confront|face|prepare|" r"gather)\b"
-            ),
-            "ordeal": (
-                r"\b(crisis|death|loss|breakdown|rock bottom|darkest|trial|"
-                r"suffering)\b"
-            ),
-            "reward": (
-                r"\b(gift|treasure|wisdom|insight|breakthrough|victory|"
-                r"achievement|realization)\b"
-            ),
-            "road_back": (
-                r"\b(return|integrate|apply|share|teach|give back|" r"journey home)\b"
-            ),
-            "resurrection": (
-                r"\b(rebirth|transform|new|different|reborn|emerge|"
-                r"phoenix|renewal)\b"
-            ),
-            "return_with_elixir": (
-                r"\b(wisdom|healing|help others|serve|mastery|gift|"
-                r"medicine|teaching)\b"
-            ),
-        }
-
-        # Narrative stages with enhanced detection
-        narrative_stages = {
-            "beginning": (
-                r"\b(start|begin|new|first|initial|opening|origin|" r"inception|dawn)\b"
-            ),
-            "middle": (
-                r"\b(middle|during|process|journey|path|struggle|work|"
-                r"development|unfolding)\b"
-            ),
-            "climax": (
-                r"\b(climax|peak|crisis|turning point|breakthrough|moment|"
-                r"crescendo|culmination)\b"
-            ),
-            "resolution": (
-                r"\b(end|finish|complete|resolve|closure|peace|done|"
-                r"conclusion|fulfillment)\b"
-            ),
-        }
+        lowered = message.lower()
+        tokens = _WORD_TOKEN.findall(lowered)
 
         # Detect journey phase
-        detected_journey_phase = "unknown"
-        highest_journey_score: float = 0.0
-
-        for phase, pattern in hero_journey_patterns.items():
-            matches = len(re.findall(pattern, message.lower()))
-            if matches > highest_journey_score:
-                highest_journey_score = matches
-                detected_journey_phase = phase
+        detected_journey_phase, highest_journey_score = _strongest_keyword_label(
+            _HERO_JOURNEY_KEYWORDS, tokens, lowered
+        )
 
         # Detect narrative stage
-        detected_stage = "unknown"
-        highest_stage_score: float = 0.0
-
-        for stage, pattern in narrative_stages.items():
-            matches = len(re.findall(pattern, message.lower()))
-            if matches > highest_stage_score:
-                highest_stage_score = matches
-                detected_stage = stage
+        detected_stage, highest_stage_score = _strongest_keyword_label(
+            _NARRATIVE_STAGE_KEYWORDS, tokens, lowered
+        )
 
         # Transformation markers with enhanced detection
-        transformation_indicators = [
-            r"\b(transform|change|shift|evolve|grow|become|emerge|metamorphosis)\b",
-            r"\b(different|new|rebirth|phoenix|butterfly|chrysalis|caterpillar)\b",
-            r"\b(breakthrough|awakening|realization|enlightenment|epiphany)\b",
-        ]
-
-        transformation_marker = any(
-            re.search(pattern, message.lower()) for pattern in transformation_indicators
-        )
+        transformation_marker = not _TRANSFORMATION_WORDS.isdisjoint(tokens)
 
         # Analyze progression if history available
         progression_analysis = {}
@@ -578,55 +789,12 @@ class ArchetypeEngine:
 
     def _extract_current_motifs(self, message: str) -> List[str]:
         """Identify psychological motifs present in the message"""
-        motif_patterns = {
-            "abandonment": (
-                r"\b(abandon|left|alone|desert|reject|isolat|forsak|" r"betray)\b"
-            ),
-            "betrayal": (
-                r"\b(betray|trust|lie|deceiv|cheat|broken promise|"
-                r"dishonest|unfaithful)\b"
-            ),
-            "perfectionism": (
-                r"\b(perfect|flawless|never enough|not good enough|"
-                r"mistake|failure|inadequate)\b"
-            ),
-            "control": (
-                r"\b(control|manage|organize|plan|predict|certain|"
-                r"manipulat|dominat)\b"
-            ),
-            "approval": (
-                r"\b(approval|accept|like me|love me|validate|"
-                r"recognition|praise|acknowledgment)\b"
-            ),
-            "scarcity": (
-                r"\b(not enough|lack|scarce|limited|running out|"
-                r"shortage|insufficient)\b"
-            ),
-            "worthiness": (
-                r"\b(worthy|deserve|enough|valuable|matter|important|"
-                r"significant|valued)\b"
-            ),
-            "safety": r"\b(safe|secure|protected|danger|threat|risk|vulnerable|harm)\b",
-            "freedom": (
-                r"\b(free|escape|trapped|cage|liberat|independ|" r"autonomous|choice)\b"
-            ),
-            "belonging": (
-                r"\b(belong|fit in|outsider|different|home|family|"
-                r"community|included)\b"
-            ),
-            "power": (
-                r"\b(power|strength|weak|helpless|capable|competent|"
-                r"agency|influence)\b"
-            ),
-            "identity": (
-                r"\b(who am i|identity|self|authentic|real me|" r"true self|persona)\b"
-            ),
-        }
-        detected = []
-        for motif, pattern in motif_patterns.items():
-            if re.search(pattern, message.lower()):
-                detected.append(motif)
-        return detected
+        lowered = message.lower()
+        return [
+            motif
+            for motif, pattern in _MOTIF_PATTERNS.items()
+            if pattern.search(lowered)
+        ]
 
     def _analyze_motif_loops(self, current_motifs, context_signals):
         """Track recurrence and dissolution of motifs over time"""
@@ -796,9 +964,7 @@ class ChangeDetector:
                 "is_mirror_moment": significance > 0.7,
                 "message": f"Movement from {prev_primary} to {curr_primary} detected",
                 "suggested_practice": (
-                    ArchetypeDefinitions.get_integration_practices().get(
-                        curr_primary, "Reflective journaling and integration"
-                    )
+                    ArchetypeDefinitions.get_integration_practice(curr_primary)
                 ),
             }
 
@@ -867,6 +867,9 @@ class MirrorOrchestrator:
         """Update user's archetype profile"""
 
         try:
+            # One clock read per write; the profile and its evolution entry
+            # carry the same timestamp.
+            now_iso = datetime.utcnow().isoformat()
             archetype_data = analysis_result["signal_3_archetype_blend"]
             emotional_data = analysis_result["signal_1_emotional_resonance"]
             symbolic_data = analysis_result["signal_2_symbolic_language"]
@@ -885,7 +888,7 @@ class MirrorOrchestrator:
                     "arousal": emotional_data["arousal"],
                     "certainty": confidence_scores["emotion"],
                 },
-                "updated_at": datetime.utcnow().isoformat(),
+                "updated_at": now_iso,
             }
 
             # Add to evolution history if archetype changed
@@ -899,7 +902,7 @@ class MirrorOrchestrator:
 
                 evolution.append(
                     {
-                        "timestamp": datetime.utcnow().isoformat(),
+                        "timestamp": now_iso,
                         "primary_archetype": archetype_data["primary"],
                         "confidence": confidence_scores["overall"],
                         "trigger_event": (
@@ -928,14 +931,12 @@ class MirrorOrchestrator:
         try:
             primary_change = change_analysis.get("changes", [{}])[0]
 
-            moment_id = (
-                f"moment_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}_"
-                f"{str(uuid.uuid4())[:8]}"
-            )
+            now = datetime.utcnow()
+            moment_id = f"moment_{now:%Y%m%d_%H%M%S}_{str(uuid.uuid4())[:8]}"
             moment_item = {
                 "user_id": user_id,
                 "moment_id": moment_id,
-                "triggered_at": datetime.utcnow().isoformat(),
+                "triggered_at": now.isoformat(),
                 "moment_type": primary_change.get("type", "unknown"),
                 "from_state": primary_change.get("from_archetype", {}),
                 "to_state": primary_change.get("to_archetype", {}),
@@ -1214,6 +1215,9 @@ class MirrorOrchestrator:
             if detailed_result and "confidence" in detailed_result:
                 confidence_score = detailed_result["confidence"]
 
+            now = datetime.utcnow()
+            now_iso = now.isoformat()
+
             # Create the initial profile with quiz-based confidence
             initial_profile = {
                 "user_id": user_id,
@@ -1253,8 +1257,8 @@ class MirrorOrchestrator:
                         "trigger_event": "initial_quiz",
                     }
                 ],
-                "created_at": datetime.utcnow().isoformat(),
-                "updated_at": datetime.utcnow().isoformat(),
+                "created_at": now_iso,
+                "updated_at": now_iso,
             }
 
             # Save the profile to DynamoDB (convert floats to Decimal first)
@@ -1263,10 +1267,7 @@ class MirrorOrchestrator:
                 initial_profile_converted
             )
 
-            quiz_id = (
-                f"quiz_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}_"
-                f"{str(uuid.uuid4())[:8]}"
-            )
+            quiz_id = f"quiz_{now:%Y%m%d_%H%M%S}_{str(uuid.uuid4())[:8]}"
             quiz_record = {
                 "user_id": user_id,
                 "quiz_id": quiz_id,
@@ -1276,7 +1277,7 @@ class MirrorOrchestrator:
                 "assignment_reason": assignment_reason,
                 "answers": quiz_answers,
                 "detailed_result": detailed_result,  # Store detailed analysis
-                "created_at": datetime.utcnow().isoformat(),
+                "created_at": now_iso,
             }
 
             quiz_record_converted = self._convert_floats_to_decimal(quiz_record)
@@ -0,0 +1,41 @@
+"""Lightweight async stand-ins for collaborators a test only needs to answer.
+
+``areturn`` replaces ``AsyncMock(return_value=...)`` without AsyncMock's call
+recording and child-mock machinery; ``AIter`` replays a fixed sequence as an
+async iterator (e.g. a streamed completion)::
+
+    from tests._fakes.async_stubs import AIter, areturn
+
+    db.get_user_profile = areturn(profile)
+    client.chat.completions.create = areturn(AIter(chunks))
+
+Keep ``AsyncMock`` wherever the test inspects ``await_args`` or calls an
+``assert_*`` helper.
+"""
+
+from typing import Any, Awaitable, Callable, Iterable, Iterator
+
+
+def areturn(value: Any) -> Callable[..., Awaitable[Any]]:
+    """Coroutine function that accepts any arguments and returns ``value``."""
+
+    async def _areturn(*args: Any, **kwargs: Any) -> Any:
+        return value
+
+    return _areturn
+
+
+class AIter:
+    """Async iterator over a pre-built sequence; single pass, like a stream."""
+
+    def __init__(self, items: Iterable[Any]) -> None:
+        self._it: Iterator[Any] = iter(items)
+
+    def __aiter__(self) -> "AIter":
+        return self
+
+    async def __anext__(self) -> Any:
+        try:
+            return next(self._it)
+        except StopIteration:
+            raise StopAsyncIteration from None
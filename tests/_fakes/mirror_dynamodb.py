@@ -0,0 +1,62 @@
+"""Dict-backed stand-in for the ``DynamoDBService`` calls MirrorOrchestrator makes.
+
+Stores archetype profiles by ``user_id`` and Mirror Moments per user, newest
+first like the real query. ``calls`` counts awaited methods by name so tests
+can still check that a write happened without ``AsyncMock`` call recording::
+
+    from tests._fakes.mirror_dynamodb import FakeMirrorDynamo
+
+    dynamodb = FakeMirrorDynamo()
+    dynamodb.profiles["u1"] = {"current_archetype_stack": {"primary": "Seeker"}}
+    orchestrator = MirrorOrchestrator(dynamodb, openai_service)
+    ...
+    assert dynamodb.calls["save_user_archetype_profile"] == 1
+
+Failure injection stays with ``AsyncMock(side_effect=...)``.
+"""
+
+from collections import Counter, defaultdict
+from typing import Any, Dict, List, Optional
+
+
+class FakeMirrorDynamo:
+    """In-memory archetype profile and Mirror Moment store."""
+
+    def __init__(self) -> None:
+        self.profiles: Dict[str, Dict[str, Any]] = {}
+        self.moments: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self.quiz_results: List[Dict[str, Any]] = []
+        self.calls: Counter = Counter()
+
+    async def get_user_archetype_profile(
+        self, user_id: str
+    ) -> Optional[Dict[str, Any]]:
+        self.calls["get_user_archetype_profile"] += 1
+        profile = self.profiles.get(user_id)
+        return dict(profile) if profile is not None else None
+
+    async def save_user_archetype_profile(
+        self, profile_data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        self.calls["save_user_archetype_profile"] += 1
+        self.profiles[profile_data["user_id"]] = profile_data
+        return profile_data
+
+    async def save_mirror_moment(self, moment_data: Dict[str, Any]) -> Dict[str, Any]:
+        self.calls["save_mirror_moment"] += 1
+        self.moments[moment_data["user_id"]].insert(0, moment_data)
+        return moment_data
+
+    async def get_user_mirror_moments(
+        self, user_id: str, limit: int = 10, acknowledged_only: bool = False
+    ) -> List[Dict[str, Any]]:
+        self.calls["get_user_mirror_moments"] += 1
+        moments = self.moments.get(user_id, [])
+        if acknowledged_only:
+            moments = [m for m in moments if m.get("acknowledged")]
+        return moments[:limit]
+
+    async def save_quiz_results(self, quiz_data: Dict[str, Any]) -> Dict[str, Any]:
+        self.calls["save_quiz_results"] += 1
+        self.quiz_results.append(quiz_data)
+        return {"success": True, "user_id": quiz_data["user_id"]}
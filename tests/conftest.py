@@ -2,13 +2,21 @@
 Test configuration and fixtures
 """
 
+import contextlib
+import copy
 import os
-from typing import Generator
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import Any, AsyncGenerator, Dict, Final, Generator
 from unittest.mock import AsyncMock, Mock, patch
 
+import httpx
 import pytest
+from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
+from tests._fakes.async_stubs import areturn
+
 # Set test environment variables before importing app
 os.environ.update(
     {
@@ -16,26 +24,16 @@ os.environ.update(
         "COGNITO_CLIENT_ID": "testclientid123",
         "OPENAI_API_KEY": "test-openai-key",
         "AWS_REGION": "us-east-1",
-        "LOG_LEVEL": "DEBUG",
+        "LOG_LEVEL": "WARNING",
         "ENVIRONMENT": "test",
         "NODE_ENV": "test",
         "DEBUG": "true",
         "DYNAMODB_TABLE_NAME": "test-user-profiles",
         "DISABLE_AUTH": "true",  # Disable auth for tests
+        "OPENAPI_URL": "",  # No schema/docs routes; no test reads them
     }
 )
 
-# Mock boto3 before any imports
-mock_cognito = Mock()
-mock_cognito.sign_up.return_value = {
-    "UserSub": "test-user-sub",
-    "CodeDeliveryDetails": {
-        "Destination": "test@example.com",
-        "DeliveryMedium": "EMAIL",
-    },
-    "UserConfirmed": False,
-}
-
 # Login now reads the ID token claims instead of a 2nd Cognito GetUser, so the
 # mocked IdToken must be a real (decodable) JWT. Signature is irrelevant — the
 # controller uses jwt.get_unverified_claims.
@@ -54,40 +52,71 @@ _TEST_ID_TOKEN = _jose_jwt.encode(
     algorithm="HS256",
 )
 
-mock_cognito.admin_initiate_auth.return_value = {
-    "AuthenticationResult": {
-        "AccessToken": "test-access-token",
-        "RefreshToken": "test-refresh-token",
-        "IdToken": _TEST_ID_TOKEN,
+
+def _install_cognito_defaults(client: Mock) -> None:
+    """Wire the canonical Cognito return values onto ``client``"""
+    client.sign_up.return_value = {
+        "UserSub": "test-user-sub",
+        "CodeDeliveryDetails": {
+            "Destination": "test@example.com",
+            "DeliveryMedium": "EMAIL",
+        },
+        "UserConfirmed": False,
+    }
+    client.admin_initiate_auth.return_value = {
+        "AuthenticationResult": {
+            "AccessToken": "test-access-token",
+            "RefreshToken": "test-refresh-token",
+            "IdToken": _TEST_ID_TOKEN,
+        }
     }
-}
 
-mock_cognito.admin_get_user.return_value = {
-    "Username": "test@example.com",
-    "UserAttributes": [
-        {"Name": "email", "Value": "test@example.com"},
-        {"Name": "given_name", "Value": "Test"},
-        {"Name": "family_name", "Value": "User"},
-        {"Name": "email_verified", "Value": "true"},
-    ],
-    "UserStatus": "CONFIRMED",
-    "Enabled": True,
-}
+    client.admin_get_user.return_value = {
+        "Username": "test@example.com",
+        "UserAttributes": [
+            {"Name": "email", "Value": "test@example.com"},
+            {"Name": "given_name", "Value": "Test"},
+            {"Name": "family_name", "Value": "User"},
+            {"Name": "email_verified", "Value": "true"},
+        ],
+        "UserStatus": "CONFIRMED",
+        "Enabled": True,
+    }
 
-mock_cognito.initiate_auth.return_value = {
-    "AuthenticationResult": {
-        "AccessToken": "new-access-token",
-        "RefreshToken": "new-refresh-token",
-        "IdToken": "new-id-token",
+    client.initiate_auth.return_value = {
+        "AuthenticationResult": {
+            "AccessToken": "new-access-token",
+            "RefreshToken": "new-refresh-token",
+            "IdToken": "new-id-token",
+        }
     }
-}
 
-mock_cognito.confirm_sign_up.return_value = {}
-mock_cognito.forgot_password.return_value = {}
-mock_cognito.confirm_forgot_password.return_value = {}
-mock_cognito.resend_confirmation_code.return_value = {}
+    client.confirm_sign_up.return_value = {}
+    client.forgot_password.return_value = {}
+    client.confirm_forgot_password.return_value = {}
+    client.resend_confirmation_code.return_value = {}
+
+
+# Mock boto3 before any imports
+mock_cognito = Mock()
+_install_cognito_defaults(mock_cognito)
+
+# Start global patches before any app imports. They have to be live at import
+# time, not just while tests run: app modules bind the patched names when they
+# are imported (e.g. ``auth_controller`` does ``from ..services.user_service
+# import UserService``), and this conftest imports the app below. Every patch
+# registers its ``stop`` on one ExitStack, which the session-scoped
+# ``_global_patches`` fixture closes when the session ends.
+_GLOBAL_PATCHES = contextlib.ExitStack()
+
+
+def _start_global_patch(patcher):
+    """Start ``patcher`` and register its teardown on ``_GLOBAL_PATCHES``"""
+    mocked = patcher.start()
+    _GLOBAL_PATCHES.callback(patcher.stop)
+    return mocked
+
 
-# Start global patches before any app imports
 boto3_patcher = patch("boto3.client", return_value=mock_cognito)
 dynamodb_service_patcher = patch("src.app.services.dynamodb_service.DynamoDBService")
 user_service_patcher = patch("src.app.services.user_service.UserService")
@@ -104,14 +133,14 @@ openai_orchestrator_patcher = patch("src.app.api.mirrorgpt_routes.OpenAIService"
 dynamodb_orchestrator_patcher = patch("src.app.api.mirrorgpt_routes.DynamoDBService")
 
 # Start the patchers
-boto3_patcher.start()
-mock_dynamodb_service = dynamodb_service_patcher.start()
-mock_user_service_class = user_service_patcher.start()
-mock_openai_class = openai_service_patcher.start()
-mock_openai_health_class = openai_client_patcher.start()
-mock_conversation_service_class = conversation_service_patcher.start()
-mock_openai_orchestrator_class = openai_orchestrator_patcher.start()
-mock_dynamodb_orchestrator_class = dynamodb_orchestrator_patcher.start()
+_start_global_patch(boto3_patcher)
+mock_dynamodb_service = _start_global_patch(dynamodb_service_patcher)
+mock_user_service_class = _start_global_patch(user_service_patcher)
+mock_openai_class = _start_global_patch(openai_service_patcher)
+mock_openai_health_class = _start_global_patch(openai_client_patcher)
+mock_conversation_service_class = _start_global_patch(conversation_service_patcher)
+mock_openai_orchestrator_class = _start_global_patch(openai_orchestrator_patcher)
+mock_dynamodb_orchestrator_class = _start_global_patch(dynamodb_orchestrator_patcher)
 
 
 # Mock authentication to return test user
@@ -133,90 +162,69 @@ def mock_get_mirror_orchestrator():
     return mock_orchestrator_instance
 
 
-# Configure MirrorOrchestrator mock to return successful chat response
-mock_orchestrator_instance.process_mirror_chat = AsyncMock(
-    return_value={
-        "success": True,
-        "response": "Test MirrorGPT response",
-        "archetype_analysis": {
-            "primary_archetype": "Seeker",
-            "secondary_archetype": None,
-            "confidence_score": 0.85,
-            "symbolic_elements": ["light", "path"],
-            "emotional_markers": {"valence": 0.6, "arousal": 0.4},
-            "narrative_position": {"stage": "beginning"},
-            "active_loops": [],
-        },
-        "change_detection": {
-            "change_detected": False,
-            "mirror_moment": False,
-            "changes": [],
-        },
-        "suggested_practice": "Contemplative journaling",
-        "confidence_breakdown": {
-            "overall": 0.85,
-            "archetype": 0.85,
-            "symbol": 0.7,
-            "emotion": 0.6,
-        },
-        "session_metadata": {
-            "session_id": "test-session",
-            "timestamp": "2025-01-01T00:00:00Z",
-        },
-    }
-)
+# The canned chat response is built lazily by the ``mirror_chat_response``
+# fixture; tests that hit /api/mirrorgpt/chat through this mock request
+# ``mock_mirror_orchestrator`` to install it.
+mock_orchestrator_instance.process_mirror_chat = AsyncMock(return_value=None)
+
 
 # Configure the mocked services
 mock_user_service_instance = Mock()
 mock_user_service_class.return_value = mock_user_service_instance
 
+
+@dataclass(frozen=True, slots=True)
+class _FakeProfile:
+    """Plain stand-in for UserProfile; cheaper to read than a Mock."""
+
+    email: str = "test@example.com"
+    full_name: str = "Test User"
+    chat_name: str = "Test"
+    user_id: str = "mock-user-123"
+
+
 # Mock user profile
-mock_profile = Mock()
-mock_profile.email = "test@example.com"
-mock_profile.full_name = "Test User"
-mock_profile.chat_name = "Test"
-mock_profile.user_id = "mock-user-123"
+_MOCK_PROFILE = _FakeProfile()
 
 # Configure async methods
-mock_user_service_instance.get_user_profile = AsyncMock(return_value=mock_profile)
-mock_user_service_instance.create_user_profile_from_cognito = AsyncMock(
-    return_value=mock_profile
-)
-mock_user_service_instance.record_chat_activity = AsyncMock(return_value=None)
-mock_user_service_instance.record_login_activity = AsyncMock(return_value=None)
-mock_user_service_instance.record_logout_activity = AsyncMock(return_value=None)
-mock_user_service_instance.delete_user_account = AsyncMock(return_value=True)
-mock_user_service_instance.get_user_chat_name = AsyncMock(return_value="Test")
-mock_user_service_instance.increment_conversation_count = AsyncMock(return_value=None)
-mock_user_service_instance.sync_user_with_cognito = AsyncMock(return_value=mock_profile)
+mock_user_service_instance.get_user_profile = areturn(_MOCK_PROFILE)
+mock_user_service_instance.create_user_profile_from_cognito = areturn(_MOCK_PROFILE)
+mock_user_service_instance.record_chat_activity = areturn(None)
+mock_user_service_instance.record_login_activity = areturn(None)
+mock_user_service_instance.record_logout_activity = areturn(None)
+mock_user_service_instance.delete_user_account = areturn(True)
+mock_user_service_instance.get_user_chat_name = areturn("Test")
+mock_user_service_instance.increment_conversation_count = areturn(None)
+mock_user_service_instance.sync_user_with_cognito = areturn(_MOCK_PROFILE)
 
 # Mock DynamoDB service
 mock_dynamodb_service_instance = Mock()
 mock_dynamodb_service.return_value = mock_dynamodb_service_instance
-mock_dynamodb_service_instance.get_user_profile = AsyncMock(return_value=mock_profile)
-mock_dynamodb_service_instance.create_user_profile = AsyncMock(
-    return_value=mock_profile
-)
-mock_dynamodb_service_instance.update_user_profile = AsyncMock(
-    return_value=mock_profile
-)
-mock_dynamodb_service_instance.record_user_activity = AsyncMock(return_value=None)
+mock_dynamodb_service_instance.get_user_profile = areturn(_MOCK_PROFILE)
+mock_dynamodb_service_instance.create_user_profile = areturn(_MOCK_PROFILE)
+mock_dynamodb_service_instance.update_user_profile = areturn(_MOCK_PROFILE)
+mock_dynamodb_service_instance.record_user_activity = areturn(None)
 
 # Mock MirrorGPT specific methods
-mock_dynamodb_service_instance.get_user_archetype_profile = AsyncMock(return_value=None)
-mock_dynamodb_service_instance.save_user_archetype_profile = AsyncMock(return_value={})
-mock_dynamodb_service_instance.save_echo_signal = AsyncMock(return_value={})
-mock_dynamodb_service_instance.get_user_mirror_moments = AsyncMock(return_value=[])
-mock_dynamodb_service_instance.get_user_pattern_loops = AsyncMock(return_value=[])
-mock_dynamodb_service_instance.save_mirror_moment = AsyncMock(return_value={})
-mock_dynamodb_service_instance.acknowledge_mirror_moment = AsyncMock(return_value=True)
+mock_dynamodb_service_instance.get_user_archetype_profile = areturn(None)
+mock_dynamodb_service_instance.save_user_archetype_profile = areturn({})
+mock_dynamodb_service_instance.save_echo_signal = areturn({})
+mock_dynamodb_service_instance.get_user_mirror_moments = areturn([])
+mock_dynamodb_service_instance.get_user_pattern_loops = areturn([])
+mock_dynamodb_service_instance.save_mirror_moment = areturn({})
+mock_dynamodb_service_instance.acknowledge_mirror_moment = areturn(True)
 
 # Mock ConversationService for MirrorGPT
 mock_conversation_service_instance = Mock()
 mock_conversation_service_class.return_value = mock_conversation_service_instance
-mock_conversation_service_instance.get_user_mirrorgpt_signals = AsyncMock(
-    return_value=[]
-)
+mock_conversation_service_instance.get_user_mirrorgpt_signals = areturn([])
+
+# One models.list() response shared by every OpenAI client mock
+_MODELS_LIST: Final = [
+    SimpleNamespace(id=model_id)
+    for model_id in ("gpt-3.5-turbo", "gpt-4", "text-davinci-003")
+]
+_MODELS_RESPONSE: Final = SimpleNamespace(data=_MODELS_LIST)
 
 # Mock OpenAI service
 mock_openai_instance = Mock()
@@ -227,107 +235,169 @@ mock_response.choices[0].message.content = "Test AI response from mocked OpenAI"
 mock_openai_instance.chat.completions.create.return_value = mock_response
 
 # Add async methods for MirrorGPT
-mock_openai_instance.send_async = AsyncMock(return_value="Test enhanced AI response")
+mock_openai_instance.send_async = areturn("Test enhanced AI response")
 
 # Mock OpenAI for health checks
 mock_openai_health_instance = Mock()
 mock_openai_health_class.return_value = mock_openai_health_instance
 
-# Create mock models list response
-mock_models_response = Mock()
-mock_models_response.data = [
-    Mock(id="gpt-3.5-turbo"),
-    Mock(id="gpt-4"),
-    Mock(id="text-davinci-003"),
-]
-mock_openai_health_instance.models.list.return_value = mock_models_response
+mock_openai_health_instance.models.list.return_value = _MODELS_RESPONSE
 
 from src.app.api.mirrorgpt_routes import get_mirror_orchestrator  # noqa: E402
 from src.app.core.security import get_current_user  # noqa: E402
 from src.app.handler import app  # noqa: E402
+from src.app.services.archetype_engine import ArchetypeEngine  # noqa: E402
 
-# Clear any existing overrides and set clean ones
-app.dependency_overrides = {}
-app.dependency_overrides[get_current_user] = mock_get_current_user
-app.dependency_overrides[get_mirror_orchestrator] = mock_get_mirror_orchestrator
-
-# Store references for test cleanup
-GLOBAL_PATCHES = [
-    boto3_patcher,
-    dynamodb_service_patcher,
-    user_service_patcher,
-    openai_service_patcher,
-    openai_client_patcher,
-    conversation_service_patcher,
-    openai_orchestrator_patcher,
-    dynamodb_orchestrator_patcher,
-]
+# Baseline overrides every test starts from
+_BASE_DEPENDENCY_OVERRIDES: Final[Dict[Any, Any]] = {
+    get_current_user: mock_get_current_user,
+    get_mirror_orchestrator: mock_get_mirror_orchestrator,
+}
+app.dependency_overrides = dict(_BASE_DEPENDENCY_OVERRIDES)
 
 
-@pytest.fixture
-def client() -> Generator[TestClient, None, None]:
-    """Test client fixture"""
+@pytest.fixture(scope="session", autouse=True)
+def _global_patches() -> Generator[None, None, None]:
+    """Stop the import-time global patches after all tests"""
+    with _GLOBAL_PATCHES:
+        yield
+
+
+@pytest.fixture(scope="session", name="app")
+def app_fixture() -> FastAPI:
+    """The application under test, imported once with the conftest patches"""
+    return app
+
+
+@pytest.fixture(scope="session")
+def client(app: FastAPI) -> Generator[TestClient, None, None]:
+    """Test client fixture, shared across the session.
+
+    Dependency overrides are restored per test by
+    ``clean_dependency_overrides``, so one client (and one middleware stack)
+    serves every test.
+    """
     with TestClient(app) as test_client:
         yield test_client
 
 
 @pytest.fixture
-def mock_cognito_client():
-    """Mock Cognito client - returns the module level mock"""
-    return mock_cognito
+async def aclient(app: FastAPI) -> AsyncGenerator[httpx.AsyncClient, None]:
+    """Async client that drives the app in-process on the test's event loop.
+
+    Unlike ``client`` there is no TestClient thread portal per request, so
+    async tests should prefer this one.
+    """
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://testserver"
+    ) as async_client:
+        yield async_client
 
 
 @pytest.fixture
-def mock_openai_client():
-    """Mock OpenAI client"""
-    with patch("src.app.services.openai_service.OpenAI") as mock_openai:
-        mock_client = Mock()
-        mock_openai.return_value = mock_client
+def mock_cognito_client() -> Generator[Mock, None, None]:
+    """Mock Cognito client - the module-level mock, restored after each test"""
+    # Shared, not copied: the cached CognitoService holds this exact object
+    yield mock_cognito
+    mock_cognito.reset_mock(return_value=True, side_effect=True)
+    _install_cognito_defaults(mock_cognito)
 
-        # Mock chat completion
-        mock_response = Mock()
-        mock_response.choices = [Mock()]
-        mock_response.choices[0].message.content = "Test AI response"
-        mock_client.chat.completions.create.return_value = mock_response
 
-        # Mock models list
-        mock_models = Mock()
-        mock_models.data = [Mock(id="gpt-4"), Mock(id="gpt-3.5-turbo")]
-        mock_client.models.list.return_value = mock_models
+@pytest.fixture(scope="session")
+def mirror_chat_response() -> Dict[str, Any]:
+    """Successful MirrorOrchestrator.process_mirror_chat payload"""
+    return {
+        "success": True,
+        "response": "Test MirrorGPT response",
+        "archetype_analysis": {
+            "primary_archetype": "Seeker",
+            "secondary_archetype": None,
+            "confidence_score": 0.85,
+            "symbolic_elements": ["light", "path"],
+            "emotional_markers": {"valence": 0.6, "arousal": 0.4},
+            "narrative_position": {"stage": "beginning"},
+            "active_loops": [],
+        },
+        "change_detection": {
+            "change_detected": False,
+            "mirror_moment": False,
+            "changes": [],
+        },
+        "suggested_practice": "Contemplative journaling",
+        "confidence_breakdown": {
+            "overall": 0.85,
+            "archetype": 0.85,
+            "symbol": 0.7,
+            "emotion": 0.6,
+        },
+        "session_metadata": {
+            "session_id": "test-session",
+            "timestamp": "2025-01-01T00:00:00Z",
+        },
+    }
 
-        yield mock_client
+
+@pytest.fixture(scope="session")
+def archetype_engine() -> ArchetypeEngine:
+    """One ArchetypeEngine for the session; its tables are read-only"""
+    return ArchetypeEngine()
 
 
 @pytest.fixture
+def mock_mirror_orchestrator(monkeypatch, mirror_chat_response) -> Mock:
+    """Conftest orchestrator mock, answering chats with ``mirror_chat_response``"""
+    # The chat route rewrites result["response"] in place, so every call gets
+    # its own copy of the session-wide payload.
+    monkeypatch.setattr(
+        mock_orchestrator_instance.process_mirror_chat,
+        "side_effect",
+        lambda *args, **kwargs: copy.deepcopy(mirror_chat_response),
+    )
+    return mock_orchestrator_instance
+
+
+_SAMPLE_USER_DATA: Final[Dict[str, Any]] = {
+    "email": "test@example.com",
+    "password": "TestPassword123!",
+    "fullName": "Test User",
+}
+_SAMPLE_LOGIN_DATA: Final[Dict[str, Any]] = {
+    "email": "test@example.com",
+    "password": "TestPassword123!",
+}
+_SAMPLE_CHAT_DATA: Final[Dict[str, Any]] = {
+    "message": "Hello, this is a test message",
+    "userName": "John",
+    "conversationHistory": [
+        {"role": "user", "content": "Previous message"},
+        {"role": "assistant", "content": "Previous response"},
+    ],
+}
+
+
+# The sample payloads below are shared across the session; tests that need a
+# variant build a new dict (``{**sample_user_data, "email": ...}``) instead of
+# editing them in place.
+@pytest.fixture(scope="session")
 def sample_user_data():
     """Sample user registration data"""
-    return {
-        "email": "test@example.com",
-        "password": "TestPassword123!",
-        "fullName": "Test User",
-    }
+    return _SAMPLE_USER_DATA
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_login_data():
     """Sample login data"""
-    return {"email": "test@example.com", "password": "TestPassword123!"}
+    return _SAMPLE_LOGIN_DATA
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_chat_data():
     """Sample chat data"""
-    return {
-        "message": "Hello, this is a test message",
-        "userName": "John",
-        "conversationHistory": [
-            {"role": "user", "content": "Previous message"},
-            {"role": "assistant", "content": "Previous response"},
-        ],
-    }
+    return _SAMPLE_CHAT_DATA
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_jwt_token():
     """Mock JWT token for authentication tests"""
     return (
@@ -340,16 +410,7 @@ def mock_jwt_token():
 @pytest.fixture(autouse=True)
 def clean_dependency_overrides():
     """Ensure dependency overrides are properly set for each test"""
-    # Re-establish clean dependency overrides before each test
-    app.dependency_overrides = {}
-    app.dependency_overrides[get_current_user] = mock_get_current_user
-    app.dependency_overrides[get_mirror_orchestrator] = mock_get_mirror_orchestrator
-    yield
-    # Keep overrides for consistency
-
-
-# Cleanup function to stop global patches
-def pytest_sessionfinish(session, exitstatus):
-    """Stop global patches after all tests"""
-    for patcher in GLOBAL_PATCHES:
-        patcher.stop()
+    # Most tests leave the baseline untouched; only rebuild the dict when a
+    # previous test added, popped or cleared entries.
+    if app.dependency_overrides != _BASE_DEPENDENCY_OVERRIDES:
+        app.dependency_overrides = dict(_BASE_DEPENDENCY_OVERRIDES)
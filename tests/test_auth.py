@@ -2,61 +2,73 @@
 Test authentication endpoints
 """
 
+from typing import Any, Dict, Iterable
+
+import pytest
 from botocore.exceptions import ClientError
 from fastapi.testclient import TestClient
 
 
+def _cognito_error(code: str, message: str, operation: str) -> ClientError:
+    return ClientError(
+        error_response={"Error": {"Code": code, "Message": message}},
+        operation_name=operation,
+    )
+
+
+# Built once at import; each is raised by exactly one parametrized case.
+_USERNAME_EXISTS = _cognito_error(
+    "UsernameExistsException", "User already exists", "SignUp"
+)
+_NOT_AUTHORIZED = _cognito_error(
+    "NotAuthorizedException", "Invalid credentials", "AdminInitiateAuth"
+)
+_USER_NOT_CONFIRMED = _cognito_error(
+    "UserNotConfirmedException", "User not confirmed", "AdminInitiateAuth"
+)
+_CODE_MISMATCH = _cognito_error(
+    "CodeMismatchException", "Invalid code", "ConfirmSignUp"
+)
+
+
+def _assert_ok(
+    response, status: int = 200, *, data_keys: Iterable[str] = ()
+) -> Dict[str, Any]:
+    """Check the success envelope once and return the parsed body"""
+    assert response.status_code == status, response.text
+    body = response.json()
+    assert body["success"] is True
+    if data_keys:
+        missing = set(data_keys) - body["data"].keys()
+        assert not missing, f"missing data keys: {sorted(missing)}"
+    return body
+
+
 def test_register_success(client: TestClient, mock_cognito_client, sample_user_data):
     """Test successful user registration"""
     response = client.post("/api/auth/register", json=sample_user_data)
-    assert response.status_code == 201
-
-    data = response.json()
-    assert data["success"] is True
-    assert "data" in data
+    data = _assert_ok(response, 201, data_keys=("user",))
     assert data["data"]["user"]["id"] == "test-user-sub"
 
 
 def test_register_invalid_email(client: TestClient, sample_user_data):
     """Test registration with invalid email"""
-    sample_user_data["email"] = "invalid-email"
-    response = client.post("/api/auth/register", json=sample_user_data)
+    payload = {**sample_user_data, "email": "invalid-email"}
+    response = client.post("/api/auth/register", json=payload)
     assert response.status_code == 422  # Validation error
 
 
 def test_register_weak_password(client: TestClient, sample_user_data):
     """Test registration with weak password"""
-    sample_user_data["password"] = "weak"
-    response = client.post("/api/auth/register", json=sample_user_data)
+    payload = {**sample_user_data, "password": "weak"}
+    response = client.post("/api/auth/register", json=payload)
     assert response.status_code == 422  # Validation error
 
 
-def test_register_cognito_error(
-    client: TestClient, mock_cognito_client, sample_user_data
-):
-    """Test registration with Cognito error"""
-    mock_cognito_client.sign_up.side_effect = ClientError(
-        error_response={
-            "Error": {
-                "Code": "UsernameExistsException",
-                "Message": "User already exists",
-            }
-        },
-        operation_name="SignUp",
-    )
-
-    response = client.post("/api/auth/register", json=sample_user_data)
-    assert response.status_code == 409  # Conflict
-
-
 def test_login_success(client: TestClient, mock_cognito_client, sample_login_data):
     """Test successful login"""
     response = client.post("/api/auth/login", json=sample_login_data)
-    assert response.status_code == 200
-
-    data = response.json()
-    assert data["success"] is True
-    assert "data" in data
+    data = _assert_ok(response, data_keys=("tokens", "user"))
     assert data["data"]["tokens"]["accessToken"] == "test-access-token"
     assert data["data"]["tokens"]["refreshToken"] == "test-refresh-token"
     # User is built from the ID token claims, preserving the prior shape.
@@ -77,42 +89,6 @@ def test_login_does_not_make_second_cognito_call(
     mock_cognito_client.admin_get_user.assert_not_called()
 
 
-def test_login_invalid_credentials(
-    client: TestClient, mock_cognito_client, sample_login_data
-):
-    """Test login with invalid credentials"""
-    mock_cognito_client.admin_initiate_auth.side_effect = ClientError(
-        error_response={
-            "Error": {
-                "Code": "NotAuthorizedException",
-                "Message": "Invalid credentials",
-            }
-        },
-        operation_name="AdminInitiateAuth",
-    )
-
-    response = client.post("/api/auth/login", json=sample_login_data)
-    assert response.status_code == 401
-
-
-def test_login_user_not_confirmed(
-    client: TestClient, mock_cognito_client, sample_login_data
-):
-    """Test login with unconfirmed user"""
-    mock_cognito_client.admin_initiate_auth.side_effect = ClientError(
-        error_response={
-            "Error": {
-                "Code": "UserNotConfirmedException",
-                "Message": "User not confirmed",
-            }
-        },
-        operation_name="AdminInitiateAuth",
-    )
-
-    response = client.post("/api/auth/login", json=sample_login_data)
-    assert response.status_code == 401
-
-
 def test_verify_email_success(client: TestClient, mock_cognito_client):
     """Test successful email verification"""
     verification_data = {"email": "test@example.com", "verificationCode": "123456"}
@@ -120,25 +96,68 @@ def test_verify_email_success(client: TestClient, mock_cognito_client):
     mock_cognito_client.confirm_sign_up.return_value = {}
 
     response = client.post("/api/auth/confirm-email", json=verification_data)
-    assert response.status_code == 200
-
-    data = response.json()
-    assert data["success"] is True
-
-
-def test_verify_email_invalid_code(client: TestClient, mock_cognito_client):
-    """Test email verification with invalid code"""
-    verification_data = {"email": "test@example.com", "verificationCode": "invalid"}
-
-    mock_cognito_client.confirm_sign_up.side_effect = ClientError(
-        error_response={
-            "Error": {"Code": "CodeMismatchException", "Message": "Invalid code"}
-        },
-        operation_name="ConfirmSignUp",
-    )
+    _assert_ok(response)
+
+
+@pytest.fixture
+def invalid_verification_data():
+    """Email confirmation payload with a code Cognito will reject"""
+    return {"email": "test@example.com", "verificationCode": "invalid"}
+
+
+@pytest.mark.parametrize(
+    "endpoint,payload_fixture,cognito_method,error,expected_status",
+    [
+        pytest.param(
+            "/api/auth/register",
+            "sample_user_data",
+            "sign_up",
+            _USERNAME_EXISTS,
+            409,  # Conflict
+            id="register-username-exists",
+        ),
+        pytest.param(
+            "/api/auth/login",
+            "sample_login_data",
+            "admin_initiate_auth",
+            _NOT_AUTHORIZED,
+            401,
+            id="login-invalid-credentials",
+        ),
+        pytest.param(
+            "/api/auth/login",
+            "sample_login_data",
+            "admin_initiate_auth",
+            _USER_NOT_CONFIRMED,
+            401,
+            id="login-user-not-confirmed",
+        ),
+        pytest.param(
+            "/api/auth/confirm-email",
+            "invalid_verification_data",
+            "confirm_sign_up",
+            _CODE_MISMATCH,
+            400,
+            id="verify-email-invalid-code",
+        ),
+    ],
+)
+def test_cognito_error_maps_to_status(
+    request: pytest.FixtureRequest,
+    client: TestClient,
+    mock_cognito_client,
+    endpoint: str,
+    payload_fixture: str,
+    cognito_method: str,
+    error: ClientError,
+    expected_status: int,
+):
+    """Test that Cognito failures surface as the matching HTTP status"""
+    getattr(mock_cognito_client, cognito_method).side_effect = error
 
-    response = client.post("/api/auth/confirm-email", json=verification_data)
-    assert response.status_code == 400
+    payload = request.getfixturevalue(payload_fixture)
+    response = client.post(endpoint, json=payload)
+    assert response.status_code == expected_status
 
 
 def test_forgot_password_success(client: TestClient, mock_cognito_client):
@@ -148,10 +167,7 @@ def test_forgot_password_success(client: TestClient, mock_cognito_client):
     mock_cognito_client.forgot_password.return_value = {}
 
     response = client.post("/api/auth/forgot-password", json=forgot_data)
-    assert response.status_code == 200
-
-    data = response.json()
-    assert data["success"] is True
+    _assert_ok(response)
 
 
 def test_reset_password_success(client: TestClient, mock_cognito_client):
@@ -165,10 +181,7 @@ def test_reset_password_success(client: TestClient, mock_cognito_client):
     mock_cognito_client.confirm_forgot_password.return_value = {}
 
     response = client.post("/api/auth/reset-password", json=reset_data)
-    assert response.status_code == 200
-
-    data = response.json()
-    assert data["success"] is True
+    _assert_ok(response)
 
 
 def test_refresh_token_success(client: TestClient, mock_cognito_client):
@@ -183,10 +196,7 @@ def test_refresh_token_success(client: TestClient, mock_cognito_client):
     }
 
     response = client.post("/api/auth/refresh", json=refresh_data)
-    assert response.status_code == 200
-
-    data = response.json()
-    assert data["success"] is True
+    data = _assert_ok(response)
     assert data["data"]["tokens"]["accessToken"] == "new-access-token"
 
 
@@ -197,7 +207,4 @@ def test_resend_verification_success(client: TestClient, mock_cognito_client):
     mock_cognito_client.resend_confirmation_code.return_value = {}
 
     response = client.post("/api/auth/resend-verification-code", json=resend_data)
-    assert response.status_code == 200
-
-    data = response.json()
-    assert data["success"] is True
+    _assert_ok(response)
@@ -39,7 +39,6 @@ def cognito_service_with_mock_client():
         yield service, mock_client
 
 
-@pytest.mark.asyncio
 async def test_client_constructed_with_max_pool_connections():
     """boto3.client must receive a Config with max_pool_connections=50."""
     os.environ.setdefault("COGNITO_USER_POOL_ID", "testpoolid123")
@@ -63,7 +62,6 @@ async def test_client_constructed_with_max_pool_connections():
     assert config.retries == {"max_attempts": 5, "mode": "adaptive"}  # type: ignore[attr-defined]
 
 
-@pytest.mark.asyncio
 async def test_sign_up_user_awaits_to_thread(cognito_service_with_mock_client):
     """sign_up_user must await the to_thread wrapper without warning."""
     service, mock_client = cognito_service_with_mock_client
@@ -89,7 +87,6 @@ async def test_sign_up_user_awaits_to_thread(cognito_service_with_mock_client):
     assert kwargs["Password"] == "Pass!1234"
 
 
-@pytest.mark.asyncio
 async def test_authenticate_user_passes_through_kwargs(
     cognito_service_with_mock_client,
 ):
@@ -113,7 +110,6 @@ async def test_authenticate_user_passes_through_kwargs(
     assert kwargs["AuthParameters"]["USERNAME"] == "u@example.com"
 
 
-@pytest.mark.asyncio
 async def test_get_user_wraps_in_to_thread(cognito_service_with_mock_client):
     """get_user must use to_thread (positional access_token kwarg)."""
     service, mock_client = cognito_service_with_mock_client
@@ -129,7 +125,6 @@ async def test_get_user_wraps_in_to_thread(cognito_service_with_mock_client):
     assert mock_client.get_user.call_args.kwargs == {"AccessToken": "access-token-xyz"}
 
 
-@pytest.mark.asyncio
 async def test_admin_delete_user_passes_pool_and_username(
     cognito_service_with_mock_client,
 ):
@@ -144,7 +139,6 @@ async def test_admin_delete_user_passes_pool_and_username(
     }
 
 
-@pytest.mark.asyncio
 async def test_concurrent_calls_overlap_on_threadpool(
     cognito_service_with_mock_client,
 ):
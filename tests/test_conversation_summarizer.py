@@ -55,6 +55,17 @@ def _make_conversation(
     )
 
 
+@pytest.fixture(scope="module")
+def short_history() -> List[ConversationMessage]:
+    """Four-turn history shared by the JSON-parsing tests (read-only)."""
+    return [
+        _make_message("m1", "user", "test"),
+        _make_message("m2", "assistant", "ok"),
+        _make_message("m3", "user", "more"),
+        _make_message("m4", "assistant", "ok"),
+    ]
+
+
 def _make_summarizer(
     *,
     conversation: Conversation,
@@ -85,7 +96,6 @@ def _make_summarizer(
 # --------------------------------------------------------------------------
 
 
-@pytest.mark.asyncio
 async def test_summarize_happy_path_persists_result():
     history = [
         _make_message("m1", "user", "I'm stuck on whether to quit my job."),
@@ -130,7 +140,6 @@ async def test_summarize_happy_path_persists_result():
     assert persisted.summarized_through_message_id == "m4"
 
 
-@pytest.mark.asyncio
 async def test_summarize_below_first_threshold_returns_none():
     conv = _make_conversation(message_count=2)
     summarizer, openai_service, _ = _make_summarizer(
@@ -146,7 +155,6 @@ async def test_summarize_below_first_threshold_returns_none():
     openai_service.send_with_overrides_async.assert_not_awaited()
 
 
-@pytest.mark.asyncio
 async def test_summarize_handles_openai_error_gracefully():
     history = [
         _make_message("m1", "user", "Hi"),
@@ -168,18 +176,13 @@ async def test_summarize_handles_openai_error_gracefully():
     conv_service.update_conversation_summary.assert_not_awaited()
 
 
-@pytest.mark.asyncio
-async def test_summarize_rejects_malformed_json():
-    history = [
-        _make_message("m1", "user", "test"),
-        _make_message("m2", "assistant", "ok"),
-        _make_message("m3", "user", "more"),
-        _make_message("m4", "assistant", "ok"),
-    ]
+async def test_summarize_rejects_malformed_json(
+    short_history: List[ConversationMessage],
+):
     conv = _make_conversation(message_count=4)
     summarizer, _, conv_service = _make_summarizer(
         conversation=conv,
-        history=history,
+        history=short_history,
         openai_response="this is not json at all",
     )
 
@@ -189,14 +192,7 @@ async def test_summarize_rejects_malformed_json():
     conv_service.update_conversation_summary.assert_not_awaited()
 
 
-@pytest.mark.asyncio
-async def test_summarize_strips_code_fences():
-    history = [
-        _make_message("m1", "user", "test"),
-        _make_message("m2", "assistant", "ok"),
-        _make_message("m3", "user", "more"),
-        _make_message("m4", "assistant", "ok"),
-    ]
+async def test_summarize_strips_code_fences(short_history: List[ConversationMessage]):
     conv = _make_conversation(message_count=4)
     fenced = (
         "```json\n"
@@ -210,7 +206,7 @@ async def test_summarize_strips_code_fences():
         + "\n```"
     )
     summarizer, _, _ = _make_summarizer(
-        conversation=conv, history=history, openai_response=fenced
+        conversation=conv, history=short_history, openai_response=fenced
     )
 
     result = await summarizer.summarize("conv-1", "user-1")
@@ -221,21 +217,16 @@ async def test_summarize_strips_code_fences():
     assert result.open_threads == []
 
 
-@pytest.mark.asyncio
-async def test_summarize_rejects_wrong_types_in_json():
-    history = [
-        _make_message("m1", "user", "test"),
-        _make_message("m2", "assistant", "ok"),
-        _make_message("m3", "user", "more"),
-        _make_message("m4", "assistant", "ok"),
-    ]
+async def test_summarize_rejects_wrong_types_in_json(
+    short_history: List[ConversationMessage],
+):
     conv = _make_conversation(message_count=4)
     # themes should be a list of strings; here it's a string.
     bad_payload = json.dumps(
         {"summary": "ok", "key_themes": "not-a-list", "open_threads": []}
     )
     summarizer, _, conv_service = _make_summarizer(
-        conversation=conv, history=history, openai_response=bad_payload
+        conversation=conv, history=short_history, openai_response=bad_payload
     )
 
     result = await summarizer.summarize("conv-1", "user-1")
@@ -244,14 +235,9 @@ async def test_summarize_rejects_wrong_types_in_json():
     conv_service.update_conversation_summary.assert_not_awaited()
 
 
-@pytest.mark.asyncio
-async def test_summarize_caps_themes_and_threads_lengths():
-    history = [
-        _make_message("m1", "user", "test"),
-        _make_message("m2", "assistant", "ok"),
-        _make_message("m3", "user", "more"),
-        _make_message("m4", "assistant", "ok"),
-    ]
+async def test_summarize_caps_themes_and_threads_lengths(
+    short_history: List[ConversationMessage],
+):
     conv = _make_conversation(message_count=4)
     payload = json.dumps(
         {
@@ -261,7 +247,7 @@ async def test_summarize_caps_themes_and_threads_lengths():
         }
     )
     summarizer, _, _ = _make_summarizer(
-        conversation=conv, history=history, openai_response=payload
+        conversation=conv, history=short_history, openai_response=payload
     )
 
     result = await summarizer.summarize("conv-1", "user-1")
@@ -276,7 +262,6 @@ async def test_summarize_caps_themes_and_threads_lengths():
 # --------------------------------------------------------------------------
 
 
-@pytest.mark.asyncio
 async def test_summarize_if_stale_skips_when_under_first_threshold():
     conv = _make_conversation(message_count=2)
     summarizer, openai_service, _ = _make_summarizer(
@@ -292,7 +277,6 @@ async def test_summarize_if_stale_skips_when_under_first_threshold():
     openai_service.send_with_overrides_async.assert_not_awaited()
 
 
-@pytest.mark.asyncio
 async def test_summarize_if_stale_generates_when_no_summary_yet():
     history = [_make_message(f"m{i}", "user", "x") for i in range(1, 5)]
     conv = _make_conversation(message_count=4, summary=None)
@@ -310,7 +294,6 @@ async def test_summarize_if_stale_generates_when_no_summary_yet():
     openai_service.send_with_overrides_async.assert_awaited_once()
 
 
-@pytest.mark.asyncio
 async def test_summarize_if_stale_returns_existing_when_fresh():
     # Conversation has summary marked through m4, history also ends at m4.
     history = [_make_message(f"m{i}", "user", "x") for i in range(1, 5)]
@@ -335,7 +318,6 @@ async def test_summarize_if_stale_returns_existing_when_fresh():
     conv_service.update_conversation_summary.assert_not_awaited()
 
 
-@pytest.mark.asyncio
 async def test_summarize_if_stale_regenerates_when_threshold_exceeded():
     # Summary marker is m4, but history has 10 messages — 6 new since marker.
     history = [_make_message(f"m{i}", "user", "x") for i in range(1, 11)]
@@ -362,7 +344,6 @@ async def test_summarize_if_stale_regenerates_when_threshold_exceeded():
     conv_service.update_conversation_summary.assert_awaited_once()
 
 
-@pytest.mark.asyncio
 async def test_summarize_if_stale_regenerates_when_marker_not_in_window():
     # Marker references an old message no longer in our recent window —
     # treat as very stale.
@@ -389,7 +370,6 @@ async def test_summarize_if_stale_regenerates_when_marker_not_in_window():
 # --------------------------------------------------------------------------
 
 
-@pytest.mark.asyncio
 async def test_summarize_parses_object_themes_with_confidence():
     history = [_make_message(f"m{i}", "user", "x") for i in range(1, 5)]
     conv = _make_conversation(message_count=4)
@@ -419,7 +399,6 @@ async def test_summarize_parses_object_themes_with_confidence():
     assert result.nudge_reason == "A hard conversation is pending."
 
 
-@pytest.mark.asyncio
 async def test_summarize_clamps_bad_confidence_and_drops_junk_themes():
     history = [_make_message(f"m{i}", "user", "x") for i in range(1, 5)]
     conv = _make_conversation(message_count=4)
@@ -448,7 +427,6 @@ async def test_summarize_clamps_bad_confidence_and_drops_junk_themes():
     ]
 
 
-@pytest.mark.asyncio
 async def test_summarize_defaults_nudge_when_absent():
     history = [_make_message(f"m{i}", "user", "x") for i in range(1, 5)]
     conv = _make_conversation(message_count=4)
@@ -464,7 +442,6 @@ async def test_summarize_defaults_nudge_when_absent():
     assert result.nudge_reason == ""
 
 
-@pytest.mark.asyncio
 async def test_summarize_blanks_reason_when_not_eligible():
     history = [_make_message(f"m{i}", "user", "x") for i in range(1, 5)]
     conv = _make_conversation(message_count=4)
@@ -487,7 +464,6 @@ async def test_summarize_blanks_reason_when_not_eligible():
     assert result.nudge_reason == ""
 
 
-@pytest.mark.asyncio
 async def test_summarize_requests_json_object_response_format():
     history = [_make_message(f"m{i}", "user", "x") for i in range(1, 5)]
     conv = _make_conversation(message_count=4)
@@ -502,7 +478,6 @@ async def test_summarize_requests_json_object_response_format():
     assert kwargs["response_format"] == {"type": "json_object"}
 
 
-@pytest.mark.asyncio
 async def test_summarize_persists_nudge_and_object_themes():
     history = [_make_message(f"m{i}", "user", "x") for i in range(1, 5)]
     conv = _make_conversation(message_count=4)
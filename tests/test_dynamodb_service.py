@@ -77,7 +77,6 @@ def _make_fake_resource_context():
 # ---------------------------------------------------------------------------
 
 
-@pytest.mark.asyncio
 async def test_resource_is_reused_across_calls(dynamodb_service_cls):
     """`_get_resource` enters the underlying session.resource() exactly once.
 
@@ -108,7 +107,6 @@ async def test_resource_is_reused_across_calls(dynamodb_service_cls):
     assert exit_count["n"] == 1
 
 
-@pytest.mark.asyncio
 async def test_resource_init_is_concurrency_safe(dynamodb_service_cls):
     """Concurrent first-time callers collapse onto a single resource init.
 
@@ -175,7 +173,6 @@ def _install_quiz_scan_stub(
     return scan_calls
 
 
-@pytest.mark.asyncio
 async def test_quiz_questions_cache_hit_within_ttl(dynamodb_service_cls):
     """Second call within the TTL window is served from cache (no scan)."""
     DynamoDBService, ddb_module = dynamodb_service_cls
@@ -192,7 +189,6 @@ async def test_quiz_questions_cache_hit_within_ttl(dynamodb_service_cls):
     assert scan_calls["n"] == 1, "Cache hit must not trigger a second scan"
 
 
-@pytest.mark.asyncio
 async def test_quiz_questions_cache_expiry(dynamodb_service_cls, monkeypatch):
     """After the TTL elapses, the cache is refreshed via a new scan."""
     DynamoDBService, ddb_module = dynamodb_service_cls
@@ -223,7 +219,6 @@ async def test_quiz_questions_cache_expiry(dynamodb_service_cls, monkeypatch):
     assert scan_calls["n"] == 2
 
 
-@pytest.mark.asyncio
 async def test_quiz_questions_cache_thread_safety(dynamodb_service_cls):
     """Concurrent first-time callers collapse onto a single scan."""
     DynamoDBService, ddb_module = dynamodb_service_cls
@@ -257,7 +252,6 @@ async def test_quiz_questions_cache_thread_safety(dynamodb_service_cls):
     ), "10 concurrent get_quiz_questions calls must collapse onto a single scan"
 
 
-@pytest.mark.asyncio
 async def test_quiz_questions_failure_is_not_cached(dynamodb_service_cls):
     """A transient DDB failure must not poison the cache for 5 minutes."""
     DynamoDBService, ddb_module = dynamodb_service_cls
@@ -316,7 +310,6 @@ def _install_update_item_capture(service: Any) -> Dict[str, Any]:
     return captured
 
 
-@pytest.mark.asyncio
 async def test_increment_conversation_activity_uses_atomic_add(dynamodb_service_cls):
     """Counters bump via DynamoDB ADD (not SET) so concurrent user+assistant
     writes each apply their own increment instead of dropping one."""
@@ -343,7 +336,6 @@ async def test_increment_conversation_activity_uses_atomic_add(dynamodb_service_
     assert "ExpressionAttributeNames" not in captured
 
 
-@pytest.mark.asyncio
 async def test_increment_conversation_activity_sets_title_if_not_exists(
     dynamodb_service_cls,
 ):
@@ -393,7 +385,6 @@ def _install_soulping_query_update(service: Any, items: List[Dict[str, Any]]):
     return captured, fake_table
 
 
-@pytest.mark.asyncio
 async def test_mark_soul_ping_read_updates_matching_row(dynamodb_service_cls):
     DynamoDBService, _ = dynamodb_service_cls
     service = DynamoDBService()
@@ -412,7 +403,6 @@ async def test_mark_soul_ping_read_updates_matching_row(dynamodb_service_cls):
     assert "read_at = :r" in captured["UpdateExpression"]
 
 
-@pytest.mark.asyncio
 async def test_mark_soul_ping_read_false_when_ping_not_found(dynamodb_service_cls):
     DynamoDBService, _ = dynamodb_service_cls
     service = DynamoDBService()
@@ -427,7 +417,6 @@ async def test_mark_soul_ping_read_false_when_ping_not_found(dynamodb_service_cl
     table.update_item.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_mark_soul_ping_read_idempotent_when_already_read(dynamodb_service_cls):
     DynamoDBService, _ = dynamodb_service_cls
     service = DynamoDBService()
@@ -86,7 +86,6 @@ def test_attachment_round_trip_and_back_compat():
 # --------------------------------------------------------------------------- #
 # add_attachment
 # --------------------------------------------------------------------------- #
-@pytest.mark.asyncio
 async def test_add_attachment_appends_and_sets_back_compat():
     service, table, _ = _wire_service(
         _echo_row(),
@@ -114,7 +113,6 @@ async def test_add_attachment_appends_and_sets_back_compat():
     assert persisted["attachments"][0]["type"] == "VIDEO"
 
 
-@pytest.mark.asyncio
 async def test_add_attachment_image_sets_poster_not_media_url():
     service, table, _ = _wire_service(
         _echo_row(),
@@ -130,7 +128,6 @@ async def test_add_attachment_image_sets_poster_not_media_url():
     assert echo.poster_url and echo.poster_url.endswith("echo-1_1.jpg")
 
 
-@pytest.mark.asyncio
 async def test_add_attachment_second_keeps_first_media_url():
     row = _echo_row(
         media_url="https://b.s3.r.amazonaws.com/echoes/user-1/echo-1_v.mp4",
@@ -148,7 +145,6 @@ async def test_add_attachment_second_keeps_first_media_url():
     assert echo.media_url.endswith("echo-1_v.mp4")  # unchanged
 
 
-@pytest.mark.asyncio
 async def test_add_attachment_tenancy_reject():
     from src.app.core.exceptions import ValidationError
 
@@ -161,7 +157,6 @@ async def test_add_attachment_tenancy_reject():
         )
 
 
-@pytest.mark.asyncio
 async def test_add_attachment_owner_reject():
     from src.app.core.exceptions import NotFoundError
 
@@ -174,7 +169,6 @@ async def test_add_attachment_owner_reject():
         )
 
 
-@pytest.mark.asyncio
 async def test_add_attachment_missing_object_raises_not_found():
     from src.app.core.exceptions import NotFoundError
 
@@ -186,7 +180,6 @@ async def test_add_attachment_missing_object_raises_not_found():
         )
 
 
-@pytest.mark.asyncio
 async def test_add_attachment_with_thumb_key():
     service, _, _ = _wire_service(
         _echo_row(),
@@ -205,7 +198,6 @@ async def test_add_attachment_with_thumb_key():
 # --------------------------------------------------------------------------- #
 # Signing
 # --------------------------------------------------------------------------- #
-@pytest.mark.asyncio
 async def test_sign_attachments_signs_canonical_and_skips_signed():
     service, _, _ = _wire_service(_echo_row())
     echo = Echo(
@@ -228,7 +220,6 @@ async def test_sign_attachments_signs_canonical_and_skips_signed():
 # --------------------------------------------------------------------------- #
 # Email media fields
 # --------------------------------------------------------------------------- #
-@pytest.mark.asyncio
 async def test_build_email_media_fields():
     service, _, _ = _wire_service(_echo_row())
     echo = Echo(
@@ -247,7 +238,6 @@ async def test_build_email_media_fields():
     assert "attachment_url" not in fields  # email defaults it to open-echo URL
 
 
-@pytest.mark.asyncio
 async def test_build_email_media_fields_empty():
     service, _, _ = _wire_service(_echo_row())
     fields = await service.build_email_media_fields(Echo())
@@ -285,7 +275,6 @@ def test_mime_alias_normalization():
     assert _normalize_mime("image/jpg") in ALLOWED_UPLOAD_MIME_TYPES
 
 
-@pytest.mark.asyncio
 async def test_upload_url_signs_original_content_type():
     # image/jpg is normalized for the allowlist + extension, but the presigned
     # PUT must sign the client's EXACT Content-Type so the PUT header matches
@@ -300,7 +289,6 @@ async def test_upload_url_signs_original_content_type():
     assert out["key"].endswith(".jpg")  # extension from the normalized type
 
 
-@pytest.mark.asyncio
 async def test_add_attachment_pdf_classified_as_file():
     service, _, _ = _wire_service(
         _echo_row(),
@@ -326,7 +314,6 @@ async def test_add_attachment_pdf_classified_as_file():
 # --------------------------------------------------------------------------- #
 # remove_attachment (edit a draft)
 # --------------------------------------------------------------------------- #
-@pytest.mark.asyncio
 async def test_remove_attachment_recomputes_legacy_fields():
     atts = [
         Attachment(
@@ -359,7 +346,6 @@ async def test_remove_attachment_recomputes_legacy_fields():
     assert len(persisted["attachments"]) == 1
 
 
-@pytest.mark.asyncio
 async def test_remove_attachment_draft_only():
     from src.app.core.exceptions import ValidationError
 
@@ -374,7 +360,6 @@ async def test_remove_attachment_draft_only():
         await service.remove_attachment("echo-1", "user-1", "a1")
 
 
-@pytest.mark.asyncio
 async def test_remove_attachment_owner_and_missing_rejected():
     from src.app.core.exceptions import NotFoundError
 
@@ -8,9 +8,6 @@ from src.app.models.echo_loop_state import EchoLoopState
 from src.app.repositories.echo_loop_state_repo import EchoLoopStateRepo
 from tests._fakes.fake_dynamodb import FakeAioSession, FakeTable
 
-pytestmark = pytest.mark.asyncio
-
-
 TABLE_NAME = "mc_echo_loop_state-test"
 
 
@@ -14,7 +14,6 @@ from src.app.models.echo import Echo, EchoStatus, EchoType
 from src.app.services.echo_service import EchoService
 
 
-@pytest.mark.asyncio
 async def test_can_attach_media_to_released_echo():
     """Test that media_url can be attached to a RELEASED echo (first-time only)."""
     # Create a RELEASED echo without media
@@ -61,7 +60,6 @@ async def test_can_attach_media_to_released_echo():
             mock_table.put_item.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_can_attach_media_and_echo_type_to_released_echo():
     """Test that media_url and echo_type can be updated together on RELEASED echo."""
     released_echo = Echo(
@@ -105,7 +103,6 @@ async def test_can_attach_media_and_echo_type_to_released_echo():
             mock_table.put_item.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_cannot_update_other_fields_on_released_echo():
     """Test that non-media fields cannot be updated on RELEASED echo."""
     released_echo = Echo(
@@ -133,7 +130,6 @@ async def test_cannot_update_other_fields_on_released_echo():
             )
 
 
-@pytest.mark.asyncio
 async def test_cannot_attach_media_twice():
     """Test that media cannot be replaced on a RELEASED echo that already has media."""
     released_echo = Echo(
@@ -161,7 +157,6 @@ async def test_cannot_attach_media_twice():
             )
 
 
-@pytest.mark.asyncio
 async def test_cannot_update_media_with_other_fields_on_released_echo():
     """Test that media + other field updates are rejected on RELEASED echo."""
     released_echo = Echo(
@@ -192,7 +187,6 @@ async def test_cannot_update_media_with_other_fields_on_released_echo():
             )
 
 
-@pytest.mark.asyncio
 async def test_draft_echo_can_be_updated_freely():
     """Test that DRAFT echoes can still be updated normally."""
     draft_echo = Echo(
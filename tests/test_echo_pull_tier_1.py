@@ -13,8 +13,6 @@ Covers:
 
 from unittest.mock import AsyncMock, MagicMock, patch
 
-import pytest
-
 from src.app.models.echo import Echo, EchoStatus, EchoType, Recipient
 from src.app.services.echo_service import EchoService
 
@@ -23,7 +21,6 @@ from src.app.services.echo_service import EchoService
 # ----------------------------------------------------------------------
 
 
-@pytest.mark.asyncio
 async def test_sign_profile_urls_signs_each_distinct_url_once():
     """Three distinct URLs → three sign calls; five duplicates → still three."""
     svc = EchoService()
@@ -48,41 +45,38 @@ async def test_sign_profile_urls_signs_each_distinct_url_once():
         assert signed == f"signed::{orig}"
 
 
-@pytest.mark.asyncio
 async def test_sign_profile_urls_handles_empty_set():
     svc = EchoService()
     assert await svc._sign_profile_urls(set()) == {}
     assert await svc._sign_profile_urls(frozenset()) == {}
 
 
-@pytest.mark.asyncio
 async def test_sign_profile_urls_runs_in_parallel():
     """Confirm gather is doing real fan-out, not sequential awaits.
 
-    Each fake sign sleeps 50ms. Five distinct URLs serial = 250 ms;
-    parallel = ~50 ms. Allow generous headroom for CI jitter.
+    Each fake sign waits until all five are in flight. Under gather that
+    is immediate; sequential awaits would stall the first sign until the
+    timeout fires.
     """
     import asyncio
-    import time
 
     svc = EchoService()
+    urls = {f"https://b.s3.amazonaws.com/p/u{i}.jpg" for i in range(5)}
+    in_flight = 0
+    all_in_flight = asyncio.Event()
 
     async def slow_sign(url):
-        await asyncio.sleep(0.05)
+        nonlocal in_flight
+        in_flight += 1
+        if in_flight == len(urls):
+            all_in_flight.set()
+        await asyncio.wait_for(all_in_flight.wait(), timeout=1)
         return f"signed::{url}"
 
-    urls = {f"https://b.s3.amazonaws.com/p/u{i}.jpg" for i in range(5)}
-
     with patch.object(svc, "_sign_profile_url", side_effect=slow_sign):
-        t0 = time.monotonic()
         result = await svc._sign_profile_urls(urls)
-        elapsed = time.monotonic() - t0
 
-    assert len(result) == 5
-    # Serial would be ~0.25s; parallel must be well under that.
-    assert (
-        elapsed < 0.18
-    ), f"_sign_profile_urls did not fan out (elapsed={elapsed:.2f}s)"
+    assert result == {u: f"signed::{u}" for u in urls}
 
 
 # ----------------------------------------------------------------------
@@ -90,7 +84,6 @@ async def test_sign_profile_urls_runs_in_parallel():
 # ----------------------------------------------------------------------
 
 
-@pytest.mark.asyncio
 async def test_sign_media_url_uses_six_hour_ttl():
     """1h was too short; users came back to 403s after locking their phone."""
     svc = EchoService()
@@ -117,7 +110,6 @@ async def test_sign_media_url_uses_six_hour_ttl():
 # ----------------------------------------------------------------------
 
 
-@pytest.mark.asyncio
 async def test_get_user_echoes_does_not_sign_media_url():
     """Vault list response omits media_url; signing it was dead work."""
     svc = EchoService()
@@ -166,7 +158,6 @@ async def test_get_user_echoes_does_not_sign_media_url():
 # ----------------------------------------------------------------------
 
 
-@pytest.mark.asyncio
 async def test_enrich_dedupes_profile_url_signs_across_repeated_recipients():
     """Five echoes sharing two recipients → only 2 profile-URL signs."""
     svc = EchoService()
@@ -216,7 +207,6 @@ async def test_enrich_dedupes_profile_url_signs_across_repeated_recipients():
         assert signed.startswith("signed::")
 
 
-@pytest.mark.asyncio
 async def test_enrich_drops_non_owner_recipients_before_signing():
     """Defense-in-depth: a misconfigured GSI could return a recipient owned by
     someone else. We must not sign or attach those — they'd leak the
@@ -13,8 +13,6 @@ os.environ.setdefault("SHARE_BASE_URL", "https://api.test")
 
 from unittest.mock import AsyncMock, MagicMock, patch  # noqa: E402
 
-import pytest  # noqa: E402
-
 from src.app.api import share_routes  # noqa: E402
 from src.app.core.share_token import (  # noqa: E402
     build_share_url,
@@ -68,7 +66,6 @@ def test_build_share_url():
 # --------------------------------------------------------------------------- #
 # get_shared_echo
 # --------------------------------------------------------------------------- #
-@pytest.mark.asyncio
 async def test_get_shared_echo_released_recipient_match():
     echo = Echo(
         echo_id="e1",
@@ -82,7 +79,6 @@ async def test_get_shared_echo_released_recipient_match():
     assert got and got.content == "hi"
 
 
-@pytest.mark.asyncio
 async def test_get_shared_echo_rejects_wrong_recipient_and_draft():
     released = Echo(echo_id="e1", recipient_id="r1", status=EchoStatus.RELEASED)
     svc = _svc_with_echo(released.to_dynamodb_item())
@@ -96,7 +92,6 @@ async def test_get_shared_echo_rejects_wrong_recipient_and_draft():
 # --------------------------------------------------------------------------- #
 # presign_shared_attachment
 # --------------------------------------------------------------------------- #
-@pytest.mark.asyncio
 async def test_presign_shared_attachment_view_and_download():
     echo = Echo(
         echo_id="e1",
@@ -130,7 +125,6 @@ async def test_presign_shared_attachment_view_and_download():
     )
 
 
-@pytest.mark.asyncio
 async def test_presign_shared_attachment_primary_legacy():
     echo = Echo(
         echo_id="e1",
@@ -150,7 +144,6 @@ async def test_presign_shared_attachment_primary_legacy():
 # --------------------------------------------------------------------------- #
 # Routes
 # --------------------------------------------------------------------------- #
-@pytest.mark.asyncio
 async def test_viewer_route_renders_message_and_attachments():
     echo = Echo(
         echo_id="e1",
@@ -191,7 +184,6 @@ def test_format_date_ordinals_and_bad_input():
     assert share_routes._format_date("not-a-date") == ""
 
 
-@pytest.mark.asyncio
 async def test_viewer_matches_branding_and_plays_every_media_type_in_page():
     """Image, video and audio all render as inline, in-page players (not just
     links), each with a download affordance, inside the branded 7539:4157 shell."""
@@ -268,7 +260,6 @@ async def test_viewer_matches_branding_and_plays_every_media_type_in_page():
     assert "fonts.googleapis.com" in csp and "fonts.gstatic.com" in csp
 
 
-@pytest.mark.asyncio
 async def test_viewer_csp_overrides_strict_global_default():
     """Sanity: the viewer response carries a permissive, media-friendly CSP
     (not the global `default-src 'self'`) so the browser loads S3 media."""
@@ -292,13 +283,11 @@ async def test_viewer_csp_overrides_strict_global_default():
     assert "media-src" in err.headers["content-security-policy"]
 
 
-@pytest.mark.asyncio
 async def test_viewer_route_bad_token():
     resp = await share_routes.shared_echo_viewer("e1", t="bad-token")
     assert resp.status_code == 403
 
 
-@pytest.mark.asyncio
 async def test_attachment_redirect_view_download_and_bad_token():
     tok = create_share_token("e1", "r1")
     with patch.object(
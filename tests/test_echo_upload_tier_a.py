@@ -73,7 +73,6 @@ def test_s3_kwargs_no_accelerate_for_falsey_values(monkeypatch, val):
 # ----------------------------------------------------------------------
 
 
-@pytest.mark.asyncio
 async def test_generate_upload_url_rejects_unknown_mime():
     svc = EchoService()
     with pytest.raises(ValidationError, match="Unsupported media type"):
@@ -84,7 +83,6 @@ async def test_generate_upload_url_rejects_unknown_mime():
         )
 
 
-@pytest.mark.asyncio
 async def test_generate_upload_url_signs_with_cache_control_and_tags():
     svc = EchoService()
     fake_s3 = AsyncMock()
@@ -115,7 +113,6 @@ async def test_generate_upload_url_signs_with_cache_control_and_tags():
     assert result["upload_url"] == "https://signed.example/"
 
 
-@pytest.mark.asyncio
 async def test_generate_upload_url_accepts_all_allowlisted_types():
     """Every MIME on the allowlist signs without error."""
     svc = EchoService()
@@ -161,7 +158,6 @@ def test_looks_like_presigned_url_handles_none():
     assert _looks_like_presigned_url("") is False
 
 
-@pytest.mark.asyncio
 async def test_update_echo_rejects_presigned_media_url():
     draft = Echo(
         echo_id="echo-1",
@@ -186,7 +182,6 @@ async def test_update_echo_rejects_presigned_media_url():
             )
 
 
-@pytest.mark.asyncio
 async def test_update_echo_accepts_canonical_media_url():
     draft = Echo(
         echo_id="echo-1",
@@ -236,7 +231,6 @@ def _make_echo(echo_id: str = "echo-1", user_id: str = "u-1") -> Echo:
     )
 
 
-@pytest.mark.asyncio
 async def test_finalize_upload_rejects_cross_tenant_key():
     """Caller cannot bind an object outside their namespace to their echo."""
     svc = EchoService()
@@ -250,7 +244,6 @@ async def test_finalize_upload_rejects_cross_tenant_key():
             )
 
 
-@pytest.mark.asyncio
 async def test_finalize_upload_rejects_cross_echo_key():
     """Caller cannot bind a key uploaded for echo-A to echo-B."""
     svc = EchoService()
@@ -264,7 +257,6 @@ async def test_finalize_upload_rejects_cross_echo_key():
             )
 
 
-@pytest.mark.asyncio
 async def test_finalize_upload_rejects_recipient_caller():
     """Recipient of an echo cannot finalize media on it — only owner can.
 
@@ -285,7 +277,6 @@ async def test_finalize_upload_rejects_recipient_caller():
             )
 
 
-@pytest.mark.asyncio
 async def test_finalize_upload_rejects_when_media_already_attached():
     """First-write semantics: re-finalize is not allowed."""
     svc = EchoService()
@@ -300,7 +291,6 @@ async def test_finalize_upload_rejects_when_media_already_attached():
             )
 
 
-@pytest.mark.asyncio
 async def test_finalize_upload_rejects_when_echo_missing():
     svc = EchoService()
     with patch.object(svc, "get_echo", new=AsyncMock(return_value=None)):
@@ -312,7 +302,6 @@ async def test_finalize_upload_rejects_when_echo_missing():
             )
 
 
-@pytest.mark.asyncio
 async def test_finalize_upload_rejects_when_object_missing_in_s3():
     svc = EchoService()
     echo = _make_echo()
@@ -332,7 +321,6 @@ async def test_finalize_upload_rejects_when_object_missing_in_s3():
                 )
 
 
-@pytest.mark.asyncio
 async def test_finalize_upload_persists_canonical_url_and_type():
     """HeadObject truth wins over caller's content_type hint."""
     svc = EchoService()
@@ -368,7 +356,6 @@ async def test_finalize_upload_persists_canonical_url_and_type():
     table.put_item.assert_awaited_once()
 
 
-@pytest.mark.asyncio
 async def test_finalize_upload_sets_audio_type_from_head():
     """An audio MIME from HEAD updates echo_type to AUDIO."""
     svc = EchoService()
@@ -395,7 +382,6 @@ async def test_finalize_upload_sets_audio_type_from_head():
     assert result.echo_type == EchoType.AUDIO
 
 
-@pytest.mark.asyncio
 async def test_finalize_upload_maps_403_to_internal_error_without_leaking():
     """403 / AccessDenied is logged as IAM/KMS gap but surfaces a generic error.
 
@@ -430,7 +416,6 @@ async def test_finalize_upload_maps_403_to_internal_error_without_leaking():
 # ----------------------------------------------------------------------
 
 
-@pytest.mark.asyncio
 async def test_generate_upload_url_uses_mp3_extension_for_audio_mpeg():
     """audio/mpeg must map to .mp3, not .m4a — fixed in PR1."""
     svc = EchoService()
@@ -445,7 +430,6 @@ async def test_generate_upload_url_uses_mp3_extension_for_audio_mpeg():
     assert result["key"].endswith(".mp3"), result["key"]
 
 
-@pytest.mark.asyncio
 async def test_generate_upload_url_uses_aac_extension_for_audio_aac():
     svc = EchoService()
     fake_s3 = AsyncMock()
@@ -464,7 +448,6 @@ async def test_generate_upload_url_uses_aac_extension_for_audio_aac():
 # ----------------------------------------------------------------------
 
 
-@pytest.mark.asyncio
 async def test_generate_upload_url_rejects_unknown_upload_type():
     """Service-level guard against tag-injection via upload_type."""
     svc = EchoService()
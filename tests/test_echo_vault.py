@@ -168,7 +168,6 @@ class TestEchoServiceCreateEcho:
     DynamoDB is mocked; we verify the Echo object that is persisted.
     """
 
-    @pytest.mark.asyncio
     async def test_create_echo_saves_guardian_id(self):
         """B-02: create_echo must persist guardian_id from the request data."""
         from src.app.services.echo_service import EchoService
@@ -211,7 +210,6 @@ class TestEchoServiceCreateEcho:
             captured_items[0].get("guardian_id") == "g-001"
         ), "The DynamoDB item must contain guardian_id"
 
-    @pytest.mark.asyncio
     async def test_create_echo_without_guardian_id_leaves_it_none(self):
         """create_echo without guardian_id in data must leave guardian_id as None."""
         from src.app.services.echo_service import EchoService
@@ -240,7 +238,6 @@ class TestEchoServiceCreateEcho:
 
         assert echo.guardian_id is None
 
-    @pytest.mark.asyncio
     async def test_create_echo_saves_recipient_id(self):
         """Regression: create_echo must still persist recipient_id correctly."""
         from src.app.services.echo_service import EchoService
@@ -270,7 +267,6 @@ class TestEchoServiceCreateEcho:
 
         assert echo.recipient_id == "r-999"
 
-    @pytest.mark.asyncio
     async def test_create_echo_with_null_guardian_id_in_data(self):
         """create_echo with explicit None guardian_id must not set guardian_id."""
         from src.app.services.echo_service import EchoService
@@ -309,7 +305,6 @@ class TestEchoServiceCreateEcho:
 class TestEchoServiceAutoRelease:
     """Test automatic echo release logic during creation."""
 
-    @pytest.mark.asyncio
     async def test_create_echo_with_recipient_no_guardian_no_date_auto_releases(self):
         """Echo with recipient, no guardian, no release_date should auto-release immediately."""
         from src.app.models.echo import EchoStatus, Recipient
@@ -358,7 +353,6 @@ class TestEchoServiceAutoRelease:
         assert echo.status == EchoStatus.RELEASED
         assert mock_table.update_item.call_count == 1
 
-    @pytest.mark.asyncio
     async def test_create_echo_with_past_release_date_auto_releases(self):
         """Echo with release_date in the past should auto-release immediately."""
         from datetime import datetime, timedelta, timezone
@@ -413,7 +407,6 @@ class TestEchoServiceAutoRelease:
         assert echo.status == EchoStatus.RELEASED
         assert mock_table.update_item.call_count == 1
 
-    @pytest.mark.asyncio
     async def test_create_echo_with_future_release_date_stays_draft(self):
         """Echo with release_date in the future should stay DRAFT."""
         from datetime import datetime, timedelta, timezone
@@ -457,7 +450,6 @@ class TestEchoServiceAutoRelease:
         # Should NOT call update_item for status change
         assert mock_table.update_item.call_count == 0
 
-    @pytest.mark.asyncio
     async def test_create_echo_with_guardian_never_auto_releases(self):
         """Echo with guardian_id should never auto-release, regardless of date."""
         from src.app.models.echo import EchoStatus
@@ -545,7 +537,6 @@ class TestEchoServiceUpdateEchoReleaseDate:
             service.session, "resource", return_value=mock_resource_ctx
         )
 
-    @pytest.mark.asyncio
     async def test_update_echo_sets_release_date_on_draft(self):
         """A future release_date in the payload is persisted onto the echo."""
         from datetime import datetime, timedelta, timezone
@@ -574,7 +565,6 @@ class TestEchoServiceUpdateEchoReleaseDate:
         persisted = mock_table.put_item.call_args.kwargs["Item"]
         assert persisted["release_date"] == future_date
 
-    @pytest.mark.asyncio
     async def test_update_echo_clears_release_date_when_explicit_none(self):
         """Passing release_date=None on an already-scheduled echo clears it."""
         from datetime import datetime, timedelta, timezone
@@ -603,7 +593,6 @@ class TestEchoServiceUpdateEchoReleaseDate:
         persisted = mock_table.put_item.call_args.kwargs["Item"]
         assert "release_date" not in persisted
 
-    @pytest.mark.asyncio
     async def test_update_echo_leaves_release_date_unchanged_when_omitted(self):
         """If `release_date` is not in the payload, the stored value stays put."""
         from datetime import datetime, timedelta, timezone
@@ -678,7 +667,6 @@ class TestEchoServiceReleaseEcho:
             email="alice@example.com",
         )
 
-    @pytest.mark.asyncio
     async def test_release_echo_transitions_status_to_released(self):
         """release_echo must call echo.release() and return a RELEASED echo."""
         from src.app.models.echo import EchoStatus
@@ -719,7 +707,6 @@ class TestEchoServiceReleaseEcho:
 
         assert released_echo.status == EchoStatus.RELEASED
 
-    @pytest.mark.asyncio
     async def test_release_echo_fires_send_echo_notification(self):
         """release_echo must call email_service.send_echo_notification exactly once."""
         from src.app.services.echo_service import EchoService
@@ -754,7 +741,6 @@ class TestEchoServiceReleaseEcho:
 
         mock_send.assert_awaited_once()
 
-    @pytest.mark.asyncio
     async def test_release_echo_passes_correct_args_to_notification(self):
         """release_echo must pass recipient email, name, echo title etc. to the email."""
         from src.app.services.echo_service import EchoService
@@ -808,7 +794,6 @@ class TestEchoServiceReleaseEcho:
         assert all_args.get("recipient_email") == "alice@example.com"
         assert all_args.get("echo_title") == "Test Echo"
 
-    @pytest.mark.asyncio
     async def test_release_echo_raises_not_found_when_echo_missing(self):
         """release_echo must raise NotFoundError when the echo does not exist."""
         from src.app.core.exceptions import NotFoundError
@@ -825,7 +810,6 @@ class TestEchoServiceReleaseEcho:
             with pytest.raises(NotFoundError):
                 await service.release_echo(echo_id="does-not-exist", user_id="u-001")
 
-    @pytest.mark.asyncio
     async def test_release_echo_raises_validation_error_when_no_recipient(self):
         """release_echo must raise ValidationError when echo has no recipient_id."""
         from src.app.core.exceptions import ValidationError
@@ -840,7 +824,6 @@ class TestEchoServiceReleaseEcho:
             with pytest.raises(ValidationError, match="recipient"):
                 await service.release_echo(echo_id="e-abc-123", user_id="u-001")
 
-    @pytest.mark.asyncio
     async def test_release_echo_raises_validation_error_when_guardian_set(self):
         """
         release_echo must raise ValidationError when echo has a guardian_id.
@@ -858,7 +841,6 @@ class TestEchoServiceReleaseEcho:
             with pytest.raises(ValidationError, match="guardian"):
                 await service.release_echo(echo_id="e-abc-123", user_id="u-001")
 
-    @pytest.mark.asyncio
     async def test_release_echo_raises_validation_error_when_already_released(self):
         """release_echo must raise ValidationError when echo is already RELEASED."""
         from src.app.core.exceptions import ValidationError
@@ -873,7 +855,6 @@ class TestEchoServiceReleaseEcho:
             with pytest.raises(ValidationError, match="[Aa]lready released"):
                 await service.release_echo(echo_id="e-abc-123", user_id="u-001")
 
-    @pytest.mark.asyncio
     async def test_release_echo_raises_validation_error_when_locked(self):
         """
         release_echo must raise ValidationError when echo is LOCKED.
@@ -891,7 +872,6 @@ class TestEchoServiceReleaseEcho:
             with pytest.raises(ValidationError, match="[Ll]ocked"):
                 await service.release_echo(echo_id="e-abc-123", user_id="u-001")
 
-    @pytest.mark.asyncio
     async def test_release_echo_persists_to_dynamodb(self):
         """release_echo must write the updated echo back to DynamoDB."""
         from src.app.services.echo_service import EchoService
@@ -928,7 +908,6 @@ class TestEchoServiceReleaseEcho:
         assert len(put_calls) == 1
         assert put_calls[0]["status"] == "RELEASED"
 
-    @pytest.mark.asyncio
     async def test_release_echo_email_failure_does_not_raise(self):
         """
         A failed email send must not bubble up as an exception (fire-and-forget).
@@ -1055,7 +1034,6 @@ class TestEchoServiceReleaseDueEchoes:
             service.session, "resource", return_value=mock_resource_ctx
         )
 
-    @pytest.mark.asyncio
     async def test_release_due_echoes_releases_each_match(self):
         """Every scanned row gets a release_echo call with its own owner id."""
         from src.app.services.echo_service import EchoService
@@ -1094,7 +1072,6 @@ class TestEchoServiceReleaseDueEchoes:
         assert result["failed"] == 0
         assert result["skipped"] == 0
 
-    @pytest.mark.asyncio
     async def test_release_due_echoes_rescues_stranded_instant_draft(self):
         """A DRAFT with a recipient but no release_date (stranded instant echo,
         e.g. app force-quit between upload and release) is still released."""
@@ -1124,7 +1101,6 @@ class TestEchoServiceReleaseDueEchoes:
         release_mock.assert_any_await("e-instant", "u-9")
         assert result["released"] == 1
 
-    @pytest.mark.asyncio
     async def test_release_due_echoes_skips_guardian_locked_rows(self):
         """Rows with a guardian_id go through the guardian flow, not this one."""
         from src.app.services.echo_service import EchoService
@@ -1153,7 +1129,6 @@ class TestEchoServiceReleaseDueEchoes:
         assert result["skipped"] == 1
         assert result["released"] == 0
 
-    @pytest.mark.asyncio
     async def test_release_due_echoes_skips_rows_without_recipient(self):
         """Echoes without a recipient_id cannot be released — skip cleanly."""
         from src.app.services.echo_service import EchoService
@@ -1180,7 +1155,6 @@ class TestEchoServiceReleaseDueEchoes:
         assert result["skipped"] == 1
         assert result["released"] == 0
 
-    @pytest.mark.asyncio
     async def test_release_due_echoes_continues_past_per_echo_failure(self):
         """One bad echo must not stop the batch; failure is counted + logged."""
         from src.app.services.echo_service import EchoService
@@ -1221,7 +1195,6 @@ class TestEchoServiceReleaseDueEchoes:
         assert len(result["errors"]) == 1
         assert "e-bad" in result["errors"][0]
 
-    @pytest.mark.asyncio
     async def test_release_due_echoes_paginates_through_scan_results(self):
         """Multi-page scans (DynamoDB LastEvaluatedKey) loop until exhausted."""
         from src.app.services.echo_service import EchoService
@@ -1576,7 +1549,6 @@ class TestEchoServiceLockEcho:
             trigger=GuardianTrigger.MANUAL,
         )
 
-    @pytest.mark.asyncio
     async def test_lock_echo_transitions_status_to_locked(self):
         """lock_echo must call echo.lock() and return a LOCKED echo."""
         from src.app.models.echo import EchoStatus
@@ -1612,7 +1584,6 @@ class TestEchoServiceLockEcho:
 
         assert locked_echo.status == EchoStatus.LOCKED
 
-    @pytest.mark.asyncio
     async def test_lock_echo_sets_lock_date(self):
         """lock_echo must populate the lock_date field."""
         from src.app.services.echo_service import EchoService
@@ -1644,7 +1615,6 @@ class TestEchoServiceLockEcho:
 
         assert locked_echo.lock_date is not None
 
-    @pytest.mark.asyncio
     async def test_lock_echo_does_not_send_email(self):
         """Echo-only email policy: lock_echo must NOT send any guardian email."""
         from src.app.services.echo_service import EchoService
@@ -1680,7 +1650,6 @@ class TestEchoServiceLockEcho:
         mock_send.assert_not_called()
         assert not hasattr(email_service, "send_echo_pending_notification")
 
-    @pytest.mark.asyncio
     async def test_lock_echo_raises_not_found_when_echo_missing(self):
         """lock_echo raises NotFoundError when echo doesn't exist."""
         from src.app.core.exceptions import NotFoundError
@@ -1697,7 +1666,6 @@ class TestEchoServiceLockEcho:
             with pytest.raises(NotFoundError):
                 await service.lock_echo(echo_id="missing", user_id="u-001")
 
-    @pytest.mark.asyncio
     async def test_lock_echo_raises_validation_error_when_no_guardian(self):
         """lock_echo raises ValidationError when echo has no guardian_id."""
         from src.app.core.exceptions import ValidationError
@@ -1712,7 +1680,6 @@ class TestEchoServiceLockEcho:
             with pytest.raises(ValidationError, match="no guardian"):
                 await service.lock_echo(echo_id="e-abc-123", user_id="u-001")
 
-    @pytest.mark.asyncio
     async def test_lock_echo_raises_validation_error_when_already_locked(self):
         """lock_echo raises ValidationError when echo is already LOCKED."""
         from src.app.core.exceptions import ValidationError
@@ -1727,7 +1694,6 @@ class TestEchoServiceLockEcho:
             with pytest.raises(ValidationError, match="already locked"):
                 await service.lock_echo(echo_id="e-abc-123", user_id="u-001")
 
-    @pytest.mark.asyncio
     async def test_lock_echo_raises_validation_error_when_released(self):
         """lock_echo raises ValidationError when echo is already RELEASED."""
         from src.app.core.exceptions import ValidationError
@@ -1862,7 +1828,6 @@ class TestLockEchoEndpoint:
 class TestRecipientUserIdLinking:
     """Test suite for recipient_user_id linking functionality."""
 
-    @pytest.mark.asyncio
     async def test_create_recipient_links_to_existing_user(self):
         """create_recipient should link to existing user when email matches."""
         from src.app.models.user_profile import UserProfile
@@ -1917,7 +1882,6 @@ class TestRecipientUserIdLinking:
         assert len(captured_items) == 1
         assert captured_items[0]["recipient_user_id"] == "user-123"
 
-    @pytest.mark.asyncio
     async def test_create_recipient_no_link_when_user_not_found(self):
         """create_recipient should set recipient_user_id=None when user doesn't exist."""
         from src.app.services.echo_service import EchoService
@@ -1963,7 +1927,6 @@ class TestRecipientUserIdLinking:
         assert len(captured_items) == 1
         assert "recipient_user_id" not in captured_items[0]
 
-    @pytest.mark.asyncio
     async def test_get_received_echoes_uses_recipient_user_id_index(self):
         """get_received_echoes should look up recipients by recipient-user-id-index."""
         from src.app.models.echo import EchoStatus
@@ -2042,7 +2005,6 @@ class TestRecipientUserIdLinking:
             == "RELEASED"
         )
 
-    @pytest.mark.asyncio
     async def test_get_received_echoes_returns_empty_when_not_linked(self):
         """get_received_echoes returns [] when no recipient row links to user_id."""
         from src.app.services.echo_service import EchoService
@@ -2066,7 +2028,6 @@ class TestRecipientUserIdLinking:
         assert next_cursor is None
         assert mock_recipients_table.query.call_count == 1
 
-    @pytest.mark.asyncio
     async def test_get_received_echoes_skips_soft_deleted_recipient_rows(self):
         """Soft-deleted recipient rows must not contribute to the inbox."""
         from src.app.services.echo_service import EchoService
@@ -2100,7 +2061,6 @@ class TestRecipientUserIdLinking:
         assert echoes == []
         assert next_cursor is None
 
-    @pytest.mark.asyncio
     async def test_get_received_echoes_requires_user_id(self):
         """Empty user_id must raise ValidationError, not silently return []."""
         from src.app.core.exceptions import ValidationError
@@ -2111,7 +2071,6 @@ class TestRecipientUserIdLinking:
         with pytest.raises(ValidationError):
             await service.get_received_echoes(user_id="")
 
-    @pytest.mark.asyncio
     async def test_link_user_to_recipients_patches_unlinked_rows(self):
         """link_user_to_recipients sets recipient_user_id on unlinked rows."""
         from src.app.services.echo_service import EchoService
@@ -2171,7 +2130,6 @@ class TestRecipientUserIdLinking:
             == "new@example.com"
         )
 
-    @pytest.mark.asyncio
     async def test_link_user_to_recipients_handles_empty_inputs(self):
         """Empty user_id or email returns 0 without touching DynamoDB."""
         from src.app.services.echo_service import EchoService
@@ -2204,7 +2162,6 @@ class TestEchoServicePerformanceRefactor:
        multiple service-method calls.
     """
 
-    @pytest.mark.asyncio
     async def test_get_received_echoes_truncates_to_limit(self):
         """50 recipients × 3 echoes each must be clamped to ``limit=20``.
 
@@ -2285,16 +2242,14 @@ class TestEchoServicePerformanceRefactor:
         # All per-recipient queries fanned out (50 calls).
         assert mock_echoes_table.query.call_count == 50
 
-    @pytest.mark.asyncio
     async def test_get_received_echoes_parallelizes_per_recipient_query(self):
         """The per-recipient queries must run concurrently, not serially.
 
-        Wall-clock test: each per-recipient Query sleeps 100 ms. With 5
-        recipients, serial would be ~500 ms. Parallel via asyncio.gather
-        completes in ~100 ms (one sleep, not five).
+        Each per-recipient Query waits until all 5 are in flight. Under
+        asyncio.gather that is immediate; serial awaits would stall the
+        first Query until the timeout fires.
         """
         import asyncio
-        import time
 
         from src.app.services.echo_service import EchoService
 
@@ -2317,8 +2272,15 @@ class TestEchoServicePerformanceRefactor:
             "LastEvaluatedKey": None,
         }
 
+        in_flight = 0
+        all_in_flight = asyncio.Event()
+
         async def slow_query(**kwargs):
-            await asyncio.sleep(0.1)
+            nonlocal in_flight
+            in_flight += 1
+            if in_flight == len(recipient_rows):
+                all_in_flight.set()
+            await asyncio.wait_for(all_in_flight.wait(), timeout=1)
             return {"Items": [], "LastEvaluatedKey": None}
 
         mock_echoes_table = AsyncMock()
@@ -2337,17 +2299,12 @@ class TestEchoServicePerformanceRefactor:
         with patch.object(
             service, "_get_dynamodb_resource", AsyncMock(return_value=stub_resource)
         ):
-            start = time.monotonic()
             echoes, _ = await service.get_received_echoes(user_id="user-1")
-            elapsed = time.monotonic() - start
 
-        # Serial would be 5 × 100 ms = 500 ms. Parallel should be << 300 ms
-        # (one sleep + overhead). Generous bound to avoid CI flake.
-        assert elapsed < 0.3, f"Expected parallel fan-out; got {elapsed:.3f}s"
+        assert all_in_flight.is_set(), "Expected parallel fan-out"
         assert echoes == []
         assert mock_echoes_table.query.call_count == 5
 
-    @pytest.mark.asyncio
     async def test_get_user_echoes_uses_batch_get_item(self):
         """30 distinct recipient_ids across 50 echoes must collapse to one
         BatchGetItem call (single chunk; chunk size cap is 100)."""
@@ -2421,7 +2378,6 @@ class TestEchoServicePerformanceRefactor:
         request_items = stub_resource.batch_get_item.call_args.kwargs["RequestItems"]
         assert len(request_items[service.recipients_table]["Keys"]) == 30
 
-    @pytest.mark.asyncio
     async def test_pagination_encodes_cursor_from_last_evaluated_key(self):
         """When DDB returns LastEvaluatedKey, the service must surface it
         as a base64-encoded next_cursor string."""
@@ -2455,7 +2411,6 @@ class TestEchoServicePerformanceRefactor:
         decoded = json.loads(base64.urlsafe_b64decode(next_cursor.encode("ascii")))
         assert decoded == last_key
 
-    @pytest.mark.asyncio
     async def test_pagination_decodes_cursor_to_exclusive_start_key(self):
         """A client-supplied cursor must round-trip into the Query's
         ExclusiveStartKey."""
@@ -2488,7 +2443,6 @@ class TestEchoServicePerformanceRefactor:
         call_kwargs = mock_echoes_table.query.call_args.kwargs
         assert call_kwargs.get("ExclusiveStartKey") == original_key
 
-    @pytest.mark.asyncio
     async def test_long_lived_resource_entered_exactly_once_per_service(self):
         """Three back-to-back method calls on a single EchoService instance
         must enter the aioboto3 resource context-manager exactly once. This
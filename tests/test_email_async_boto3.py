@@ -9,8 +9,6 @@ burst email traffic doesn't saturate the default 10-connection pool.
 
 from unittest.mock import AsyncMock, MagicMock, patch
 
-import pytest
-
 
 def test_ses_client_config_has_max_pool_connections():
     """The module-level _SES_CLIENT_CONFIG must be tuned.
@@ -38,7 +36,6 @@ def test_ses_client_config_has_max_pool_connections():
     )
 
 
-@pytest.mark.asyncio
 async def test_send_email_passes_config_to_session_client():
     """
     _send_email must construct the SES client with the tuned config so the
@@ -89,7 +86,6 @@ def _mock_ses_cm(send_email_mock):
     return cm
 
 
-@pytest.mark.asyncio
 async def test_send_email_masks_recipient_on_success(caplog):
     """The recipient address must be masked in the success log line (no PII)."""
     import logging
@@ -114,7 +110,6 @@ async def test_send_email_masks_recipient_on_success(caplog):
     assert "j***@example.com" in logs
 
 
-@pytest.mark.asyncio
 async def test_send_email_masks_recipient_on_error(caplog):
     """The recipient address must be masked in the error log line too."""
     import logging
@@ -72,7 +72,6 @@ def test_split_paragraphs():
 # --------------------------------------------------------------------------- #
 # Rendering
 # --------------------------------------------------------------------------- #
-@pytest.mark.asyncio
 @pytest.mark.parametrize("echo_type", ["AUDIO", "VIDEO", "TEXT", "", "anything"])
 async def test_renders_generic_template_for_every_type(echo_type):
     """One generic template renders identically regardless of echo_type."""
@@ -113,7 +112,6 @@ async def test_renders_generic_template_for_every_type(echo_type):
     assert len(out["text"]) > 80
 
 
-@pytest.mark.asyncio
 async def test_quote_is_autoescaped():
     """Sender-authored quote must be HTML-escaped (injection guard)."""
     service, captured = _service_with_capture()
@@ -130,7 +128,6 @@ async def test_quote_is_autoescaped():
     assert "&lt;script&gt;" in html and "&amp; friends" in html
 
 
-@pytest.mark.asyncio
 async def test_sender_cover_note_renders_in_quote_card():
     """The sender's whole cover note renders inside the quote card."""
     service, captured = _service_with_capture()
@@ -146,7 +143,6 @@ async def test_sender_cover_note_renders_in_quote_card():
     assert "First paragraph. Second paragraph." in html
 
 
-@pytest.mark.asyncio
 async def test_render_failure_falls_back_to_inline_html():
     """A missing/broken template must not drop the notification."""
     service, captured = _service_with_capture()
@@ -169,7 +165,6 @@ async def test_render_failure_falls_back_to_inline_html():
     assert "{{" not in html
 
 
-@pytest.mark.asyncio
 async def test_send_echo_notification_registered_uses_generic_template():
     """The registered-recipient path delegates to the generic renderer and
     accepts (ignores) the spread media fields from build_email_media_fields."""
@@ -199,7 +194,6 @@ async def test_send_echo_notification_registered_uses_generic_template():
     assert "2:32" not in out["html"]
 
 
-@pytest.mark.asyncio
 async def test_default_quote_used_when_no_cover_note():
     """No sender quote → generic default boilerplate, never type-specific."""
     service, captured = _service_with_capture()
@@ -116,7 +116,6 @@ def _clear_profile_cache():
 # --------------------------------------------------------------------------- #
 # Scenario 1: JWT claims short-circuit — no Cognito call
 # --------------------------------------------------------------------------- #
-@pytest.mark.asyncio
 async def test_jwt_claims_short_circuit_skips_cognito():
     """If current_user has email + first/last name, we never call Cognito."""
     cognito = _make_cognito_service(get_user_return=_cognito_get_user_payload())
@@ -142,7 +141,6 @@ async def test_jwt_claims_short_circuit_skips_cognito():
 # --------------------------------------------------------------------------- #
 # Scenario 2: cache hit on the second call within TTL
 # --------------------------------------------------------------------------- #
-@pytest.mark.asyncio
 async def test_second_call_within_ttl_is_served_from_cache(monkeypatch):
     """First call hits Cognito; second call within TTL must not."""
     # Keep the default TTL but make sure we don't rely on env state.
@@ -178,7 +176,6 @@ async def test_second_call_within_ttl_is_served_from_cache(monkeypatch):
 # --------------------------------------------------------------------------- #
 # Scenario 3: cache expiry — Cognito is re-hit after the TTL elapses
 # --------------------------------------------------------------------------- #
-@pytest.mark.asyncio
 async def test_cache_expiry_triggers_cognito_refetch(monkeypatch):
     """Once the TTL elapses, the next call must hit Cognito again."""
     # Fake monotonic clock under our control.
@@ -217,7 +214,6 @@ async def test_cache_expiry_triggers_cognito_refetch(monkeypatch):
 # --------------------------------------------------------------------------- #
 # Scenario 4: fallback when both JWT claims and Cognito are unavailable
 # --------------------------------------------------------------------------- #
-@pytest.mark.asyncio
 async def test_fallback_when_jwt_missing_and_cognito_raises():
     """If JWT claims are empty AND Cognito raises, we get the fallback."""
     cognito = _make_cognito_service(
@@ -244,7 +240,6 @@ async def test_fallback_when_jwt_missing_and_cognito_raises():
 # --------------------------------------------------------------------------- #
 # Extra coverage: cache isolation between distinct subs
 # --------------------------------------------------------------------------- #
-@pytest.mark.asyncio
 async def test_cache_does_not_leak_between_users():
     """Two different subs must each get their own Cognito lookup + entry."""
 
@@ -2,12 +2,16 @@
 Test health endpoints
 """
 
+from typing import Any, Dict
+
+import pytest
 from fastapi.testclient import TestClient
 
 
-def test_basic_health(client: TestClient):
-    """Test basic health endpoint"""
-    response = client.get("/health")
+@pytest.mark.parametrize("path", ["/health", "/api/health"])
+def test_basic_health(client: TestClient, path: str):
+    """Test basic and API health endpoints"""
+    response = client.get(path)
     assert response.status_code == 200
 
     data = response.json()
@@ -16,67 +20,44 @@ def test_basic_health(client: TestClient):
     assert "timestamp" in data
 
 
-def test_api_health(client: TestClient):
-    """Test API health endpoint"""
-    response = client.get("/api/health")
-    assert response.status_code == 200
-
-    data = response.json()
-    assert data["status"] == "healthy"
-    assert data["service"] == "Mirror Collective Python API"
-    assert "timestamp" in data
+@pytest.fixture(scope="module")
+def detailed_health(client: TestClient) -> Dict[str, Any]:
+    """One /health/detailed round-trip shared by the checks below.
 
-
-def test_detailed_health(client: TestClient, mock_cognito_client, mock_openai_client):
-    """Test detailed health check with dependencies"""
+    The Cognito and OpenAI clients behind it are the conftest module-level
+    mocks, so the payload is the same for every test in this module.
+    """
     response = client.get("/health/detailed")
     assert response.status_code == 200
+    return response.json()
 
-    data = response.json()
-    assert "status" in data
-    assert "timestamp" in data
-    assert "checks" in data
-    assert "summary" in data
+
+def test_detailed_health(detailed_health: Dict[str, Any]):
+    """Test detailed health check with dependencies"""
+    data = detailed_health
+    assert {"status", "timestamp", "checks", "summary"} <= data.keys()
 
     # Check that we have the expected health checks
-    check_names = [check["name"] for check in data["checks"]]
-    assert "cognito" in check_names
-    assert "openai" in check_names
-    assert "database" in check_names
+    check_names = {check["name"] for check in data["checks"]}
+    assert {"cognito", "openai", "database"} <= check_names
 
     # Check summary structure
     summary = data["summary"]
-    assert "total_checks" in summary
-    assert "healthy_checks" in summary
-    assert "unhealthy_checks" in summary
+    assert {"total_checks", "healthy_checks", "unhealthy_checks"} <= summary.keys()
 
 
-def test_detailed_health_cognito_configured(client: TestClient, mock_cognito_client):
-    """Test detailed health shows Cognito as configured"""
-    response = client.get("/health/detailed")
-    assert response.status_code == 200
-
-    data = response.json()
-    cognito_check = next(
-        (check for check in data["checks"] if check["name"] == "cognito"), None
-    )
-
-    assert cognito_check is not None
-    assert cognito_check["details"]["configured"] is True
-
-
-def test_detailed_health_openai_configured(client: TestClient, mock_openai_client):
-    """Test detailed health shows OpenAI as configured"""
-    response = client.get("/health/detailed")
-    assert response.status_code == 200
-
-    data = response.json()
-    openai_check = next(
-        (check for check in data["checks"] if check["name"] == "openai"), None
+@pytest.mark.parametrize("name", ["cognito", "openai"])
+def test_detailed_health_dependency_configured(
+    detailed_health: Dict[str, Any], name: str
+):
+    """Test detailed health shows Cognito and OpenAI as configured"""
+    check = next(
+        (check for check in detailed_health["checks"] if check["name"] == name),
+        None,
     )
 
-    assert openai_check is not None
-    assert openai_check["details"]["configured"] is True
+    assert check is not None
+    assert check["details"]["configured"] is True
     # Only check api_key_present if it exists in the response
-    if "api_key_present" in openai_check["details"]:
-        assert openai_check["details"]["api_key_present"] is True
+    if "api_key_present" in check["details"]:
+        assert check["details"]["api_key_present"] is True
@@ -54,7 +54,6 @@ def test_build_namespace_includes_user_route_and_key():
 # ---------------------------------------------------------------------
 
 
-@pytest.mark.asyncio
 async def test_get_cached_miss_returns_none():
     svc = IdempotencyService()
     resource, _ = _ddb_resource_mock(get_item_return={})
@@ -63,7 +62,6 @@ async def test_get_cached_miss_returns_none():
     assert result is None
 
 
-@pytest.mark.asyncio
 async def test_get_cached_hit_returns_status_and_body():
     svc = IdempotencyService()
     future = int(time.time()) + 1000
@@ -82,7 +80,6 @@ async def test_get_cached_hit_returns_status_and_body():
     assert result == {"status_code": 200, "body": {"echo_id": "e-1"}}
 
 
-@pytest.mark.asyncio
 async def test_get_cached_treats_expired_row_as_miss():
     """DDB's TTL sweep is async, so an item with expires_at in the past
     can still be returned by get_item. The service must filter those.
@@ -104,7 +101,6 @@ async def test_get_cached_treats_expired_row_as_miss():
     assert result is None
 
 
-@pytest.mark.asyncio
 async def test_get_cached_corrupt_body_returns_none():
     svc = IdempotencyService()
     future = int(time.time()) + 1000
@@ -123,7 +119,6 @@ async def test_get_cached_corrupt_body_returns_none():
     assert result is None
 
 
-@pytest.mark.asyncio
 async def test_get_cached_swallows_ddb_failure():
     """Cache failures must NOT propagate — idempotency is opportunistic."""
     svc = IdempotencyService()
@@ -143,7 +138,6 @@ async def test_get_cached_swallows_ddb_failure():
 # ---------------------------------------------------------------------
 
 
-@pytest.mark.asyncio
 async def test_cache_writes_with_24h_ttl():
     svc = IdempotencyService()
     resource, table = _ddb_resource_mock()
@@ -169,7 +163,6 @@ async def test_cache_writes_with_24h_ttl():
     )
 
 
-@pytest.mark.asyncio
 async def test_cache_swallows_conditional_check_failure():
     """Two requests race with the same key — second write's
     ConditionalCheckFailed is the expected outcome, not an error.
@@ -185,7 +178,6 @@ async def test_cache_swallows_conditional_check_failure():
         await svc.cache("u", "create_echo", "k", 200, {"x": 1})
 
 
-@pytest.mark.asyncio
 async def test_cache_swallows_unexpected_ddb_error():
     svc = IdempotencyService()
     resource, _ = _ddb_resource_mock(
@@ -211,7 +203,6 @@ class _FakeRequest:
         self.headers = headers or {}
 
 
-@pytest.mark.asyncio
 async def test_decorator_no_header_runs_handler_normally():
     calls = []
 
@@ -228,7 +219,6 @@ async def test_decorator_no_header_runs_handler_normally():
     assert result == {"ok": True}
 
 
-@pytest.mark.asyncio
 async def test_decorator_oversize_key_returns_400():
     from fastapi import HTTPException
 
@@ -245,7 +235,6 @@ async def test_decorator_oversize_key_returns_400():
     assert exc_info.value.status_code == 400
 
 
-@pytest.mark.asyncio
 async def test_decorator_cache_hit_skips_handler_and_returns_cached_body():
     """Cache hit: handler must NOT run."""
     calls = []
@@ -275,7 +264,6 @@ async def test_decorator_cache_hit_skips_handler_and_returns_cached_body():
     fake_service.cache.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_decorator_cache_miss_runs_handler_and_stores_response():
     calls = []
 
@@ -307,7 +295,6 @@ async def test_decorator_cache_miss_runs_handler_and_stores_response():
     assert cache_kwargs["body"] == {"ok": True}
 
 
-@pytest.mark.asyncio
 async def test_decorator_no_user_in_kwargs_passes_through():
     """If the handler isn't using the standard auth dependency (e.g.
     public endpoint with the decorator accidentally applied), the
@@ -329,7 +316,6 @@ async def test_decorator_no_user_in_kwargs_passes_through():
     assert result == {"ok": True}
 
 
-@pytest.mark.asyncio
 async def test_decorator_does_not_cache_non_dict_responses():
     """Handler returning a non-dict (e.g. a Response object) should be
     passed through but NOT cached — we don't have a way to serialize
@@ -65,7 +65,6 @@ class TestClassifyReply:
 
 
 class TestStorePending:
-    @pytest.mark.asyncio
     async def test_creates_pending_row(self, repo: LifeAnchorRepo):
         await lac.store_pending(repo, "u1", "c1", _candidate())
         got = await repo.get("u1", lac.get_pending_anchor_id("c1"))
@@ -79,14 +78,12 @@ class TestStorePending:
 
 
 class TestResolvePending:
-    @pytest.mark.asyncio
     async def test_no_pending_returns_false(self, repo: LifeAnchorRepo):
         out = await lac.resolve_pending(
             repo, _stub_structurer(), "u1", "c1", "affirmative"
         )
         assert out is False
 
-    @pytest.mark.asyncio
     async def test_affirmative_creates_active_and_clears_pending(
         self, repo: LifeAnchorRepo
     ):
@@ -108,7 +105,6 @@ class TestResolvePending:
         assert a.reflection_use == "always_consider"  # sacred → always
         assert not a.anchor_id.startswith("pending#")  # fresh uuid
 
-    @pytest.mark.asyncio
     async def test_negative_discards_pending_without_creating(
         self, repo: LifeAnchorRepo
     ):
@@ -122,7 +118,6 @@ class TestResolvePending:
         assert await repo.get("u1", lac.get_pending_anchor_id("c1")) is None
         assert await repo.list_active_for_user("u1") == []
 
-    @pytest.mark.asyncio
     async def test_enrichment_upgrades_anchor(self, repo: LifeAnchorRepo):
         await lac.store_pending(repo, "u1", "c1", _candidate())
         structurer = _stub_structurer(
@@ -8,8 +8,6 @@ from src.app.models.life_anchor import AnchorScopes, LifeAnchor
 from src.app.repositories.life_anchor_repo import LifeAnchorRepo
 from tests._fakes.fake_dynamodb import FakeAioSession, FakeTable
 
-pytestmark = pytest.mark.asyncio
-
 TABLE = "mc_life_anchors-test"
 
 
@@ -5,12 +5,8 @@ from __future__ import annotations
 import json
 from unittest.mock import AsyncMock, MagicMock
 
-import pytest
-
 from src.app.services.life_anchor_structurer import LifeAnchorStructurer
 
-pytestmark = pytest.mark.asyncio
-
 
 def _structurer(raw=None, *, raises=False) -> LifeAnchorStructurer:
     svc = MagicMock()
@@ -3,19 +3,28 @@ Comprehensive tests for MirrorGPT functionality
 Tests archetype engine, orchestrator, API endpoints, and integration
 """
 
+import re
+import time
 from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 # Test imports
+from src.app.core.exceptions import ConfigLoadError
 from src.app.services.archetype_engine import (
     ArchetypeEngine,
     ChangeDetector,
     ConfidenceCalculator,
 )
 from src.app.services.mirror_orchestrator import MirrorOrchestrator, ResponseGenerator
-from src.app.utils.archetype_data import ArchetypeDefinitions
+from src.app.utils.archetype_data import (
+    DEFAULT_INTEGRATION_PRACTICE,
+    ArchetypeDefinitions,
+    _validate_archetypes,
+)
+from tests._fakes.async_stubs import areturn
+from tests._fakes.mirror_dynamodb import FakeMirrorDynamo
 
 
 class TestArchetypeDefinitions:
@@ -61,22 +70,66 @@ class TestArchetypeDefinitions:
             assert isinstance(symbols[category], list)
             assert len(symbols[category]) > 0
 
+    def test_accessors_return_shared_read_only_views(self):
+        """Accessors hand out the same read-only view instead of a fresh dict"""
+        accessors = [
+            ArchetypeDefinitions.get_all_archetypes,
+            ArchetypeDefinitions.get_symbol_library,
+            ArchetypeDefinitions.get_archetype_relationships,
+            ArchetypeDefinitions.get_integration_practices,
+        ]
+
+        for accessor in accessors:
+            view = accessor()
+            assert view is accessor()
+            with pytest.raises(TypeError):
+                view["Injected"] = {}  # type: ignore[index]
+
+    def test_get_integration_practice(self):
+        """Single-archetype lookup falls back to the default practice"""
+        assert ArchetypeDefinitions.get_integration_practice("Seeker") == (
+            "Contemplative journaling with symbolic exploration"
+        )
+        assert (
+            ArchetypeDefinitions.get_integration_practice("Unknown")
+            == DEFAULT_INTEGRATION_PRACTICE
+        )
+
+    def test_validate_archetypes_accepts_shipped_tables(self):
+        """The dev-only structural check passes for the shipped tables"""
+        _validate_archetypes(
+            ArchetypeDefinitions.get_all_archetypes(),
+            ArchetypeDefinitions.get_archetype_relationships(),
+            ArchetypeDefinitions.get_integration_practices(),
+        )
+
+    def test_validate_archetypes_rejects_bad_pattern(self):
+        """An uncompilable language pattern fails validation"""
+        archetypes = {
+            name: dict(data)
+            for name, data in ArchetypeDefinitions.get_all_archetypes().items()
+        }
+        archetypes["Seeker"]["language_patterns"] = [r"\b(unclosed"]
+
+        with pytest.raises(ConfigLoadError, match="Seeker"):
+            _validate_archetypes(
+                archetypes,
+                ArchetypeDefinitions.get_archetype_relationships(),
+                ArchetypeDefinitions.get_integration_practices(),
+            )
+
 
 class TestArchetypeEngine:
     """Test archetype detection engine"""
 
-    def setup_method(self):
-        """Setup test fixtures"""
-        self.engine = ArchetypeEngine()
-
-    def test_analyze_message_basic(self):
+    def test_analyze_message_basic(self, archetype_engine):
         """Test basic message analysis"""
         message = (
             "I'm searching for meaning and truth in my life. "
             "This path feels illuminating."
         )
 
-        result = self.engine.analyze_message(message)
+        result = archetype_engine.analyze_message(message)
 
         # Should have all 5 signals
         assert "signal_1_emotional_resonance" in result
@@ -89,11 +142,26 @@ class TestArchetypeEngine:
         assert result["primary_archetype"] == "Seeker"
         assert result["confidence_score"] > 0
 
-    def test_emotional_resonance_analysis(self):
+    def test_repeated_message_reuses_signals_without_sharing_them(
+        self, archetype_engine
+    ):
+        """Repeat analyses are served from the cache as independent copies"""
+        message = "I seek the truth behind the mirror"
+
+        first = archetype_engine.analyze_message(message)
+        first["signal_2_symbolic_language"]["extracted_symbols"].append("mutated")
+        hits = archetype_engine._cached_message_signals.cache_info().hits
+        second = archetype_engine.analyze_message(message)
+
+        assert archetype_engine._cached_message_signals.cache_info().hits == hits + 1
+        assert second["signal_2_symbolic_language"]["extracted_symbols"] == ["mirror"]
+        assert second["signal_3_archetype_blend"] == first["signal_3_archetype_blend"]
+
+    def test_emotional_resonance_analysis(self, archetype_engine):
         """Test emotional resonance detection"""
         message = "I feel so joyful and excited about this new beginning!"
 
-        result = self.engine._analyze_emotional_resonance(message)
+        result = archetype_engine._analyze_emotional_resonance(message)
 
         assert "valence" in result
         assert "arousal" in result
@@ -102,11 +170,11 @@ class TestArchetypeEngine:
         emotions = result["detected_emotions"]
         assert "joy" in emotions or "excitement" in emotions
 
-    def test_symbolic_language_extraction(self):
+    def test_symbolic_language_extraction(self, archetype_engine):
         """Test symbolic language detection"""
         message = "I crossed the threshold and found the light beyond the dark forest."
 
-        result = self.engine._extract_symbolic_language(message)
+        result = archetype_engine._extract_symbolic_language(message)
 
         assert "extracted_symbols" in result
         assert "symbolic_density" in result
@@ -120,13 +188,29 @@ class TestArchetypeEngine:
             found_symbols or len(result["extracted_symbols"]) == 0
         )  # Either found symbols or empty list is fine
 
-    def test_archetype_pattern_detection(self):
+    def test_symbolic_language_extraction_whole_words_in_library_order(
+        self, archetype_engine
+    ):
+        """Symbols match case-insensitively as whole words, in library order"""
+        message = "The River carried the door's depth; doors and sunrise don't count."
+
+        result = archetype_engine._extract_symbolic_language(message)
+
+        # "depth" is listed under both water and mystery symbols
+        assert result["extracted_symbols"] == ["door", "river", "depth", "depth"]
+        assert result["symbol_categories"] == {
+            "threshold_symbols": ["door"],
+            "water_symbols": ["river", "depth"],
+            "mystery_symbols": ["depth"],
+        }
+
+    def test_archetype_pattern_detection(self, archetype_engine):
         """Test archetype pattern matching"""
         message = "I need to protect my family and create a safe space for everyone."
 
-        emotional_data = self.engine._analyze_emotional_resonance(message)
-        symbolic_data = self.engine._extract_symbolic_language(message)
-        result = self.engine._detect_archetype_patterns(
+        emotional_data = archetype_engine._analyze_emotional_resonance(message)
+        symbolic_data = archetype_engine._extract_symbolic_language(message)
+        result = archetype_engine._detect_archetype_patterns(
             message, emotional_data, symbolic_data
         )
 
@@ -139,13 +223,58 @@ class TestArchetypeEngine:
         ]  # Any protective archetype is fine
         assert result["confidence"] >= 0.0  # Should have some confidence
 
-    def test_narrative_position_analysis(self):
+    def test_language_matches_agree_with_per_pattern_findall(self, archetype_engine):
+        """The keyword table counts exactly what each pattern's findall would"""
+        message = "Seek, SEEK and seeker: I search for truth; research isn't wisdom."
+        lowered = message.lower()
+
+        matches = archetype_engine._count_language_matches(lowered)
+
+        assert matches["Seeker"] > 0
+        for name, data in archetype_engine.archetypes.items():
+            expected = sum(
+                len(re.findall(pattern, lowered))
+                for pattern in data["language_patterns"]
+            )
+            assert matches[name] == expected, name
+
+    def test_language_patterns_outside_the_keyword_table_still_count(self, monkeypatch):
+        """A pattern that is not a plain word alternation is matched as a regex"""
+        archetypes = {
+            name: dict(data)
+            for name, data in ArchetypeDefinitions.get_all_archetypes().items()
+        }
+        archetypes["Seeker"]["language_patterns"] = [r"\bmy path\b", r"\b(seek)\b"]
+        monkeypatch.setattr(
+            ArchetypeDefinitions, "get_all_archetypes", staticmethod(lambda: archetypes)
+        )
+
+        engine = ArchetypeEngine()
+
+        matches = engine._count_language_matches("i seek my path, my path.")
+        assert matches["Seeker"] == 3
+
+    def test_invalid_language_pattern_fails_engine_construction(self, monkeypatch):
+        """A pattern that does not compile raises ConfigLoadError, not re.error"""
+        archetypes = {
+            name: dict(data)
+            for name, data in ArchetypeDefinitions.get_all_archetypes().items()
+        }
+        archetypes["Seeker"]["language_patterns"] = [r"\b(seek\b"]
+        monkeypatch.setattr(
+            ArchetypeDefinitions, "get_all_archetypes", staticmethod(lambda: archetypes)
+        )
+
+        with pytest.raises(ConfigLoadError, match="Seeker"):
+            ArchetypeEngine()
+
+    def test_narrative_position_analysis(self, archetype_engine):
         """Test narrative position detection"""
         message = (
             "I'm at the beginning of a new chapter in my life, ready to start fresh."
         )
 
-        result = self.engine._analyze_narrative_position(message)
+        result = archetype_engine._analyze_narrative_position(message)
 
         assert "stage" in result
         assert "hero_journey_phase" in result
@@ -158,11 +287,25 @@ class TestArchetypeEngine:
             "unknown",
         ]
 
-    def test_motif_loop_detection(self):
+    def test_narrative_position_counts_words_and_phrases(self, archetype_engine):
+        """Single keywords and multi-word phrases both count toward a phase"""
+        message = (
+            "I hit rock bottom; the crisis was my darkest trial, and I was not ready."
+        )
+
+        result = archetype_engine._analyze_narrative_position(message)
+
+        assert result["hero_journey_phase"] == "ordeal"
+        assert result["journey_confidence"] == 4
+        assert result["stage"] == "climax"
+        assert result["stage_confidence"] == 1
+        assert result["transformation_marker"] is False
+
+    def test_motif_loop_detection(self, archetype_engine):
         """Test motif loop pattern detection"""
         message = "I always feel like I'm not good enough, no matter what I achieve."
 
-        result = self.engine._detect_motif_loops(message)
+        result = archetype_engine._detect_motif_loops(message)
 
         assert "current_motifs" in result
         assert "active_loops" in result
@@ -287,7 +430,6 @@ class TestResponseGenerator:
         assert result["archetype_context"] == "Seeker"
         assert "Seeker" in result["response_text"]
 
-    @pytest.mark.asyncio
     async def test_generate_enhanced_response(self):
         """Test enhanced AI response generation"""
         self.mock_openai_service.send_async.return_value = (
@@ -324,25 +466,20 @@ class TestMirrorOrchestrator:
 
     def setup_method(self):
         """Setup test fixtures"""
-        self.mock_dynamodb = AsyncMock()
+        self.dynamodb = FakeMirrorDynamo()
         self.mock_openai = MagicMock()
-        self.orchestrator = MirrorOrchestrator(self.mock_dynamodb, self.mock_openai)
+        self.orchestrator = MirrorOrchestrator(self.dynamodb, self.mock_openai)
 
-    @pytest.mark.asyncio
     async def test_process_mirror_chat_new_user(self):
         """Test processing chat for new user"""
-        # Mock empty history
-        self.mock_dynamodb.get_user_archetype_profile.return_value = None
-
+        # No stored profile for a new user
         # Mock conversation service to return empty signals
         with patch(
             "src.app.services.conversation_service.ConversationService"
         ) as mock_conv_service_class:
             mock_conversation_service = AsyncMock()
             mock_conv_service_class.return_value = mock_conversation_service
-            mock_conversation_service.get_user_mirrorgpt_signals.return_value = []
-
-            self.mock_dynamodb.save_user_archetype_profile.return_value = {}
+            mock_conversation_service.get_user_mirrorgpt_signals = areturn([])
 
             result = await self.orchestrator.process_mirror_chat(
                 user_id="test_user",
@@ -361,20 +498,15 @@ class TestMirrorOrchestrator:
             ]  # Any seeking archetype
 
             # Should have saved profile data
-            self.mock_dynamodb.save_user_archetype_profile.assert_called_once()
+            assert self.dynamodb.calls["save_user_archetype_profile"] == 1
+            assert "test_user" in self.dynamodb.profiles
 
-    @pytest.mark.asyncio
     async def test_process_mirror_chat_with_history(self):
         """Test processing chat with user history"""
-        # Mock existing profile and signals
-        self.mock_dynamodb.get_user_archetype_profile.return_value = {
+        # Existing profile
+        self.dynamodb.profiles["test_user"] = {
             "current_archetype_stack": {"primary": "Guardian", "confidence_score": 0.6}
         }
-        self.mock_dynamodb.get_recent_echo_signals.return_value = [
-            {"signal_3_archetype_blend": {"primary": "Guardian"}}
-        ]
-        self.mock_dynamodb.save_echo_signal.return_value = {}
-        self.mock_dynamodb.save_user_archetype_profile.return_value = {}
 
         result = await self.orchestrator.process_mirror_chat(
             user_id="test_user",
@@ -387,20 +519,15 @@ class TestMirrorOrchestrator:
         # Should detect archetype shift from Guardian to Flamebearer
         assert result["change_detection"]["change_detected"] is True
 
-    @pytest.mark.asyncio
     async def test_get_user_insights(self):
         """Test user insights generation"""
-        # Mock data
-        self.mock_dynamodb.get_user_archetype_profile.return_value = {
+        # Stored profile and moment
+        self.dynamodb.profiles["test_user"] = {
             "current_archetype_stack": {"primary": "Seeker", "stability_score": 0.8}
         }
-        self.mock_dynamodb.get_recent_echo_signals.return_value = [
-            {"signal_1_emotional_resonance": {"valence": 0.5}},
-            {"signal_1_emotional_resonance": {"valence": 0.7}},
-        ]
-        self.mock_dynamodb.get_user_mirror_moments.return_value = [
-            {"moment_type": "breakthrough_moment"}
-        ]
+        self.dynamodb.moments["test_user"].append(
+            {"user_id": "test_user", "moment_type": "breakthrough_moment"}
+        )
 
         result = await self.orchestrator.get_user_insights("test_user")
 
@@ -414,11 +541,10 @@ class TestConversationHistoryThreading:
     """Tests for _get_conversation_history and history threading into the LLM call."""
 
     def setup_method(self):
-        self.mock_dynamodb = AsyncMock()
+        self.dynamodb = FakeMirrorDynamo()
         self.mock_openai = MagicMock()
-        self.orchestrator = MirrorOrchestrator(self.mock_dynamodb, self.mock_openai)
+        self.orchestrator = MirrorOrchestrator(self.dynamodb, self.mock_openai)
 
-    @pytest.mark.asyncio
     async def test_empty_conversation_id_returns_empty_list(self):
         """No conversation_id means no fetch and no exception."""
         result = await self.orchestrator._get_conversation_history(
@@ -426,7 +552,6 @@ class TestConversationHistoryThreading:
         )
         assert result == []
 
-    @pytest.mark.asyncio
     async def test_success_returns_chat_messages(self):
         """Happy path: returns ChatMessage objects with role + content."""
         from src.app.models.conversation import ConversationMessage
@@ -474,7 +599,6 @@ class TestConversationHistoryThreading:
                 include_system_messages=False,
             )
 
-    @pytest.mark.asyncio
     async def test_authorization_check_delegated_to_conversation_service(self):
         """Auth: must call ConversationService.get_conversation_history with user_id."""
         with patch(
@@ -492,7 +616,6 @@ class TestConversationHistoryThreading:
             assert call_kwargs["user_id"] == "alice"
             assert call_kwargs["conversation_id"] == "c1"
 
-    @pytest.mark.asyncio
     async def test_cross_user_access_returns_empty_list(self):
         """Security: another user's conversation_id must yield [] not their messages.
 
@@ -519,7 +642,6 @@ class TestConversationHistoryThreading:
             )
             assert result == []
 
-    @pytest.mark.asyncio
     async def test_per_turn_content_is_truncated(self):
         """Long prior content must be capped to mitigate stored prompt injection."""
         from src.app.models.conversation import ConversationMessage
@@ -540,7 +662,7 @@ class TestConversationHistoryThreading:
         ) as mock_cs_class:
             mock_cs = AsyncMock()
             mock_cs_class.return_value = mock_cs
-            mock_cs.get_conversation_history.return_value = fake_messages
+            mock_cs.get_conversation_history = areturn(fake_messages)
 
             result = await self.orchestrator._get_conversation_history(
                 conversation_id="c1",
@@ -550,7 +672,6 @@ class TestConversationHistoryThreading:
             )
             assert len(result[0].content) == 2000
 
-    @pytest.mark.asyncio
     async def test_exception_returns_empty_list(self):
         """ConversationService failures must not crash the chat — return [] and log."""
         with patch(
@@ -565,7 +686,6 @@ class TestConversationHistoryThreading:
             )
             assert result == []
 
-    @pytest.mark.asyncio
     async def test_history_threaded_into_openai_messages(self):
         """generate_enhanced_response must place history between system and current user."""
         from src.app.services.openai_service import ChatMessage
@@ -605,26 +725,24 @@ class TestParallelFetchFailureHandling:
     """Tests that asyncio.gather(return_exceptions=True) degrades gracefully."""
 
     def setup_method(self):
-        self.mock_dynamodb = AsyncMock()
+        self.dynamodb = FakeMirrorDynamo()
         self.mock_openai = MagicMock()
-        self.orchestrator = MirrorOrchestrator(self.mock_dynamodb, self.mock_openai)
+        self.orchestrator = MirrorOrchestrator(self.dynamodb, self.mock_openai)
 
-    @pytest.mark.asyncio
     async def test_profile_fetch_failure_does_not_break_chat(self):
         """A failure in profile fetch must not propagate up — chat should still complete."""
         # Profile raises, signals returns [], history returns []
-        self.mock_dynamodb.get_user_archetype_profile.side_effect = RuntimeError(
-            "profile down"
+        self.dynamodb.get_user_archetype_profile = AsyncMock(
+            side_effect=RuntimeError("profile down")
         )
-        self.mock_dynamodb.save_user_archetype_profile.return_value = {}
 
         with patch(
             "src.app.services.conversation_service.ConversationService"
         ) as mock_cs_class:
             mock_cs = AsyncMock()
             mock_cs_class.return_value = mock_cs
-            mock_cs.get_user_mirrorgpt_signals.return_value = []
-            mock_cs.get_conversation_history.return_value = []
+            mock_cs.get_user_mirrorgpt_signals = areturn([])
+            mock_cs.get_conversation_history = areturn([])
 
             result = await self.orchestrator.process_mirror_chat(
                 user_id="user1",
@@ -636,22 +754,18 @@ class TestParallelFetchFailureHandling:
             # The chat must still succeed even though profile fetch raised
             assert result["success"] is True
 
-    @pytest.mark.asyncio
     async def test_history_fetch_failure_does_not_break_chat(self):
         """A failure in history fetch must not propagate up — chat should still complete.
 
         This exercises the full _get_conversation_history path (with conversation_id
         present) so the gather leg actually depends on ConversationService.
         """
-        self.mock_dynamodb.get_user_archetype_profile.return_value = None
-        self.mock_dynamodb.save_user_archetype_profile.return_value = {}
-
         with patch(
             "src.app.services.conversation_service.ConversationService"
         ) as mock_cs_class:
             mock_cs = AsyncMock()
             mock_cs_class.return_value = mock_cs
-            mock_cs.get_user_mirrorgpt_signals.return_value = []
+            mock_cs.get_user_mirrorgpt_signals = areturn([])
             mock_cs.get_conversation_history.side_effect = RuntimeError(
                 "DynamoDB unavailable"
             )
@@ -714,7 +828,6 @@ class TestNameSanitization:
         assert "\t" not in _sanitize_name("Alice\tbob")
 
 
-@pytest.mark.asyncio
 class TestMirrorGPTAPIEndpoints:
     """Test API endpoints (integration tests)"""
 
@@ -741,7 +854,6 @@ class TestMirrorGPTAPIEndpoints:
 class TestDatabaseIntegration:
     """Test database operations and table interactions"""
 
-    @pytest.mark.asyncio
     async def test_save_echo_signal(self):
         """Test saving echo signal data"""
         # Mock DynamoDB service
@@ -759,11 +871,9 @@ class TestDatabaseIntegration:
         assert result["success"] is True
         mock_service.save_echo_signal.assert_called_once_with(signal_data)
 
-    @pytest.mark.asyncio
     async def test_save_mirror_moment(self):
         """Test saving mirror moment data"""
-        mock_service = AsyncMock()
-        mock_service.save_mirror_moment.return_value = {"moment_id": "test_moment"}
+        dynamodb = FakeMirrorDynamo()
 
         moment_data = {
             "user_id": "test_user",
@@ -773,26 +883,25 @@ class TestDatabaseIntegration:
             "significance_score": 0.8,
         }
 
-        result = await mock_service.save_mirror_moment(moment_data)
+        result = await dynamodb.save_mirror_moment(moment_data)
         assert "moment_id" in result
-        mock_service.save_mirror_moment.assert_called_once_with(moment_data)
+        assert dynamodb.calls["save_mirror_moment"] == 1
+        assert await dynamodb.get_user_mirror_moments("test_user") == [moment_data]
 
 
 class TestErrorHandling:
     """Test error handling and edge cases"""
 
-    def test_invalid_message_analysis(self):
+    def test_invalid_message_analysis(self, archetype_engine):
         """Test analysis with invalid or empty messages"""
-        engine = ArchetypeEngine()
-
         # Empty message
-        result = engine.analyze_message("")
+        result = archetype_engine.analyze_message("")
         assert (
             result["primary_archetype"] == "Unknown" or result["confidence_score"] == 0
         )
 
         # Very short message
-        result = engine.analyze_message("Hi")
+        result = archetype_engine.analyze_message("Hi")
         assert "primary_archetype" in result
 
     def test_malformed_archetype_data(self):
@@ -800,14 +909,12 @@ class TestErrorHandling:
         # This would test robustness against data corruption
         pass
 
-    @pytest.mark.asyncio
     async def test_orchestrator_error_handling(self):
         """Test orchestrator error handling"""
-        mock_dynamodb = AsyncMock()
         mock_openai = AsyncMock()
 
         # Create an orchestrator that will fail during archetype analysis
-        orchestrator = MirrorOrchestrator(mock_dynamodb, mock_openai)
+        orchestrator = MirrorOrchestrator(FakeMirrorDynamo(), mock_openai)
 
         # Mock the archetype engine to raise an exception
         with patch.object(
@@ -832,27 +939,21 @@ class TestErrorHandling:
 class TestPerformance:
     """Test performance characteristics"""
 
-    def test_analysis_performance(self):
+    def test_analysis_performance(self, archetype_engine):
         """Test analysis performance with long messages"""
-        engine = ArchetypeEngine()
-
         # Long message
         long_message = "I am seeking truth and meaning in my life. " * 100
 
-        import time
-
-        start_time = time.time()
-        result = engine.analyze_message(long_message)
-        end_time = time.time()
+        start_time = time.perf_counter()
+        result = archetype_engine.analyze_message(long_message)
+        end_time = time.perf_counter()
 
         # Should complete within reasonable time
         assert (end_time - start_time) < 5.0  # 5 seconds max
-        assert "primary_archetype" in result
+        assert result["primary_archetype"] == "Seeker"
 
-    def test_batch_analysis_performance(self):
+    def test_batch_analysis_performance(self, archetype_engine):
         """Test performance with multiple messages"""
-        engine = ArchetypeEngine()
-
         messages = [
             "I'm searching for meaning",
             "I need to protect everyone",
@@ -860,20 +961,20 @@ class TestPerformance:
             "I see the patterns connecting",
         ]
 
-        import time
-
-        start_time = time.time()
-
-        results = []
-        for message in messages:
-            result = engine.analyze_message(message)
-            results.append(result)
-
-        end_time = time.time()
+        start_time = time.perf_counter()
+        results = archetype_engine.analyze_batch(messages)
+        end_time = time.perf_counter()
 
         # Should complete batch within reasonable time
         assert (end_time - start_time) < 10.0  # 10 seconds max
         assert len(results) == 4
+        assert len({result["timestamp"] for result in results}) == 1
+        for message, result in zip(messages, results):
+            single = archetype_engine.analyze_message(message)
+            assert result["primary_archetype"] == single["primary_archetype"]
+            assert (
+                result["signal_3_archetype_blend"] == single["signal_3_archetype_blend"]
+            )
 
 
 if __name__ == "__main__":
@@ -14,8 +14,6 @@ from __future__ import annotations
 from typing import List, Optional
 from unittest.mock import AsyncMock, MagicMock, patch
 
-import pytest
-
 from src.app.models.conversation import Conversation
 from src.app.services.mirror_orchestrator import MirrorOrchestrator
 from src.app.services.openai_service import ChatMessage
@@ -53,7 +51,6 @@ def _make_orchestrator() -> MirrorOrchestrator:
 # --------------------------------------------------------------------------
 
 
-@pytest.mark.asyncio
 async def test_carrier_none_when_no_recent_conversations():
     orchestrator = _make_orchestrator()
 
@@ -71,7 +68,6 @@ async def test_carrier_none_when_no_recent_conversations():
     assert result is None
 
 
-@pytest.mark.asyncio
 async def test_carrier_none_when_only_current_conversation_present():
     """The only conversation is the current one → no prior context."""
     orchestrator = _make_orchestrator()
@@ -92,7 +88,6 @@ async def test_carrier_none_when_only_current_conversation_present():
     assert result is None
 
 
-@pytest.mark.asyncio
 async def test_carrier_built_when_prior_summarized():
     orchestrator = _make_orchestrator()
     prior = _conv(
@@ -123,7 +118,6 @@ async def test_carrier_built_when_prior_summarized():
     assert "hasn't told the manager yet" in result.content
 
 
-@pytest.mark.asyncio
 async def test_carrier_none_when_prior_unsummarized_and_too_few_messages():
     """Prior is the candidate but has fewer than the summary threshold's
     messages and no summary → can't summarize on the fly, and there is no
@@ -145,7 +139,6 @@ async def test_carrier_none_when_prior_unsummarized_and_too_few_messages():
     assert result is None
 
 
-@pytest.mark.asyncio
 async def test_carrier_lazy_summarizes_eligible_prior():
     """Prior has enough messages but no summary → lazy summarize → carrier."""
     orchestrator = _make_orchestrator()
@@ -185,7 +178,6 @@ async def test_carrier_lazy_summarizes_eligible_prior():
     assert "Recent reflection about indecision" in result.content
 
 
-@pytest.mark.asyncio
 async def test_carrier_returns_none_when_loader_raises():
     """Errors fetching recent conversations must not break chat — None."""
     orchestrator = _make_orchestrator()
@@ -204,7 +196,6 @@ async def test_carrier_returns_none_when_loader_raises():
     assert result is None
 
 
-@pytest.mark.asyncio
 async def test_carrier_picks_most_recent_prior_skipping_current():
     """Carrier should reflect the most-recent OTHER conversation."""
     orchestrator = _make_orchestrator()
@@ -235,7 +226,6 @@ async def test_carrier_picks_most_recent_prior_skipping_current():
 # --------------------------------------------------------------------------
 
 
-@pytest.mark.asyncio
 async def test_process_mirror_chat_injects_carrier_when_history_empty():
     """Empty current history + prior summary present → carrier reaches LLM."""
     orchestrator = _make_orchestrator()
@@ -293,7 +283,6 @@ async def test_process_mirror_chat_injects_carrier_when_history_empty():
     assert "Working through avoidance" in history[0].content
 
 
-@pytest.mark.asyncio
 async def test_process_mirror_chat_skips_carrier_when_history_present():
     """If the current convo already has turns, the carrier is NOT added —
     raw turns take precedence."""
@@ -362,7 +351,6 @@ async def test_process_mirror_chat_skips_carrier_when_history_present():
     assert not any("background only" in (m.content or "").lower() for m in history)
 
 
-@pytest.mark.asyncio
 async def test_process_mirror_chat_history_empty_and_no_prior_yields_empty_history():
     """No prior conversations at all → history stays empty, no carrier."""
     orchestrator = _make_orchestrator()
@@ -406,7 +394,6 @@ async def test_process_mirror_chat_history_empty_and_no_prior_yields_empty_histo
     assert captured["history"] == []
 
 
-@pytest.mark.asyncio
 async def test_carrier_falls_through_to_older_summarized_conversation():
     """Most-recent prior has no summary and is too short to summarize on the
     fly, but an older conversation already has one → the carrier uses the
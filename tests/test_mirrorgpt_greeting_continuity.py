@@ -88,7 +88,6 @@ def _conv(
     )
 
 
-@pytest.mark.asyncio
 async def test_load_continuity_no_recent_returns_empty():
     conv_service = MagicMock()
     conv_service.get_recent_conversations = AsyncMock(return_value=[])
@@ -102,7 +101,6 @@ async def test_load_continuity_no_recent_returns_empty():
     assert result["has_prior_context"] is False
 
 
-@pytest.mark.asyncio
 async def test_load_continuity_with_summaries_builds_context_lines():
     convs = [
         _conv(
@@ -141,7 +139,6 @@ async def test_load_continuity_with_summaries_builds_context_lines():
     assert "most recent" not in result["context_lines"][1]
 
 
-@pytest.mark.asyncio
 async def test_load_continuity_refreshes_stale_summary_on_most_recent():
     """Lazy-on-read must run even when the most-recent conversation already
     HAS a summary — staleness is decided inside summarize_if_stale. The old
@@ -168,7 +165,6 @@ async def test_load_continuity_refreshes_stale_summary_on_most_recent():
     mock_lazy.assert_awaited_once()
 
 
-@pytest.mark.asyncio
 async def test_try_lazy_summarize_delegates_staleness_to_summarize_if_stale():
     """_try_lazy_summarize must call summarize_if_stale (refresh stale
     summaries), not summarize() gated on summary-missing only."""
@@ -199,7 +195,6 @@ async def test_try_lazy_summarize_delegates_staleness_to_summarize_if_stale():
     )
 
 
-@pytest.mark.asyncio
 async def test_load_continuity_applies_lazy_summary_in_place():
     """Most-recent conversation has no summary → _try_lazy_summarize returns a
     fresh SummaryResult, which is applied in place and appears in
@@ -238,7 +233,6 @@ async def test_load_continuity_applies_lazy_summary_in_place():
     assert "Lazy-generated summary" in result["context_lines"][0]
 
 
-@pytest.mark.asyncio
 async def test_load_continuity_skips_summaries_that_remain_empty():
     """Most-recent has no summary AND lazy summarize fails to produce one.
 
@@ -263,7 +257,6 @@ async def test_load_continuity_skips_summaries_that_remain_empty():
     assert result["has_prior_context"] is False
 
 
-@pytest.mark.asyncio
 async def test_load_continuity_swallows_loader_errors():
     conv_service = MagicMock()
     conv_service.get_recent_conversations = AsyncMock(
@@ -293,7 +286,6 @@ def _make_orchestrator(openai_response: str = "Welcome back, Ajay."):
     return orch
 
 
-@pytest.mark.asyncio
 async def test_greeting_cold_start_uses_simple_trigger_and_names_member():
     orch = _make_orchestrator(openai_response="Hey Ajay, good to have you here.")
 
@@ -318,7 +310,6 @@ async def test_greeting_cold_start_uses_simple_trigger_and_names_member():
     assert "MUST address them by their first name" in trigger
 
 
-@pytest.mark.asyncio
 async def test_greeting_with_continuity_mandates_name_and_acknowledgement():
     orch = _make_orchestrator(
         openai_response="Welcome back, Ajay — you mentioned feeling stuck on the job thing."
@@ -360,7 +351,6 @@ async def test_greeting_with_continuity_mandates_name_and_acknowledgement():
     assert "FIRST line" in trigger
 
 
-@pytest.mark.asyncio
 async def test_greeting_omits_name_instruction_when_name_unknown():
     """Master prompt rule: never guess a name. When name is missing, the
     explicit addressing instruction must be omitted and the trigger must
@@ -382,7 +372,6 @@ async def test_greeting_omits_name_instruction_when_name_unknown():
     assert "Open a new session." in trigger or "Open a new session for " not in trigger
 
 
-@pytest.mark.asyncio
 async def test_greeting_llm_failure_falls_back_gracefully():
     orch = MagicMock()
     orch.openai_service = MagicMock()
@@ -402,7 +391,6 @@ async def test_greeting_llm_failure_falls_back_gracefully():
     assert "back" in result.lower() or "mind" in result.lower()
 
 
-@pytest.mark.asyncio
 async def test_greeting_treats_continuity_only_as_returning():
     """Even without profile/signals, prior continuity should mark the user
     as returning so the trigger doesn't say 'new user'."""
@@ -11,8 +11,6 @@ from __future__ import annotations
 from typing import Optional
 from unittest.mock import AsyncMock, MagicMock, patch
 
-import pytest
-
 from src.app.models.conversation import Conversation
 from src.app.models.echo_loop_state import EchoLoopState
 from src.app.models.life_anchor import LifeAnchor
@@ -95,7 +93,6 @@ def _conv(
 # --------------------------------------------------------------------------
 
 
-@pytest.mark.asyncio
 async def test_preflight_none_and_no_db_when_flag_off():
     """Flag off → returns None instantly without touching the loop store."""
     orch = _make_orchestrator(preflight=False)
@@ -114,7 +111,6 @@ async def test_preflight_none_and_no_db_when_flag_off():
 # --------------------------------------------------------------------------
 
 
-@pytest.mark.asyncio
 async def test_preflight_packet_includes_patterns_and_summary():
     orch = _make_orchestrator(preflight=True)
     loops = [_loop("grief", tone="rising", score=0.8, label="High")]
@@ -158,7 +154,6 @@ async def test_preflight_packet_includes_patterns_and_summary():
     assert "hasn't told family" in result.content
 
 
-@pytest.mark.asyncio
 async def test_preflight_degrades_to_summary_when_loops_fail():
     """A loop-store failure must not break the packet — the recent summary
     still comes through (degrade, don't crash)."""
@@ -190,7 +185,6 @@ async def test_preflight_degrades_to_summary_when_loops_fail():
     assert "Active emotional patterns" not in result.content
 
 
-@pytest.mark.asyncio
 async def test_preflight_none_when_no_patterns_and_no_summary():
     orch = _make_orchestrator(preflight=True)
 
@@ -218,7 +212,6 @@ async def test_preflight_none_when_no_patterns_and_no_summary():
 # --------------------------------------------------------------------------
 
 
-@pytest.mark.asyncio
 async def test_fetch_active_loops_filters_resolved_and_ranks_top_n():
     orch = _make_orchestrator(preflight=True)
     rows = [
@@ -269,7 +262,6 @@ def test_render_hard_caps_length():
 # --------------------------------------------------------------------------
 
 
-@pytest.mark.asyncio
 async def test_process_mirror_chat_prepends_packet_even_with_history():
     """Unlike the carrier, the preflight packet is injected on EVERY turn —
     including when the conversation already has turns — and lands first."""
@@ -342,7 +334,6 @@ async def test_process_mirror_chat_prepends_packet_even_with_history():
     assert history[1].content == "earlier user msg"
 
 
-@pytest.mark.asyncio
 async def test_process_mirror_chat_suppresses_tier2_summary_when_carrier_fires():
     """On an empty-history turn the carrier injects the recent summary; the
     preflight packet must then carry patterns ONLY (no duplicate summary)."""
@@ -409,7 +400,6 @@ async def test_process_mirror_chat_suppresses_tier2_summary_when_carrier_fires()
     assert combined.count("Working through a job change.") == 1
 
 
-@pytest.mark.asyncio
 async def test_process_mirror_chat_no_packet_when_flag_off():
     """Flag off → no packet in history (empty new conversation stays empty)."""
     orch = _make_orchestrator(preflight=False)
@@ -458,7 +448,6 @@ async def test_process_mirror_chat_no_packet_when_flag_off():
 # --------------------------------------------------------------------------
 
 
-@pytest.mark.asyncio
 async def test_fetch_active_anchors_empty_when_flag_off():
     orch = _make_orchestrator(preflight=True, life_anchors=False)
     with patch("src.app.repositories.life_anchor_repo.LifeAnchorRepo") as repo_cls:
@@ -467,7 +456,6 @@ async def test_fetch_active_anchors_empty_when_flag_off():
     repo_cls.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_fetch_active_anchors_drops_never_and_orders_always_first():
     orch = _make_orchestrator(preflight=False, life_anchors=True)
     anchors = [
@@ -508,7 +496,6 @@ def test_render_packet_puts_anchors_first_with_guidance():
     assert "Do not say time heals everything." in packet.content
 
 
-@pytest.mark.asyncio
 async def test_load_preflight_runs_when_only_life_anchors_flag_on():
     orch = _make_orchestrator(preflight=False, life_anchors=True)
     with (
@@ -530,7 +517,6 @@ async def test_load_preflight_runs_when_only_life_anchors_flag_on():
     loop_cls.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_process_mirror_chat_injects_anchors_when_enabled():
     from src.app.models.conversation import ConversationMessage
 
@@ -29,42 +29,28 @@ def test_user_registration_request_valid():
     assert request.fullName == "John Doe"
 
 
-def test_user_registration_request_invalid_email():
-    """Test user registration with invalid email"""
-    data = {
-        "email": "invalid-email",
-        "password": "ValidPass123!",
-        "fullName": "John Doe",
-    }
-
-    with pytest.raises(ValidationError) as exc_info:
-        UserRegistrationRequest(**data)
-
-    assert "email" in str(exc_info.value)
-
-
-def test_user_registration_request_short_password():
-    """Test user registration with short password"""
-    data = {"email": "test@example.com", "password": "short", "fullName": "John Doe"}
-
-    with pytest.raises(ValidationError) as exc_info:
-        UserRegistrationRequest(**data)
-
-    assert "password" in str(exc_info.value)
-
-
-def test_user_registration_request_invalid_name():
-    """Test user registration with invalid name"""
+@pytest.mark.parametrize(
+    "overrides,field",
+    [
+        ({"email": "invalid-email"}, "email"),
+        ({"password": "short"}, "password"),
+        ({"fullName": "J"}, "fullName"),  # Too short
+    ],
+    ids=["invalid-email", "short-password", "invalid-name"],
+)
+def test_user_registration_request_invalid_field(overrides, field):
+    """Test user registration rejects an invalid email, password or name"""
     data = {
         "email": "test@example.com",
         "password": "ValidPass123!",
-        "fullName": "J",  # Too short
+        "fullName": "John Doe",
+        **overrides,
     }
 
     with pytest.raises(ValidationError) as exc_info:
         UserRegistrationRequest(**data)
 
-    assert "fullName" in str(exc_info.value)
+    assert field in str(exc_info.value)
 
 
 def test_password_accepts_common_special_chars():
@@ -205,37 +191,36 @@ def test_email_verification_request_valid():
     assert request.verificationCode == "123456"
 
 
-def test_password_pattern_validation():
-    """Test password pattern validation"""
-    valid_passwords = ["ValidPass123!", "Another1@", "Test123$", "MyPassword2&"]
+_PASSWORD_CHECK_BASE = {"email": "test@example.com", "fullName": "Test User"}
+
+
+@pytest.mark.parametrize(
+    "password", ["ValidPass123!", "Another1@", "Test123$", "MyPassword2&"]
+)
+def test_password_pattern_accepts(password):
+    """Test password pattern validation accepts a compliant password"""
+    request = UserRegistrationRequest.model_validate(
+        {**_PASSWORD_CHECK_BASE, "password": password}
+    )
+    assert request.password == password
+
 
-    invalid_passwords = [
+@pytest.mark.parametrize(
+    "password",
+    [
         "short",  # Too short
         "nouppercase1!",  # No uppercase
         "NOLOWERCASE1!",  # No lowercase
         "NoDigits!",  # No digits
         "NoSpecial123",  # No special chars
-    ]
-
-    # Test valid passwords
-    for password in valid_passwords:
-        data = {
-            "email": "test@example.com",
-            "password": password,
-            "fullName": "Test User",
-        }
-        request = UserRegistrationRequest(**data)
-        assert request.password == password
-
-    # Test invalid passwords
-    for password in invalid_passwords:
-        data = {
-            "email": "test@example.com",
-            "password": password,
-            "fullName": "Test User",
-        }
-        with pytest.raises(ValidationError):
-            UserRegistrationRequest(**data)
+    ],
+)
+def test_password_pattern_rejects(password):
+    """Test password pattern validation rejects a non-compliant password"""
+    with pytest.raises(ValidationError):
+        UserRegistrationRequest.model_validate(
+            {**_PASSWORD_CHECK_BASE, "password": password}
+        )
 
 
 def test_user_profile_to_dynamodb_item_empty_email():
@@ -346,3 +331,49 @@ def test_user_profile_cognito_format_mismatch_original_bug():
     # After our fix, email should be correctly extracted
     assert profile.email == "user@example.com"
     assert profile.first_name == "John"
+
+
+def test_conversation_message_to_dynamodb_item_drops_none():
+    """Test that ConversationMessage.to_dynamodb_item() omits unset fields"""
+    from src.app.models.conversation import ConversationMessage
+
+    blend = {"primary": "seeker", "confidence": 0.8}
+    message = ConversationMessage(
+        message_id="msg-1",
+        conversation_id="conv-1",
+        role="user",
+        content="Hello",
+        timestamp="2025-01-01T00:00:00Z",
+        signal_3_archetype_blend=blend,
+    )
+
+    item = message.to_dynamodb_item()
+
+    assert item == {
+        "message_id": "msg-1",
+        "conversation_id": "conv-1",
+        "role": "user",
+        "content": "Hello",
+        "timestamp": "2025-01-01T00:00:00Z",
+        "signal_3_archetype_blend": blend,
+    }
+
+
+def test_conversation_to_dynamodb_item_serializes_key_themes():
+    """Test that Conversation.to_dynamodb_item() stores key themes as maps"""
+    from src.app.models.conversation import Conversation, KeyTheme
+
+    conversation = Conversation(
+        conversation_id="conv-1",
+        user_id="user-1",
+        tags=[],
+        key_themes=[KeyTheme(theme="boundaries", confidence="high")],
+    )
+
+    item = conversation.to_dynamodb_item()
+
+    assert item["key_themes"] == [{"theme": "boundaries", "confidence": "high"}]
+    # Empty lists and unset optionals are dropped
+    assert "tags" not in item
+    assert "summary" not in item
+    assert item["message_count"] == 0
@@ -38,7 +38,6 @@ def _make_echo(echo_id: str = "echo-1", user_id: str = "u-1", media_url=None) ->
 # ----------------------------------------------------------------------
 
 
-@pytest.mark.asyncio
 async def test_initiate_rejects_unknown_mime():
     svc = EchoService()
     echo = _make_echo()
@@ -51,7 +50,6 @@ async def test_initiate_rejects_unknown_mime():
             )
 
 
-@pytest.mark.asyncio
 async def test_initiate_rejects_when_echo_missing():
     svc = EchoService()
     with patch.object(svc, "get_echo", new=AsyncMock(return_value=None)):
@@ -63,7 +61,6 @@ async def test_initiate_rejects_when_echo_missing():
             )
 
 
-@pytest.mark.asyncio
 async def test_initiate_rejects_recipient_caller_as_notfound():
     """Owner-only — recipients see NotFound to avoid info leakage."""
     svc = EchoService()
@@ -77,7 +74,6 @@ async def test_initiate_rejects_recipient_caller_as_notfound():
             )
 
 
-@pytest.mark.asyncio
 async def test_initiate_rejects_when_media_already_attached():
     svc = EchoService()
     echo = _make_echo(media_url="https://b/.../already.mp4")
@@ -90,7 +86,6 @@ async def test_initiate_rejects_when_media_already_attached():
             )
 
 
-@pytest.mark.asyncio
 async def test_initiate_returns_upload_id_and_key_with_owner_prefix():
     svc = EchoService()
     svc.s3_bucket = "mc-bucket"
@@ -121,7 +116,6 @@ async def test_initiate_returns_upload_id_and_key_with_owner_prefix():
     assert kwargs["Metadata"]["echo_id"] == "echo-1"
 
 
-@pytest.mark.asyncio
 async def test_initiate_maps_s3_failure_to_internal_error():
     from src.app.core.exceptions import InternalServerError
 
@@ -148,7 +142,6 @@ async def test_initiate_maps_s3_failure_to_internal_error():
 # ----------------------------------------------------------------------
 
 
-@pytest.mark.asyncio
 async def test_part_urls_rejects_empty_batch():
     svc = EchoService()
     echo = _make_echo()
@@ -163,7 +156,6 @@ async def test_part_urls_rejects_empty_batch():
             )
 
 
-@pytest.mark.asyncio
 async def test_part_urls_rejects_oversize_batch():
     svc = EchoService()
     echo = _make_echo()
@@ -179,7 +171,6 @@ async def test_part_urls_rejects_oversize_batch():
 
 
 @pytest.mark.parametrize("bad", [0, -1, 10_001, 10_002])
-@pytest.mark.asyncio
 async def test_part_urls_rejects_out_of_range_part_number(bad):
     svc = EchoService()
     with pytest.raises(ValidationError, match="out of range"):
@@ -192,7 +183,6 @@ async def test_part_urls_rejects_out_of_range_part_number(bad):
         )
 
 
-@pytest.mark.asyncio
 async def test_part_urls_rejects_cross_tenant_key():
     svc = EchoService()
     echo = _make_echo()
@@ -207,7 +197,6 @@ async def test_part_urls_rejects_cross_tenant_key():
             )
 
 
-@pytest.mark.asyncio
 async def test_part_urls_rejects_recipient_caller_as_notfound():
     svc = EchoService()
     echo = _make_echo(user_id="owner-u")
@@ -222,7 +211,6 @@ async def test_part_urls_rejects_recipient_caller_as_notfound():
             )
 
 
-@pytest.mark.asyncio
 async def test_part_urls_returns_one_url_per_requested_part():
     svc = EchoService()
     svc.s3_bucket = "mc-bucket"
@@ -261,7 +249,6 @@ async def test_part_urls_returns_one_url_per_requested_part():
 # ----------------------------------------------------------------------
 
 
-@pytest.mark.asyncio
 async def test_complete_rejects_empty_parts():
     svc = EchoService()
     with pytest.raises(ValidationError, match="parts cannot be empty"):
@@ -274,7 +261,6 @@ async def test_complete_rejects_empty_parts():
         )
 
 
-@pytest.mark.asyncio
 async def test_complete_rejects_part_with_missing_etag():
     svc = EchoService()
     with pytest.raises(ValidationError, match="missing etag"):
@@ -287,7 +273,6 @@ async def test_complete_rejects_part_with_missing_etag():
         )
 
 
-@pytest.mark.asyncio
 async def test_complete_canonicalizes_unquoted_etags_and_sorts_by_part_number():
     """ETags from S3's wire format are quoted; clients sometimes strip
     the quotes when reading from response headers. Service must
@@ -328,7 +313,6 @@ async def test_complete_canonicalizes_unquoted_etags_and_sorts_by_part_number():
     assert sent[2]["ETag"] == '"etag-3"'
 
 
-@pytest.mark.asyncio
 async def test_complete_maps_NoSuchUpload_to_notfound():
     svc = EchoService()
     echo = _make_echo()
@@ -350,7 +334,6 @@ async def test_complete_maps_NoSuchUpload_to_notfound():
                 )
 
 
-@pytest.mark.asyncio
 async def test_complete_rejects_cross_tenant_key():
     svc = EchoService()
     echo = _make_echo()
@@ -370,7 +353,6 @@ async def test_complete_rejects_cross_tenant_key():
 # ----------------------------------------------------------------------
 
 
-@pytest.mark.asyncio
 async def test_abort_calls_s3_with_upload_id():
     svc = EchoService()
     echo = _make_echo()
@@ -389,7 +371,6 @@ async def test_abort_calls_s3_with_upload_id():
     assert kwargs["UploadId"] == "UPLOAD"
 
 
-@pytest.mark.asyncio
 async def test_abort_swallows_NoSuchUpload():
     """Already-gone upload is the desired end state."""
     svc = EchoService()
@@ -411,7 +392,6 @@ async def test_abort_swallows_NoSuchUpload():
             )
 
 
-@pytest.mark.asyncio
 async def test_abort_rejects_recipient_caller():
     svc = EchoService()
     echo = _make_echo(user_id="owner-u")
@@ -430,7 +410,6 @@ async def test_abort_rejects_recipient_caller():
 # ----------------------------------------------------------------------
 
 
-@pytest.mark.asyncio
 async def test_complete_rejects_duplicate_part_numbers():
     """Two parts with the same part_number would silently let S3 take the
     last ETag, dropping bytes from the assembled object. Reject loudly.
@@ -449,7 +428,6 @@ async def test_complete_rejects_duplicate_part_numbers():
         )
 
 
-@pytest.mark.asyncio
 async def test_complete_rejects_oversize_parts_list():
     """A malicious client could POST 500k dicts and OOM the Lambda."""
     svc = EchoService()
@@ -467,7 +445,6 @@ async def test_complete_rejects_oversize_parts_list():
         )
 
 
-@pytest.mark.asyncio
 async def test_complete_passes_skip_media_url_check_to_finalize():
     """After S3 CompleteMultipartUpload succeeds, finalize_upload must
     NOT 400 if echo.media_url was somehow already set by a racing
@@ -500,7 +477,6 @@ async def test_complete_passes_skip_media_url_check_to_finalize():
     assert captured_kwargs.get("skip_media_url_check") is True
 
 
-@pytest.mark.asyncio
 async def test_finalize_upload_honors_skip_media_url_check_flag():
     """If skip_media_url_check=True, an existing echo.media_url no longer
     raises — the caller (multipart complete) takes responsibility for
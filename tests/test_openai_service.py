@@ -14,6 +14,7 @@ integration. The new behaviour under test:
 
 import asyncio
 import os
+from types import SimpleNamespace
 from typing import List, Optional
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -22,6 +23,7 @@ import pytest
 from src.app.core.exceptions import InternalServerError
 from src.app.services import openai_service as openai_service_module
 from src.app.services.openai_service import ChatMessage, OpenAIService
+from tests._fakes.async_stubs import AIter
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -37,22 +39,18 @@ def _reset_module_semaphore() -> None:
     openai_service_module._openai_semaphore = None
 
 
-def _make_chunk(content: Optional[str]) -> MagicMock:
+def _make_chunk(content: Optional[str]) -> SimpleNamespace:
     """Build a fake streaming chunk shaped like an OpenAI delta."""
-    chunk = MagicMock()
-    chunk.choices = [MagicMock()]
-    chunk.choices[0].delta = MagicMock()
-    chunk.choices[0].delta.content = content
-    return chunk
+    return SimpleNamespace(
+        choices=[SimpleNamespace(delta=SimpleNamespace(content=content))]
+    )
 
 
-def _make_completion_response(content: str) -> MagicMock:
+def _make_completion_response(content: str) -> SimpleNamespace:
     """Build a fake non-streaming chat completion response."""
-    response = MagicMock()
-    response.choices = [MagicMock()]
-    response.choices[0].message = MagicMock()
-    response.choices[0].message.content = content
-    return response
+    return SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content=content))]
+    )
 
 
 def _make_messages() -> List[ChatMessage]:
@@ -80,7 +78,6 @@ def _ensure_api_key():
 # ---------------------------------------------------------------------------
 
 
-@pytest.mark.asyncio
 async def test_send_async_uses_async_client():
     """send_async must await the AsyncOpenAI client; sync client is untouched."""
     _reset_module_semaphore()
@@ -103,7 +100,6 @@ async def test_send_async_uses_async_client():
     fake_sync_create.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_send_async_propagates_errors():
     """An exception from the async client becomes InternalServerError."""
     _reset_module_semaphore()
@@ -130,7 +126,6 @@ async def test_send_async_propagates_errors():
 # ---------------------------------------------------------------------------
 
 
-@pytest.mark.asyncio
 async def test_send_with_overrides_async_uses_async_client():
     """Overrides path also awaits the async client and forwards params."""
     _reset_module_semaphore()
@@ -172,26 +167,13 @@ async def test_send_with_overrides_async_uses_async_client():
 # ---------------------------------------------------------------------------
 
 
-@pytest.mark.asyncio
 async def test_send_stream_uses_async_iterator():
     """send_stream must consume an async iterator and yield chunk content."""
     _reset_module_semaphore()
 
     chunks = [_make_chunk("hello "), _make_chunk("world"), _make_chunk(None)]
 
-    class _FakeStream:
-        def __init__(self, items):
-            self._items = list(items)
-
-        def __aiter__(self):
-            return self
-
-        async def __anext__(self):
-            if not self._items:
-                raise StopAsyncIteration
-            return self._items.pop(0)
-
-    fake_create = AsyncMock(return_value=_FakeStream(chunks))
+    fake_create = AsyncMock(return_value=AIter(chunks))
 
     with (
         patch.object(openai_service_module, "AsyncOpenAI") as MockAsync,
@@ -215,7 +197,6 @@ async def test_send_stream_uses_async_iterator():
 # ---------------------------------------------------------------------------
 
 
-@pytest.mark.asyncio
 async def test_semaphore_caps_concurrency(monkeypatch):
     """At most _OPENAI_MAX_INFLIGHT calls run concurrently."""
     # Reload-style: change the cap and reset the cached semaphore.
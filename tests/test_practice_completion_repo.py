@@ -10,9 +10,6 @@ from src.app.models.practice_completion import PracticeCompletion
 from src.app.repositories.practice_completion_repo import PracticeCompletionRepo
 from tests._fakes.fake_dynamodb import FakeAioSession, FakeTable
 
-pytestmark = pytest.mark.asyncio
-
-
 TABLE_NAME = "mc_practice_completions-test"
 
 
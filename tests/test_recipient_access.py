@@ -9,10 +9,7 @@ This test ensures that:
 
 from unittest.mock import AsyncMock, MagicMock, patch
 
-import pytest
 
-
-@pytest.mark.asyncio
 async def test_recipient_can_view_echo_sent_to_them():
     """Recipients should be able to view echoes sent to them via recipient_user_id linking."""
     from src.app.models.echo import Echo, EchoStatus, Recipient
@@ -105,7 +102,6 @@ async def test_recipient_can_view_echo_sent_to_them():
         assert echo_for_other is None  # Should return None for unauthorized access
 
 
-@pytest.mark.asyncio
 async def test_recipient_without_user_account_cannot_view_echo():
     """Recipients without linked user accounts (recipient_user_id=None) cannot view echoes."""
     from src.app.models.echo import Echo, EchoStatus, Recipient
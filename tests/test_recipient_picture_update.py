@@ -14,8 +14,6 @@ from src.app.core.exceptions import ValidationError
 from src.app.models.echo import Recipient
 from src.app.services.echo_service import EchoService
 
-pytestmark = pytest.mark.asyncio
-
 BUCKET = "echo-vault-media"
 REGION = "us-east-1"
 
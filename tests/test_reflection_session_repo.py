@@ -18,9 +18,6 @@ from src.app.repositories.reflection_session_repo import (
 )
 from tests._fakes.fake_dynamodb import FakeAioSession, FakeTable
 
-pytestmark = pytest.mark.asyncio
-
-
 TABLE_NAME = "mc_reflection_sessions-test"
 
 
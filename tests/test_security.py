@@ -2,21 +2,35 @@
 Test security features
 """
 
+import re
+
+import pytest
 from fastapi.testclient import TestClient
 
+# Built once at import: "x" * 100_000 is too long for the compiler to fold
+# into a constant, so spelling it inline re-allocates it on every run.
+_OVERSIZED_MESSAGE = "x" * 100_000
+
+# Traces leak as a "Traceback", a "stack trace" or a 'File "...", line N'
+# frame; one case-insensitive pass finds any of them.
+_STACK_TRACE_MARKERS = re.compile(r'traceback|stack trace|file "', re.IGNORECASE)
+
 
 def test_security_headers(client: TestClient):
     """Test that security headers are properly set"""
-    response = client.get("/health")
+    headers = client.get("/health").headers
 
     # Check required security headers
-    assert response.headers.get("X-Frame-Options") == "DENY"
-    assert response.headers.get("X-Content-Type-Options") == "nosniff"
-    assert response.headers.get("X-XSS-Protection") == "1; mode=block"
-    assert response.headers.get("Referrer-Policy") == "no-referrer"
-    assert "Strict-Transport-Security" in response.headers
-    assert "Content-Security-Policy" in response.headers
-    assert response.headers.get("X-API-Version") == "1.0.0"
+    expected = {
+        "x-frame-options": "DENY",
+        "x-content-type-options": "nosniff",
+        "x-xss-protection": "1; mode=block",
+        "referrer-policy": "no-referrer",
+        "x-api-version": "1.0.0",
+    }
+    assert {name: headers.get(name) for name in expected} == expected
+    assert "strict-transport-security" in headers
+    assert "content-security-policy" in headers
 
 
 def test_cors_headers(client: TestClient):
@@ -36,56 +50,59 @@ def test_cors_headers(client: TestClient):
     assert "Access-Control-Allow-Headers" in response.headers
 
 
-def test_sql_injection_protection(client: TestClient):
-    """Test protection against SQL injection attempts"""
-    malicious_payloads = [
-        "'; DROP TABLE users; --",
-        "1' OR '1'='1",
-        "admin'/*",
-        "1; DELETE FROM users WHERE 1=1 --",
-    ]
-
-    for payload in malicious_payloads:
-        # Test in query parameters
-        response = client.get(f"/health?param={payload}")
-        # Should not crash the application
-        assert response.status_code in [200, 422, 400]
-
-
-def test_xss_protection(client: TestClient):
-    """Test protection against XSS attempts"""
-    xss_payloads = [
-        "<script>alert('xss')</script>",
-        "javascript:alert('xss')",
-        "<img src=x onerror=alert('xss')>",
-        "';alert('xss');//",
-    ]
-
-    for payload in xss_payloads:
-        # Test in various endpoints
-        response = client.get(f"/health?param={payload}")
-        assert response.status_code in [200, 422, 400]
-
+_SQLI_PAYLOADS = [
+    "'; DROP TABLE users; --",
+    "1' OR '1'='1",
+    "admin'/*",
+    "1; DELETE FROM users WHERE 1=1 --",
+]
+_XSS_PAYLOADS = [
+    "<script>alert('xss')</script>",
+    "javascript:alert('xss')",
+    "<img src=x onerror=alert('xss')>",
+    "';alert('xss');//",
+]
+_INJECTION_PAYLOADS = [(p, "sqli") for p in _SQLI_PAYLOADS] + [
+    (p, "xss") for p in _XSS_PAYLOADS
+]
+
+
+@pytest.mark.parametrize(
+    "payload,kind",
+    _INJECTION_PAYLOADS,
+    ids=[f"{kind}-{i}" for i, (_, kind) in enumerate(_INJECTION_PAYLOADS)],
+)
+def test_injection_protection(client: TestClient, payload: str, kind: str):
+    """Test protection against SQL injection and XSS attempts"""
+    response = client.get(f"/health?param={payload}")
+    # Should not crash the application
+    assert response.status_code in [200, 422, 400]
+
+    if kind == "xss":
         # Ensure payload is not reflected in response
         assert payload not in response.text
 
 
-def test_input_validation_edge_cases(client: TestClient):
-    """Test input validation with edge cases"""
-    edge_cases = [
+@pytest.mark.parametrize(
+    "case",
+    [
         {"message": ""},  # Empty string
         {"message": None},  # Null value
-        {"message": "x" * 100000},  # Very long string
+        {"message": _OVERSIZED_MESSAGE},  # Very long string
         {"message": 123},  # Wrong type
         {"message": ["array"]},  # Array instead of string
         {"message": {"object": "value"}},  # Object instead of string
-    ]
-
-    for case in edge_cases:
-        response = client.post("/api/mirrorgpt/chat", json=case)
-        # Should return validation error or internal error, not crash
-        # Allow 200 for successful processing of some edge cases too
-        assert response.status_code in [200, 422, 400, 500]
+    ],
+    ids=["empty", "null", "oversized", "int", "array", "object"],
+)
+def test_input_validation_edge_cases(
+    client: TestClient, mock_mirror_orchestrator, case
+):
+    """Test input validation with edge cases"""
+    response = client.post("/api/mirrorgpt/chat", json=case)
+    # Should return validation error or internal error, not crash
+    # Allow 200 for successful processing of some edge cases too
+    assert response.status_code in [200, 422, 400, 500]
 
 
 def test_no_sensitive_data_in_logs(client: TestClient, caplog):
@@ -96,19 +113,15 @@ def test_no_sensitive_data_in_logs(client: TestClient, caplog):
     with caplog.at_level("DEBUG"):
         _ = client.post("/api/auth/login", json=sensitive_data)
 
-    # Check that password is not in logs
-    for record in caplog.records:
-        assert "secret123" not in record.getMessage()
+    # Check that password is not in logs (messages and any logged tracebacks)
+    assert "secret123" not in caplog.text
 
 
-def test_error_handling_no_stack_trace(client: TestClient):
+def test_error_handling_no_stack_trace(client: TestClient, mock_mirror_orchestrator):
     """Test that stack traces are not exposed in production"""
     # Try to trigger an error
     response = client.post("/api/mirrorgpt/chat", json={"message": "test"})
 
     # Even if there's an error, stack trace should not be exposed
     if response.status_code >= 500:
-        response_text = response.text.lower()
-        assert "traceback" not in response_text
-        assert "stack trace" not in response_text
-        assert 'file "' not in response_text
+        assert not _STACK_TRACE_MARKERS.search(response.text)
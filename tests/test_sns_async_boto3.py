@@ -9,7 +9,7 @@ giving FastAPI routes a non-blocking option.
 
 import asyncio
 import os
-import time
+import threading
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -52,7 +52,6 @@ def test_client_constructed_with_max_pool_connections():
     assert config.retries == {"max_attempts": 5, "mode": "adaptive"}  # type: ignore[attr-defined]
 
 
-@pytest.mark.asyncio
 async def test_publish_to_topic_async_delegates(sns_service_with_mock_client):
     """publish_to_topic_async must call publish on the underlying client."""
     service, mock_client = sns_service_with_mock_client
@@ -67,7 +66,6 @@ async def test_publish_to_topic_async_delegates(sns_service_with_mock_client):
     assert kwargs["MessageStructure"] == "json"
 
 
-@pytest.mark.asyncio
 async def test_create_platform_endpoint_async_delegates(sns_service_with_mock_client):
     service, mock_client = sns_service_with_mock_client
     mock_client.create_platform_endpoint.return_value = {"EndpointArn": "endpoint-1"}
@@ -82,13 +80,14 @@ async def test_create_platform_endpoint_async_delegates(sns_service_with_mock_cl
     assert kwargs["CustomUserData"] == "user-42"
 
 
-@pytest.mark.asyncio
 async def test_publish_to_endpoint_async_overlaps_concurrently(
     sns_service_with_mock_client,
 ):
     """5 concurrent async publishes must overlap (run on threadpool)."""
     service, mock_client = sns_service_with_mock_client
-    sleep_ms = 100
+    # Each publish blocks until all 5 are running; serialized calls would
+    # break the barrier on its timeout instead.
+    all_running = threading.Barrier(5, timeout=2)
 
     # The previous assertion `results == [f"endpoint-{i}" ...]` only passed
     # by coincidence: the mock returned {"MessageId": kwargs["TargetArn"]}
@@ -98,28 +97,23 @@ async def test_publish_to_endpoint_async_overlaps_concurrently(
     expected_msg_id = "test-msg-id"
 
     def slow_publish(**kwargs):
-        time.sleep(sleep_ms / 1000.0)
+        all_running.wait()
         return {"MessageId": expected_msg_id}
 
     mock_client.publish.side_effect = slow_publish
 
-    start = time.perf_counter()
     results = await asyncio.gather(
         *(
             service.publish_to_endpoint_async(f"endpoint-{i}", "T", "B")
             for i in range(5)
         )
     )
-    elapsed_ms = (time.perf_counter() - start) * 1000.0
 
     # All 5 calls succeed and return the mock's MessageId.
     assert len(results) == 5
     assert all(r == expected_msg_id for r in results)
     # And — the whole point of this test — they overlapped on the threadpool.
-    assert elapsed_ms < sleep_ms * 3, (
-        f"SNS async calls did not overlap: elapsed={elapsed_ms:.1f}ms "
-        f"(expected ~{sleep_ms}ms, serialized would be ~{5 * sleep_ms}ms)"
-    )
+    assert not all_running.broken, "SNS async calls did not overlap"
 
 
 def test_sync_publish_to_topic_still_works(sns_service_with_mock_client):
@@ -10,6 +10,7 @@ from src.app.models.soul_ping import SoulPing, SoulPingCategory
 from src.app.models.user_profile import UserProfile
 from src.app.services import soul_ping_service as sps
 from src.app.services.soul_ping_service import SoulPingService
+from tests._fakes.async_stubs import areturn
 
 
 def _profile(prefs=None) -> UserProfile:
@@ -86,48 +87,46 @@ def test_extract_json_returns_none_on_garbage():
 async def test_was_pinged_recently_true_within_window():
     db = AsyncMock()
     recent = (datetime.now(timezone.utc) - timedelta(minutes=30)).isoformat()
-    db.get_last_soul_ping = AsyncMock(return_value=_ping(recent))
+    db.get_last_soul_ping = areturn(_ping(recent))
     assert await _build(db=db).was_pinged_recently("u1") is True
 
 
 async def test_was_pinged_recently_false_outside_window():
     db = AsyncMock()
     old = (datetime.now(timezone.utc) - timedelta(minutes=90)).isoformat()
-    db.get_last_soul_ping = AsyncMock(return_value=_ping(old))
+    db.get_last_soul_ping = areturn(_ping(old))
     assert await _build(db=db).was_pinged_recently("u1") is False
 
 
 async def test_was_pinged_recently_false_when_none():
     db = AsyncMock()
-    db.get_last_soul_ping = AsyncMock(return_value=None)
+    db.get_last_soul_ping = areturn(None)
     assert await _build(db=db).was_pinged_recently("u1") is False
 
 
 # ---------------------------------------------------------------- orchestrate
 async def test_maybe_send_skips_when_disabled():
     db = AsyncMock()
-    db.get_user_profile = AsyncMock(
-        return_value=_profile({"soul_pings": {"enabled": False}})
-    )
+    db.get_user_profile = areturn(_profile({"soul_pings": {"enabled": False}}))
     result = await _build(db=db).maybe_send_for_user("u1")
     assert result.status == "skipped" and result.reason == "disabled"
 
 
 async def test_maybe_send_skips_when_throttled():
     db = AsyncMock()
-    db.get_user_profile = AsyncMock(return_value=_profile())
+    db.get_user_profile = areturn(_profile())
     recent = (datetime.now(timezone.utc) - timedelta(minutes=10)).isoformat()
-    db.get_last_soul_ping = AsyncMock(return_value=_ping(recent))
+    db.get_last_soul_ping = areturn(_ping(recent))
     result = await _build(db=db).maybe_send_for_user("u1")
     assert result.status == "skipped" and result.reason == "throttled"
 
 
 async def test_maybe_send_skips_no_content_when_no_conversation():
     db = AsyncMock()
-    db.get_user_profile = AsyncMock(return_value=_profile())
-    db.get_last_soul_ping = AsyncMock(return_value=None)
+    db.get_user_profile = areturn(_profile())
+    db.get_last_soul_ping = areturn(None)
     conv = AsyncMock()
-    conv.get_recent_conversations = AsyncMock(return_value=[])  # nothing to say
+    conv.get_recent_conversations = areturn([])  # nothing to say
     result = await _build(db=db, conv=conv).maybe_send_for_user("u1")
     assert result.status == "skipped" and result.reason == "no_content"
 
@@ -135,29 +134,25 @@ async def test_maybe_send_skips_no_content_when_no_conversation():
 async def test_maybe_send_force_bypasses_throttle():
     """force=True must still generate, but must NOT be blocked by the throttle."""
     db = AsyncMock()
-    db.get_user_profile = AsyncMock(return_value=_profile())
+    db.get_user_profile = areturn(_profile())
     recent = (datetime.now(timezone.utc) - timedelta(minutes=1)).isoformat()
-    db.get_last_soul_ping = AsyncMock(return_value=_ping(recent))  # would block
+    db.get_last_soul_ping = areturn(_ping(recent))  # would block
     conv = AsyncMock()
-    conv.get_recent_conversations = AsyncMock(
-        return_value=[]
-    )  # → no_content, not throttled
+    conv.get_recent_conversations = areturn([])  # → no_content, not throttled
     result = await _build(db=db, conv=conv).maybe_send_for_user("u1", force=True)
     assert result.reason == "no_content"  # reached generation, not "throttled"
 
 
 async def test_maybe_send_happy_path_generates_and_sends():
     db = AsyncMock()
-    db.get_user_profile = AsyncMock(return_value=_profile())
-    db.get_last_soul_ping = AsyncMock(return_value=None)
-    db.get_user_device_tokens = AsyncMock(
-        return_value=[{"endpoint_arn": "arn:1", "is_active": True}]
-    )
+    db.get_user_profile = areturn(_profile())
+    db.get_last_soul_ping = areturn(None)
+    db.get_user_device_tokens = areturn([{"endpoint_arn": "arn:1", "is_active": True}])
     db.save_soul_ping = AsyncMock(return_value=True)
 
     conv = AsyncMock()
-    conv.get_recent_conversations = AsyncMock(return_value=[_convo()])
-    conv.get_conversation_history = AsyncMock(return_value=[])
+    conv.get_recent_conversations = areturn([_convo()])
+    conv.get_conversation_history = areturn([])
 
     openai = AsyncMock()
     openai.send_with_overrides_async = AsyncMock(
@@ -180,8 +175,8 @@ async def test_maybe_send_happy_path_generates_and_sends():
 async def test_generate_falls_back_to_enabled_category_on_bad_llm_category():
     db = AsyncMock()
     conv = AsyncMock()
-    conv.get_recent_conversations = AsyncMock(return_value=[_convo()])
-    conv.get_conversation_history = AsyncMock(return_value=[])
+    conv.get_recent_conversations = areturn([_convo()])
+    conv.get_conversation_history = areturn([])
     openai = AsyncMock()
     # LLM returns a category the user hasn't enabled → fall back to first enabled.
     openai.send_with_overrides_async = AsyncMock(
@@ -195,7 +190,7 @@ async def test_generate_falls_back_to_enabled_category_on_bad_llm_category():
 
 async def test_send_and_record_skips_when_no_endpoints():
     db = AsyncMock()
-    db.get_user_device_tokens = AsyncMock(return_value=[])
+    db.get_user_device_tokens = areturn([])
     ping = SoulPing(
         user_id="u1", category=SoulPingCategory.EMOTIONAL, title="t", body="b"
     )
@@ -240,8 +235,8 @@ async def test_has_new_activity_true_when_conversation_newer():
     now = datetime.now(timezone.utc)
     last = _ping(_iso(now - timedelta(hours=2)))
     conv = AsyncMock()
-    conv.get_recent_conversations = AsyncMock(
-        return_value=[SimpleNamespace(last_message_at=_iso(now - timedelta(minutes=1)))]
+    conv.get_recent_conversations = areturn(
+        [SimpleNamespace(last_message_at=_iso(now - timedelta(minutes=1)))]
     )
     assert await _build(conv=conv)._has_new_activity_since("u1", last) is True
 
@@ -250,8 +245,8 @@ async def test_has_new_activity_false_when_conversation_older():
     now = datetime.now(timezone.utc)
     last = _ping(_iso(now))
     conv = AsyncMock()
-    conv.get_recent_conversations = AsyncMock(
-        return_value=[SimpleNamespace(last_message_at=_iso(now - timedelta(hours=1)))]
+    conv.get_recent_conversations = areturn(
+        [SimpleNamespace(last_message_at=_iso(now - timedelta(hours=1)))]
     )
     assert await _build(conv=conv)._has_new_activity_since("u1", last) is False
 
@@ -261,17 +256,13 @@ async def test_maybe_send_reengages_when_seen_and_no_new_activity():
     no LLM, and not a duplicate of the prior content."""
     now = datetime.now(timezone.utc)
     db = AsyncMock()
-    db.get_user_profile = AsyncMock(return_value=_profile())
-    db.get_last_soul_ping = AsyncMock(
-        return_value=_seen_ping(_iso(now - timedelta(hours=2)))
-    )
-    db.get_user_device_tokens = AsyncMock(
-        return_value=[{"endpoint_arn": "arn:1", "is_active": True}]
-    )
+    db.get_user_profile = areturn(_profile())
+    db.get_last_soul_ping = areturn(_seen_ping(_iso(now - timedelta(hours=2))))
+    db.get_user_device_tokens = areturn([{"endpoint_arn": "arn:1", "is_active": True}])
     db.save_soul_ping = AsyncMock(return_value=True)
     conv = AsyncMock()
-    conv.get_recent_conversations = AsyncMock(
-        return_value=[SimpleNamespace(last_message_at=_iso(now - timedelta(hours=5)))]
+    conv.get_recent_conversations = areturn(
+        [SimpleNamespace(last_message_at=_iso(now - timedelta(hours=5)))]
     )
     openai = AsyncMock()
     sns = AsyncMock()
@@ -295,17 +286,13 @@ async def test_maybe_send_reengages_when_unseen_and_no_new_activity():
     'seen'). No LLM; not a duplicate of the prior content."""
     now = datetime.now(timezone.utc)
     db = AsyncMock()
-    db.get_user_profile = AsyncMock(return_value=_profile())
-    db.get_last_soul_ping = AsyncMock(  # read_at is None → unseen
-        return_value=_ping(_iso(now - timedelta(hours=2)))
-    )
-    db.get_user_device_tokens = AsyncMock(
-        return_value=[{"endpoint_arn": "arn:1", "is_active": True}]
-    )
+    db.get_user_profile = areturn(_profile())
+    db.get_last_soul_ping = areturn(_ping(_iso(now - timedelta(hours=2))))
+    db.get_user_device_tokens = areturn([{"endpoint_arn": "arn:1", "is_active": True}])
     db.save_soul_ping = AsyncMock(return_value=True)
     conv = AsyncMock()
-    conv.get_recent_conversations = AsyncMock(
-        return_value=[SimpleNamespace(last_message_at=_iso(now - timedelta(hours=5)))]
+    conv.get_recent_conversations = areturn(
+        [SimpleNamespace(last_message_at=_iso(now - timedelta(hours=5)))]
     )
     openai = AsyncMock()
     sns = AsyncMock()
@@ -326,13 +313,9 @@ async def test_maybe_send_generates_content_when_new_activity():
     """New reflection since the last (seen) ping → fresh LLM content ping."""
     now = datetime.now(timezone.utc)
     db = AsyncMock()
-    db.get_user_profile = AsyncMock(return_value=_profile())
-    db.get_last_soul_ping = AsyncMock(
-        return_value=_seen_ping(_iso(now - timedelta(hours=2)))
-    )
-    db.get_user_device_tokens = AsyncMock(
-        return_value=[{"endpoint_arn": "arn:1", "is_active": True}]
-    )
+    db.get_user_profile = areturn(_profile())
+    db.get_last_soul_ping = areturn(_seen_ping(_iso(now - timedelta(hours=2))))
+    db.get_user_device_tokens = areturn([{"endpoint_arn": "arn:1", "is_active": True}])
     db.save_soul_ping = AsyncMock(return_value=True)
     fresh = SimpleNamespace(
         summary="Working through stress.",
@@ -342,8 +325,8 @@ async def test_maybe_send_generates_content_when_new_activity():
         last_message_at=_iso(now - timedelta(minutes=5)),  # newer than last ping
     )
     conv = AsyncMock()
-    conv.get_recent_conversations = AsyncMock(return_value=[fresh])
-    conv.get_conversation_history = AsyncMock(return_value=[])
+    conv.get_recent_conversations = areturn([fresh])
+    conv.get_conversation_history = areturn([])
     openai = AsyncMock()
     openai.send_with_overrides_async = AsyncMock(
         return_value='{"category":"emotional","title":"Hi","body":"You seem stressed."}'
@@ -390,18 +373,16 @@ def test_build_reengagement_ping_ignores_blank_reason():
 
 async def test_recent_nudge_reason_returns_reason_when_eligible():
     conv = AsyncMock()
-    conv.get_recent_conversations = AsyncMock(
-        return_value=[
-            SimpleNamespace(nudge_eligible=True, nudge_reason="pending decision")
-        ]
+    conv.get_recent_conversations = areturn(
+        [SimpleNamespace(nudge_eligible=True, nudge_reason="pending decision")]
     )
     assert await _build(conv=conv)._recent_nudge_reason("u1") == "pending decision"
 
 
 async def test_recent_nudge_reason_none_when_not_eligible():
     conv = AsyncMock()
-    conv.get_recent_conversations = AsyncMock(
-        return_value=[SimpleNamespace(nudge_eligible=False, nudge_reason="leftover")]
+    conv.get_recent_conversations = areturn(
+        [SimpleNamespace(nudge_eligible=False, nudge_reason="leftover")]
     )
     assert await _build(conv=conv)._recent_nudge_reason("u1") is None
 
@@ -411,13 +392,9 @@ async def test_maybe_send_reason_grounded_nudge_when_eligible():
     a reason-grounded Reflection Nudge (still no LLM)."""
     now = datetime.now(timezone.utc)
     db = AsyncMock()
-    db.get_user_profile = AsyncMock(return_value=_profile())
-    db.get_last_soul_ping = AsyncMock(
-        return_value=_ping(_iso(now - timedelta(hours=2)))
-    )
-    db.get_user_device_tokens = AsyncMock(
-        return_value=[{"endpoint_arn": "arn:1", "is_active": True}]
-    )
+    db.get_user_profile = areturn(_profile())
+    db.get_last_soul_ping = areturn(_ping(_iso(now - timedelta(hours=2))))
+    db.get_user_device_tokens = areturn([{"endpoint_arn": "arn:1", "is_active": True}])
     db.save_soul_ping = AsyncMock(return_value=True)
     convo = SimpleNamespace(
         last_message_at=_iso(now - timedelta(hours=5)),  # no new activity
@@ -425,7 +402,7 @@ async def test_maybe_send_reason_grounded_nudge_when_eligible():
         nudge_reason="A recurring decision conflict remains unresolved",
     )
     conv = AsyncMock()
-    conv.get_recent_conversations = AsyncMock(return_value=[convo])
+    conv.get_recent_conversations = areturn([convo])
     openai = AsyncMock()
     sns = AsyncMock()
     sns.publish_to_endpoint_async = AsyncMock(return_value="m")
@@ -446,13 +423,9 @@ async def test_maybe_send_still_sends_when_nudge_not_eligible():
     generic re-engagement still goes out so dormant users never go silent."""
     now = datetime.now(timezone.utc)
     db = AsyncMock()
-    db.get_user_profile = AsyncMock(return_value=_profile())
-    db.get_last_soul_ping = AsyncMock(
-        return_value=_ping(_iso(now - timedelta(hours=2)))
-    )
-    db.get_user_device_tokens = AsyncMock(
-        return_value=[{"endpoint_arn": "arn:1", "is_active": True}]
-    )
+    db.get_user_profile = areturn(_profile())
+    db.get_last_soul_ping = areturn(_ping(_iso(now - timedelta(hours=2))))
+    db.get_user_device_tokens = areturn([{"endpoint_arn": "arn:1", "is_active": True}])
     db.save_soul_ping = AsyncMock(return_value=True)
     convo = SimpleNamespace(
         last_message_at=_iso(now - timedelta(hours=5)),
@@ -460,7 +433,7 @@ async def test_maybe_send_still_sends_when_nudge_not_eligible():
         nudge_reason="",
     )
     conv = AsyncMock()
-    conv.get_recent_conversations = AsyncMock(return_value=[convo])
+    conv.get_recent_conversations = areturn([convo])
     sns = AsyncMock()
     sns.publish_to_endpoint_async = AsyncMock(return_value="m")
 
@@ -53,7 +53,6 @@ def test_s3_client_constructed_with_max_pool_connections():
     assert config.retries == {"max_attempts": 5, "mode": "adaptive"}  # type: ignore[attr-defined]
 
 
-@pytest.mark.asyncio
 async def test_calculate_user_storage_usage_iterates_in_threadpool(
     quota_service_with_mock_s3,
 ):
@@ -78,7 +77,6 @@ async def test_calculate_user_storage_usage_iterates_in_threadpool(
     )
 
 
-@pytest.mark.asyncio
 async def test_calculate_user_storage_usage_returns_zero_on_error(
     quota_service_with_mock_s3,
 ):
@@ -90,7 +88,6 @@ async def test_calculate_user_storage_usage_returns_zero_on_error(
     assert result == 0.0
 
 
-@pytest.mark.asyncio
 async def test_calculate_user_storage_usage_concurrent_overlaps(
     quota_service_with_mock_s3,
 ):
@@ -8,10 +8,7 @@ from DynamoDB without causing type errors when performing arithmetic operations.
 from decimal import Decimal
 from unittest.mock import AsyncMock, MagicMock, patch
 
-import pytest
 
-
-@pytest.mark.asyncio
 async def test_check_quota_handles_decimal_values():
     """Storage quota service should handle Decimal values from DynamoDB without type errors."""
     from src.app.models.user_profile import UserProfile
@@ -51,7 +48,6 @@ async def test_check_quota_handles_decimal_values():
     assert result["approaching_limit"] is False
 
 
-@pytest.mark.asyncio
 async def test_can_upload_handles_decimal_values():
     """can_upload should handle Decimal values without type errors."""
     from src.app.services.storage_quota_service import StorageQuotaService
@@ -82,7 +78,6 @@ async def test_can_upload_handles_decimal_values():
     assert "quota_status" in result
 
 
-@pytest.mark.asyncio
 async def test_can_upload_rejects_when_quota_exceeded_with_decimals():
     """can_upload should correctly reject uploads that would exceed quota with Decimal values."""
     from src.app.services.storage_quota_service import StorageQuotaService
@@ -113,7 +108,6 @@ async def test_can_upload_rejects_when_quota_exceeded_with_decimals():
     assert "quota" in result["message"].lower()
 
 
-@pytest.mark.asyncio
 async def test_check_quota_with_zero_quota():
     """Should handle zero quota gracefully without division by zero."""
     from src.app.models.user_profile import UserProfile
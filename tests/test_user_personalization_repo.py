@@ -8,9 +8,6 @@ from src.app.models.user_personalization import UserPersonalization
 from src.app.repositories.user_personalization_repo import UserPersonalizationRepo
 from tests._fakes.fake_dynamodb import FakeAioSession, FakeTable
 
-pytestmark = pytest.mark.asyncio
-
-
 TABLE_NAME = "mc_user_personalization-test"
 
 
@@ -51,7 +51,6 @@ def _ddb_resource_mock() -> tuple[AsyncMock, AsyncMock]:
 # ---------------------------------------------------------------------
 
 
-@pytest.mark.asyncio
 async def test_attach_poster_writes_canonical_url_after_HEAD():
     svc = EchoService()
     svc.s3_bucket = "mc-bucket"
@@ -81,7 +80,6 @@ async def test_attach_poster_writes_canonical_url_after_HEAD():
     table.put_item.assert_awaited_once()
 
 
-@pytest.mark.asyncio
 async def test_attach_poster_rejects_recipient_caller_as_notfound():
     """Recipients get NotFound to avoid info leakage on echo existence."""
     svc = EchoService()
@@ -95,7 +93,6 @@ async def test_attach_poster_rejects_recipient_caller_as_notfound():
             )
 
 
-@pytest.mark.asyncio
 async def test_attach_poster_rejects_when_no_media():
     """Poster attaches to existing media; calling early would orphan
     the poster on a media-less echo row.
@@ -111,7 +108,6 @@ async def test_attach_poster_rejects_when_no_media():
             )
 
 
-@pytest.mark.asyncio
 async def test_attach_poster_rejects_cross_tenant_key():
     svc = EchoService()
     echo = _make_echo()
@@ -124,7 +120,6 @@ async def test_attach_poster_rejects_cross_tenant_key():
             )
 
 
-@pytest.mark.asyncio
 async def test_attach_poster_rejects_when_object_missing():
     svc = EchoService()
     echo = _make_echo()
@@ -142,7 +137,6 @@ async def test_attach_poster_rejects_when_object_missing():
                 )
 
 
-@pytest.mark.asyncio
 async def test_attach_poster_maps_403_to_internal_without_leaking():
     """Access-denied must NOT confirm the object exists."""
     svc = EchoService()
@@ -164,7 +158,6 @@ async def test_attach_poster_maps_403_to_internal_without_leaking():
     assert "403" not in msg
 
 
-@pytest.mark.asyncio
 async def test_attach_poster_allows_overwrite():
     """Unlike media_url, poster_url isn't first-write — a retry that
     overwrites the same URL is a no-op user-visibly.
@@ -195,7 +188,6 @@ async def test_attach_poster_allows_overwrite():
 # ---------------------------------------------------------------------
 
 
-@pytest.mark.asyncio
 async def test_sign_media_url_also_signs_poster_url():
     svc = EchoService()
     echo = _make_echo(
@@ -220,7 +212,6 @@ async def test_sign_media_url_also_signs_poster_url():
     assert signed.poster_url == "https://signed.example/poster?sig=2"
 
 
-@pytest.mark.asyncio
 async def test_sign_media_url_handles_missing_poster_gracefully():
     """An echo without poster_url should sign media_url only, no error."""
     svc = EchoService()
@@ -240,7 +231,6 @@ async def test_sign_media_url_handles_missing_poster_gracefully():
 # ---------------------------------------------------------------------
 
 
-@pytest.mark.asyncio
 async def test_sign_poster_urls_for_echoes_signs_in_parallel():
     """Three echoes with posters → exactly 3 sign calls, all in parallel.
     Echoes without posters are skipped (no sign call).
@@ -275,13 +265,11 @@ async def test_sign_poster_urls_for_echoes_signs_in_parallel():
     assert echoes[3].poster_url is None
 
 
-@pytest.mark.asyncio
 async def test_sign_poster_urls_for_echoes_handles_empty_list():
     svc = EchoService()
     await svc._sign_poster_urls_for_echoes([])  # should not raise
 
 
-@pytest.mark.asyncio
 async def test_sign_poster_urls_for_echoes_keeps_original_on_failure():
     """A sign failure for one echo doesn't affect the others."""
     svc = EchoService()